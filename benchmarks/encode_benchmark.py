@@ -0,0 +1,235 @@
+# Бенчмарк скорости конвертации.
+#
+# Генерирует синтетические ролики через lavfi (testsrc2 + sine) и конвертирует каждый так же, как GUI
+# и консольный режим: через VideoConverter, с метаданными из кэша, планом потоков и записью во временный
+# файл. Результаты печатаются в JSON:
+#
+#   python -m benchmarks.encode_benchmark --ffmpeg ffmpeg --output bench.json
+#
+# Ролики одинаковы на любой машине, поэтому результаты разных запусков можно сравнивать.
+# По умолчанию проверяются только программные кодеки: без видеокарты NVENC и QSV завершаются
+# ошибкой за доли секунды. Их можно указать явно через --codecs.
+from contextlib import redirect_stdout
+from models.convert_job import ConvertJob, JobQueue
+from models.converter_core import VideoConverter
+from models.media_cache import media_cache
+from models.process_utils import hidden_window_kwargs
+from models.telemetry import telemetry
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
+
+try:
+    import resource  # Процессорное время дочерних процессов на POSIX
+except ImportError:
+    resource = None
+
+try:
+    import psutil  # Пиковая память дочерних процессов; на Windows и процессорное время
+except ImportError:
+    psutil = None
+
+UI_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "interface", "main_window.ui")
+DEFAULT_RESOLUTIONS = ["640x360", "1280x720", "1920x1080"]
+DEFAULT_DURATIONS = [5, 20]
+DEFAULT_PRESETS = ["ultrafast", "medium"]
+DEFAULT_CRFS = [28]
+CLIP_FPS = 30
+
+def ui_combo_items(name):
+    # Значения выпадающего списка из main_window.ui, чтобы бенчмарк проверял те же варианты, что доступны в GUI
+    root = ET.parse(UI_FILE).getroot()
+    for widget in root.iter("widget"):
+        if widget.get("name") == name:
+            return [item.findtext("property/string") for item in widget.findall("item")]
+    return []
+
+def generate_clip(ffmpeg_path, clips_dir, resolution, duration):
+    clip_path = os.path.join(clips_dir, f"clip_{resolution}_{duration}s.mp4")
+    if os.path.exists(clip_path):
+        return clip_path
+
+    command = [ffmpeg_path, '-v', 'error', '-y',
+               '-f', 'lavfi', '-i', f"testsrc2=size={resolution}:rate={CLIP_FPS}:duration={duration}",
+               '-f', 'lavfi', '-i', f"sine=frequency=1000:sample_rate=48000:duration={duration}",
+               '-c:v', 'libx264', '-preset', 'ultrafast', '-crf', '18', '-pix_fmt', 'yuv420p',
+               '-c:a', 'aac', '-shortest', clip_path]
+    subprocess.run(command, check=True, **hidden_window_kwargs())
+    return clip_path
+
+class ChildUsage:
+    # Процессорное время и пиковая память процессов (ffprobe, ffmpeg), которые конвертер запускает за время
+    # замера. На POSIX процессорное время - разница getrusage(RUSAGE_CHILDREN): конвертер всегда дожидается
+    # своих процессов, поэтому их время туда попадает. Память и время на Windows - опрос через psutil
+    POLL_INTERVAL = 0.1
+
+    def __init__(self):
+        self.cpu_seconds = None
+        self.peak_rss = None
+        self._cpu_by_pid = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._poll, daemon=True) if psutil is not None else None
+
+    def __enter__(self):
+        self._before = resource.getrusage(resource.RUSAGE_CHILDREN) if resource is not None else None
+        if self._thread is not None:
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+        if self._before is not None:
+            after = resource.getrusage(resource.RUSAGE_CHILDREN)
+            self.cpu_seconds = after.ru_utime + after.ru_stime - self._before.ru_utime - self._before.ru_stime
+            if self.peak_rss is None and after.ru_maxrss > self._before.ru_maxrss:
+                # ru_maxrss - максимум по всем дочерним процессам с запуска: подходит, только если вырос за замер.
+                # Килобайты на Linux, байты на macOS
+                self.peak_rss = after.ru_maxrss if sys.platform == "darwin" else after.ru_maxrss * 1024
+        elif self._cpu_by_pid:
+            self.cpu_seconds = sum(self._cpu_by_pid.values())
+        return False
+
+    def _poll(self):
+        current = psutil.Process()
+        while not self._stop.wait(self.POLL_INTERVAL):
+            try:
+                children = current.children(recursive=True)
+            except psutil.Error:
+                continue
+            for child in children:
+                try:
+                    times = child.cpu_times()
+                    memory = child.memory_info()
+                except psutil.Error:
+                    continue
+                self._cpu_by_pid[child.pid] = times.user + times.system
+                self.peak_rss = max(self.peak_rss or 0, getattr(memory, "peak_wset", memory.rss))
+
+def convert_measured(ffmpeg_path, job):
+    # Одна задача через VideoConverter. Сообщения конвертера уходят в stderr: stdout может быть занят JSON
+    telemetry.clear()
+    with redirect_stdout(sys.stderr), ChildUsage() as usage:
+        start = time.perf_counter()
+        ok = VideoConverter(ffmpeg_path, 1, preflight=False).run(JobQueue([job]))
+        wall = time.perf_counter() - start
+    jobs = telemetry.jobs()
+    return ok, wall, usage, jobs[-1] if jobs else {}
+
+def ffmpeg_version(ffmpeg_path):
+    try:
+        result = subprocess.run([ffmpeg_path, '-version'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                universal_newlines=True, **hidden_window_kwargs())
+        return result.stdout.splitlines()[0] if result.stdout else ""
+    except OSError:
+        return ""
+
+def run_benchmark(ffmpeg_path, work_dir, resolutions, durations, codecs, presets, crfs, repeat=1):
+    clips_dir = os.path.join(work_dir, "clips")
+    out_dir = os.path.join(work_dir, "out")
+    os.makedirs(clips_dir, exist_ok=True)
+    os.makedirs(out_dir, exist_ok=True)
+    cpu_count = os.cpu_count() or 1
+    # Метаданные роликов не должны попадать в общий кэш пользователя
+    media_cache.cache_file = os.path.join(work_dir, "media_cache.json")
+
+    results = []
+    for resolution in resolutions:
+        for duration in durations:
+            clip_path = generate_clip(ffmpeg_path, clips_dir, resolution, duration)
+            for codec in codecs:
+                for preset in presets:
+                    for crf in crfs:
+                        for run_index in range(repeat):
+                            output_file = os.path.join(out_dir, f"{codec}_{preset}_{crf}_{resolution}_{duration}s.mp4")
+                            job = ConvertJob(0, clip_path, output_file, codec, crf, preset, CLIP_FPS)
+                            ok, wall, usage, job_event = convert_measured(ffmpeg_path, job)
+                            cpu_seconds = usage.cpu_seconds
+                            # Неудачный запуск (например, кодек видеокарты, которой нет) заканчивается за доли секунды:
+                            # скорость по нему бессмысленна
+                            measured = ok and wall > 0
+
+                            result = {
+                                "resolution": resolution,
+                                "duration": duration,
+                                "codec": codec,
+                                "preset": preset,
+                                "crf": crf,
+                                "run": run_index,
+                                "ok": ok,
+                                "wall_seconds": round(wall, 3),
+                                "probe_seconds": _round(job_event.get("probe_time"), 3),
+                                "encode_seconds": _round(job_event.get("encode_time"), 3),
+                                "realtime_factor": round(duration / wall, 3) if measured else None,
+                                "files_per_hour": round(3600 / wall, 1) if measured else None,
+                                "cpu_seconds": _round(cpu_seconds, 3),
+                                # Доля всех ядер машины, занятая ffmpeg (1.0 - все ядра загружены полностью)
+                                "cpu_utilisation": round(cpu_seconds / wall / cpu_count, 3) if measured and cpu_seconds is not None else None,
+                                # Процессорные секунды на секунду видео почти не зависят от числа ядер
+                                "cpu_seconds_per_video_second": round(cpu_seconds / duration, 3) if measured and cpu_seconds is not None else None,
+                                "peak_rss_mb": round(usage.peak_rss / 1024 ** 2, 1) if usage.peak_rss else None,
+                                "output_bytes": os.path.getsize(output_file) if ok and os.path.exists(output_file) else None
+                            }
+                            results.append(result)
+                            speed = f"x{result['realtime_factor']}" if measured else "ошибка"
+                            print(f"{codec} {preset} crf={crf} {resolution} {duration}s: "
+                                  f"{result['wall_seconds']} s, {speed}", file=sys.stderr)
+
+    return {
+        "machine": {
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpu_count": cpu_count,
+            "ffmpeg": ffmpeg_version(ffmpeg_path)
+        },
+        "results": results
+    }
+
+def _round(value, digits):
+    return round(value, digits) if value is not None else None
+
+def parse_list(value, cast=str):
+    return [cast(item) for item in value.split(",") if item.strip()]
+
+def main(argv=None):
+    ui_codecs = ui_combo_items("list_codec")
+    ui_presets = ui_combo_items("list_ffmpeg_preset")
+
+    parser = argparse.ArgumentParser(description="Бенчмарк скорости конвертации uconvert")
+    parser.add_argument("--ffmpeg", default="ffmpeg", help="путь к ffmpeg")
+    parser.add_argument("--resolutions", default=",".join(DEFAULT_RESOLUTIONS))
+    parser.add_argument("--durations", default=",".join(map(str, DEFAULT_DURATIONS)), help="длительность роликов в секундах")
+    parser.add_argument("--codecs", default=",".join(codec for codec in ui_codecs if codec.startswith("lib")),
+                        help="по умолчанию - программные кодеки из интерфейса, 'all' - все, включая NVENC и QSV")
+    parser.add_argument("--presets", default=",".join(DEFAULT_PRESETS), help="'all' - все пресеты из интерфейса")
+    parser.add_argument("--crfs", default=",".join(map(str, DEFAULT_CRFS)))
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--work-dir", help="папка для роликов, по умолчанию временная")
+    parser.add_argument("--output", help="куда записать JSON, по умолчанию stdout")
+    args = parser.parse_args(argv)
+
+    presets = ui_presets if args.presets == "all" else parse_list(args.presets)
+    codecs = ui_codecs if args.codecs == "all" else parse_list(args.codecs)
+
+    with tempfile.TemporaryDirectory(prefix="uconvert_bench_") as temp_dir:
+        report = run_benchmark(args.ffmpeg, args.work_dir or temp_dir, parse_list(args.resolutions),
+                               parse_list(args.durations, int), codecs, presets,
+                               parse_list(args.crfs, int), args.repeat)
+
+    text = json.dumps(report, ensure_ascii=False, indent=4)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
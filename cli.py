@@ -0,0 +1,239 @@
+# Консольный режим без GUI: не импортирует PyQt5, поэтому подходит для серверов и cron.
+#
+#   python cli.py -o D:\out --codec libx265 --crf 28 --preset medium --template "[###]_[N]" files.txt
+#   python cli.py -o /srv/out --list - < list.txt
+#
+# Ссылки скачиваются через yt-dlp. С --convert-downloads каждый скачанный файл сразу конвертируется,
+# пока остальные еще скачиваются; исходники для конвертации тогда скачиваются в подпапку downloads,
+# чтобы не совпасть по имени с результатом. Локальные файлы конвертируются так же, как в GUI.
+# Пакет можно сохранить в файл задач и разделить между машинами:
+#
+#   python cli.py -o /srv/out --list list.txt --save-jobs batch.jsonl
+#   python cli.py --jobs-file batch.jsonl --shard 0/4      # на каждой из 4 машин свой номер
+#
+# Состояние задач пишется в журнал (по умолчанию .uconvert_journal.jsonl в папке результатов).
+# После сбоя тот же запуск с --resume пропустит файлы, которые уже готовы.
+# С --dedup файлы с тем же содержимым и параметрами и уже скачанные ссылки не обрабатываются повторно:
+# результат берется из индекса dedup_index.json жесткой ссылкой.
+# Первый Ctrl+C отменяет пакет: загрузки и процессы ffmpeg завершаются, недописанные файлы удаляются.
+from models.convert_job import build_jobs, ConvertJob, JobQueue
+from models.converter_core import VideoConverter
+from models.download_scheduler import conversion_download_dir, DownloadScheduler
+from models.job_journal import JobJournal, default_journal_path
+from models.media_cache import media_cache
+from models.naming import compile_template, is_url, normalize_input_path, ytdlp_filename_template
+from models.process_utils import sibling_tool_path
+from models.telemetry import telemetry
+from models.title_resolver import title_resolver
+import argparse
+import os
+import signal
+import sys
+import threading
+
+def read_input_lines(args):
+    # Пустые строки остаются: номер строки для шаблона считается по ним так же, как в окне GUI
+    lines = list(args.inputs)
+    if args.list:
+        if args.list == "-":
+            lines += sys.stdin.read().splitlines()
+        else:
+            with open(args.list, "r", encoding="utf-8") as f:
+                lines += f.read().splitlines()
+    return lines
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="uconvert: конвертация и загрузка видео без GUI")
+    parser.add_argument("inputs", nargs="*", help="файлы или ссылки")
+    parser.add_argument("--list", help="файл со списком путей и ссылок, по одному в строке ('-' - stdin)")
+    parser.add_argument("-o", "--output-dir", help="папка для результатов")
+    parser.add_argument("--template", default="[N]", help="шаблон имени: [N] - имя файла, [###] - номер строки, [P] - папка файла, "
+                             "[DATE] - дата изменения, [DUR] - длительность, [RES] - разрешение, [FPS] - частота кадров")
+    parser.add_argument("--codec", default="libx265")
+    parser.add_argument("--crf", type=int, default=28)
+    parser.add_argument("--preset", default="medium")
+    parser.add_argument("--fps", type=float, help="принудительный FPS, по умолчанию FPS исходного файла")
+    parser.add_argument("--fast-path", action="store_true",
+                        help="копировать потоки, которые уже в нужном кодеке и FPS, вместо перекодирования")
+    parser.add_argument("--jobs", type=int, default=max(1, (os.cpu_count() or 1) // 4), help="параллельных конвертаций")
+    parser.add_argument("--adaptive-jobs", action="store_true",
+                        help="подбирать число параллельных конвертаций по загрузке процессора, памяти и скорости ffmpeg; "
+                             "--jobs - верхний предел")
+    parser.add_argument("--min-jobs", type=int, default=1, help="нижний предел для --adaptive-jobs")
+    parser.add_argument("--segment-workers", type=int, default=0,
+                        help="кодировать длинные файлы (от 10 минут) по частям в указанное число процессов")
+    parser.add_argument("--convert-downloads", action="store_true",
+                        help="конвертировать скачанные видео, пока остальные ссылки еще скачиваются")
+    parser.add_argument("--downloads", type=int, default=4, help="параллельных загрузок")
+    parser.add_argument("--downloads-per-host", type=int,
+                        help="параллельных загрузок с одного сайта, по умолчанию как --downloads")
+    parser.add_argument("--ffmpeg", default="ffmpeg", help="путь к ffmpeg")
+    parser.add_argument("--ytdlp", default="yt-dlp", help="путь к yt-dlp")
+    parser.add_argument("--proxy", help="прокси для yt-dlp")
+    parser.add_argument("--save-jobs", help="только сохранить задачи конвертации в файл, не запуская их")
+    parser.add_argument("--jobs-file", help="выполнить задачи из файла, сохраненного через --save-jobs")
+    parser.add_argument("--shard", help="выполнить только часть задач: НОМЕР/ВСЕГО, например 0/4")
+    parser.add_argument("--journal", help="файл журнала задач, по умолчанию в папке результатов")
+    parser.add_argument("--resume", action="store_true", help="пропустить задачи, которые по журналу уже выполнены")
+    parser.add_argument("--no-preflight", action="store_true",
+                        help="не проверять входные файлы, имена результатов и место на диске перед запуском")
+    parser.add_argument("--dedup", action="store_true",
+                        help="не конвертировать и не скачивать повторы заново, а брать готовые результаты из индекса дубликатов")
+    parser.add_argument("--telemetry", help="сохранить тайминги задач в файл: .jsonl - JSON lines, иначе Chrome trace")
+    parser.add_argument("-v", "--verbose", action="store_true", help="показывать статус каждой задачи")
+    return parser.parse_args(argv)
+
+def log(message):
+    print(message, file=sys.stderr, flush=True)
+
+def parse_shard(value):
+    shard_index, _, shard_count = value.partition("/")
+    shard_index, shard_count = int(shard_index), int(shard_count)
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(value)
+    return shard_index, shard_count
+
+def start_downloads(args, urls, url_indexes, job_queue):
+    # Загрузки идут в отдельном потоке; каждый скачанный файл сразу ставится в очередь конвертации,
+    # поэтому сеть и процессор работают одновременно. Когда загрузки закончатся, очередь закрывается.
+    # Возвращает (поток, результат, планировщик): через планировщик загрузки отменяются
+    result = {"ok": True}
+
+    def on_finished(index, url, ok, file_path):
+        if ok and file_path and args.convert_downloads:
+            output_name = os.path.splitext(os.path.basename(file_path))[0] + ".mp4"
+            try:
+                job_queue.put(ConvertJob(url_indexes[url], file_path, os.path.join(args.output_dir, output_name),
+                                         args.codec, args.crf, args.preset, args.fps, args.fast_path))
+            except RuntimeError:
+                pass  # Очередь закрыта: пакет отменен, скачанный файл не конвертируется
+
+    scheduler = DownloadScheduler(args.ytdlp, args.downloads, args.downloads_per_host, proxy=args.proxy,
+                                  on_status=lambda index, message: log(message),
+                                  on_finished=on_finished, dedup=args.dedup)
+
+    def run():
+        try:
+            titles = title_resolver.resolve_many(urls, args.ytdlp, args.proxy)
+            filename_templates = {url: ytdlp_filename_template(title) for url, title in titles.items()}
+            download_dir = conversion_download_dir(args.output_dir) if args.convert_downloads else args.output_dir
+            completed = scheduler.run(urls, download_dir, filename_templates)
+            result["ok"] = len(completed) == len(urls)
+        finally:
+            job_queue.close()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread, result, scheduler
+
+def run_cancellable(run, cancel):
+    # Первый Ctrl+C вызывает cancel(): конвертации и загрузки отменяются, потоки удаляют недописанные файлы.
+    # Второй Ctrl+C прерывает программу
+    def on_interrupt(signum, frame):
+        log("Отмена пакета...")
+        signal.signal(signal.SIGINT, previous_handler)
+        cancel()
+
+    previous_handler = signal.signal(signal.SIGINT, on_interrupt)
+    try:
+        return run()
+    finally:
+        signal.signal(signal.SIGINT, previous_handler)
+
+def main(argv=None):
+    args = parse_args(argv)
+    url_indexes = {}
+
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError:
+            log(f"Неверный формат --shard: {args.shard}")
+            return 2
+
+    if args.jobs_file:
+        jobs = JobQueue.load(args.jobs_file).jobs()
+    else:
+        lines = read_input_lines(args)
+        if not any(line.strip() for line in lines) or not args.output_dir:
+            log("Нужны входные файлы или ссылки и папка для результатов (-o).")
+            return 2
+
+        os.makedirs(args.output_dir, exist_ok=True)
+
+        # Номер для шаблона - номер строки во входном списке, как в среднем окне GUI.
+        # Шаблон разбирается один раз; ffprobe запускается, только если в шаблоне есть метаданные
+        name_template = compile_template(args.template)
+        ffprobe_path = sibling_tool_path(args.ffmpeg, "ffprobe")
+        # Номер задачи - тоже номер строки, и у файлов, и у ссылок: по нему работают пауза и отмена задачи,
+        # прогресс и --shard, поэтому номера не должны совпадать
+        input_files = []
+        output_names = []
+        indexes = []
+        for index, line in enumerate(lines):
+            if not line.strip():
+                continue
+            if is_url(line.strip()):
+                url_indexes.setdefault(line.strip(), index)
+                continue
+            indexes.append(index)
+            input_files.append(normalize_input_path(line))
+            output_names.append(name_template.render(index, normalize_input_path(line),
+                                                     lambda path: media_cache.probe(path, ffprobe_path)))
+
+        jobs = build_jobs(input_files, output_names, args.output_dir,
+                          args.codec, args.crf, args.preset, args.fps, args.fast_path, indexes)
+
+    if args.save_jobs:
+        JobQueue(jobs).save(args.save_jobs)
+        log(f"Сохранено задач: {len(jobs)} -> {args.save_jobs}")
+        return 0
+
+    if shard:
+        # Ссылки делятся между машинами по тому же правилу, что и задачи: по номеру строки
+        jobs = JobQueue(jobs).shard(*shard).jobs()
+        url_indexes = {url: index for url, index in url_indexes.items() if index % shard[1] == shard[0]}
+
+    urls = list(url_indexes)
+    job_queue = JobQueue(jobs, closed=not (urls and args.convert_downloads))
+    converter = None
+    if jobs or (urls and args.convert_downloads):
+        journal_path = args.journal
+        if not journal_path:
+            # Для файла задач папку результатов берем из первой задачи
+            output_dir = args.output_dir or os.path.dirname(jobs[0].output_file)
+            journal_path = default_journal_path(output_dir)
+        converter = VideoConverter(args.ffmpeg, args.jobs,
+                                   on_status=log,
+                                   on_job_status=(lambda index, message: log(message)) if args.verbose else None,
+                                   journal=JobJournal(journal_path), resume=args.resume,
+                                   segment_workers=args.segment_workers, preflight=not args.no_preflight,
+                                   min_jobs=min(args.min_jobs, args.jobs) if args.adaptive_jobs else None,
+                                   dedup=args.dedup)
+    downloads = start_downloads(args, urls, url_indexes, job_queue) if urls else None
+
+    def run():
+        ok = converter.run(job_queue) if converter is not None else True
+        if downloads:
+            thread, result, _ = downloads
+            thread.join()
+            ok = result["ok"] and ok
+        return ok
+
+    def cancel():
+        if downloads:
+            downloads[2].cancel()
+        if converter is not None:
+            converter.cancel_jobs()
+
+    ok = run_cancellable(run, cancel)
+
+    if args.telemetry:
+        telemetry.export(args.telemetry)
+        log(f"{telemetry.summary()} -> {args.telemetry}")
+
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,31 @@
+# Компилирует main_window.ui в main_window_ui.py. Запускать после каждого изменения .ui:
+#
+#   python interface/build_ui.py
+#
+# Если забыть, окно все равно откроется: хэш .ui не совпадет, и интерфейс загрузится из .ui
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from interface.ui_loader import ui_source_hash
+from PyQt5.uic import compileUi
+
+def main():
+    interface_dir = os.path.dirname(os.path.abspath(__file__))
+    ui_path = os.path.join(interface_dir, "main_window.ui")
+    py_path = os.path.join(interface_dir, "main_window_ui.py")
+
+    # Путь к .ui относительный, чтобы в сгенерированный файл не попал путь с этой машины
+    os.chdir(os.path.dirname(interface_dir))
+    code = io.StringIO()
+    compileUi(os.path.join("interface", "main_window.ui"), code)
+
+    with open(py_path, "w", encoding="utf-8", newline="\n") as f:
+        f.write(code.getvalue())
+        f.write(f'\nUI_SOURCE_SHA1 = "{ui_source_hash(ui_path)}"\n')
+    print(f"{ui_path} -> {py_path}")
+
+if __name__ == "__main__":
+    main()
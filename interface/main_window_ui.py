@@ -0,0 +1,854 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'interface/main_window.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(927, 508)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("interface/../icon/logo_black.ico"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        MainWindow.setWindowIcon(icon)
+        MainWindow.setDockOptions(QtWidgets.QMainWindow.AllowTabbedDocks|QtWidgets.QMainWindow.AnimatedDocks)
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setObjectName("centralwidget")
+        self.gridLayout = QtWidgets.QGridLayout(self.centralwidget)
+        self.gridLayout.setContentsMargins(-1, 9, -1, -1)
+        self.gridLayout.setObjectName("gridLayout")
+        self.tabWidget = QtWidgets.QTabWidget(self.centralwidget)
+        self.tabWidget.setAcceptDrops(False)
+        self.tabWidget.setTabPosition(QtWidgets.QTabWidget.North)
+        self.tabWidget.setTabShape(QtWidgets.QTabWidget.Rounded)
+        self.tabWidget.setUsesScrollButtons(True)
+        self.tabWidget.setObjectName("tabWidget")
+        self.tab_convert = QtWidgets.QWidget()
+        self.tab_convert.setObjectName("tab_convert")
+        self.gridLayout_2 = QtWidgets.QGridLayout(self.tab_convert)
+        self.gridLayout_2.setObjectName("gridLayout_2")
+        self.gridLayout_4 = QtWidgets.QGridLayout()
+        self.gridLayout_4.setSpacing(6)
+        self.gridLayout_4.setObjectName("gridLayout_4")
+        self.list_codec = QtWidgets.QComboBox(self.tab_convert)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.list_codec.sizePolicy().hasHeightForWidth())
+        self.list_codec.setSizePolicy(sizePolicy)
+        self.list_codec.setMinimumSize(QtCore.QSize(63, 22))
+        self.list_codec.setMaximumSize(QtCore.QSize(63, 22))
+        self.list_codec.setAcceptDrops(False)
+        self.list_codec.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.list_codec.setObjectName("list_codec")
+        self.list_codec.addItem("")
+        self.list_codec.addItem("")
+        self.list_codec.addItem("")
+        self.list_codec.addItem("")
+        self.list_codec.addItem("")
+        self.list_codec.addItem("")
+        self.gridLayout_4.addWidget(self.list_codec, 4, 1, 1, 1)
+        self.fpsCount = QtWidgets.QSpinBox(self.tab_convert)
+        self.fpsCount.setEnabled(False)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.fpsCount.sizePolicy().hasHeightForWidth())
+        self.fpsCount.setSizePolicy(sizePolicy)
+        self.fpsCount.setMinimumSize(QtCore.QSize(49, 22))
+        self.fpsCount.setMaximumSize(QtCore.QSize(49, 22))
+        self.fpsCount.setAlignment(QtCore.Qt.AlignCenter)
+        self.fpsCount.setMaximum(1000)
+        self.fpsCount.setProperty("value", 30)
+        self.fpsCount.setObjectName("fpsCount")
+        self.gridLayout_4.addWidget(self.fpsCount, 4, 7, 1, 1)
+        self.fpsEnable = QtWidgets.QCheckBox(self.tab_convert)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.fpsEnable.sizePolicy().hasHeightForWidth())
+        self.fpsEnable.setSizePolicy(sizePolicy)
+        self.fpsEnable.setMinimumSize(QtCore.QSize(16, 16))
+        self.fpsEnable.setMaximumSize(QtCore.QSize(16, 16))
+        self.fpsEnable.setText("")
+        self.fpsEnable.setObjectName("fpsEnable")
+        self.gridLayout_4.addWidget(self.fpsEnable, 4, 6, 1, 1)
+        spacerItem = QtWidgets.QSpacerItem(13, 20, QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_4.addItem(spacerItem, 4, 2, 1, 1)
+        self.list_ffmpeg_preset = QtWidgets.QComboBox(self.tab_convert)
+        self.list_ffmpeg_preset.setMinimumSize(QtCore.QSize(72, 22))
+        self.list_ffmpeg_preset.setMaximumSize(QtCore.QSize(72, 22))
+        self.list_ffmpeg_preset.setAcceptDrops(False)
+        self.list_ffmpeg_preset.setAutoFillBackground(False)
+        self.list_ffmpeg_preset.setEditable(False)
+        self.list_ffmpeg_preset.setObjectName("list_ffmpeg_preset")
+        self.list_ffmpeg_preset.addItem("")
+        self.list_ffmpeg_preset.addItem("")
+        self.list_ffmpeg_preset.addItem("")
+        self.list_ffmpeg_preset.addItem("")
+        self.list_ffmpeg_preset.addItem("")
+        self.list_ffmpeg_preset.addItem("")
+        self.list_ffmpeg_preset.addItem("")
+        self.list_ffmpeg_preset.addItem("")
+        self.list_ffmpeg_preset.addItem("")
+        self.list_ffmpeg_preset.addItem("")
+        self.gridLayout_4.addWidget(self.list_ffmpeg_preset, 4, 8, 1, 1)
+        self.label_crf = QtWidgets.QLabel(self.tab_convert)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_crf.sizePolicy().hasHeightForWidth())
+        self.label_crf.setSizePolicy(sizePolicy)
+        self.label_crf.setMinimumSize(QtCore.QSize(23, 22))
+        self.label_crf.setMaximumSize(QtCore.QSize(23, 22))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_crf.setFont(font)
+        self.label_crf.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.label_crf.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.label_crf.setTextFormat(QtCore.Qt.AutoText)
+        self.label_crf.setScaledContents(False)
+        self.label_crf.setWordWrap(False)
+        self.label_crf.setOpenExternalLinks(False)
+        self.label_crf.setObjectName("label_crf")
+        self.gridLayout_4.addWidget(self.label_crf, 4, 3, 1, 1)
+        spacerItem1 = QtWidgets.QSpacerItem(30, 20, QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_4.addItem(spacerItem1, 4, 9, 1, 1)
+        self.crfCount = QtWidgets.QSpinBox(self.tab_convert)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.crfCount.sizePolicy().hasHeightForWidth())
+        self.crfCount.setSizePolicy(sizePolicy)
+        self.crfCount.setMinimumSize(QtCore.QSize(49, 22))
+        self.crfCount.setMaximumSize(QtCore.QSize(49, 22))
+        self.crfCount.setAlignment(QtCore.Qt.AlignCenter)
+        self.crfCount.setMaximum(1000)
+        self.crfCount.setProperty("value", 28)
+        self.crfCount.setObjectName("crfCount")
+        self.gridLayout_4.addWidget(self.crfCount, 4, 4, 1, 1)
+        spacerItem2 = QtWidgets.QSpacerItem(52, 20, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
+        self.gridLayout_4.addItem(spacerItem2, 4, 12, 1, 1)
+        self.btn_path_save = QtWidgets.QToolButton(self.tab_convert)
+        self.btn_path_save.setMinimumSize(QtCore.QSize(25, 22))
+        self.btn_path_save.setMaximumSize(QtCore.QSize(25, 22))
+        self.btn_path_save.setObjectName("btn_path_save")
+        self.gridLayout_4.addWidget(self.btn_path_save, 4, 11, 1, 1)
+        self.label_fps = QtWidgets.QLabel(self.tab_convert)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.label_fps.sizePolicy().hasHeightForWidth())
+        self.label_fps.setSizePolicy(sizePolicy)
+        self.label_fps.setMinimumSize(QtCore.QSize(22, 22))
+        self.label_fps.setMaximumSize(QtCore.QSize(22, 22))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_fps.setFont(font)
+        self.label_fps.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.label_fps.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.label_fps.setTextFormat(QtCore.Qt.AutoText)
+        self.label_fps.setScaledContents(False)
+        self.label_fps.setWordWrap(False)
+        self.label_fps.setOpenExternalLinks(False)
+        self.label_fps.setObjectName("label_fps")
+        self.gridLayout_4.addWidget(self.label_fps, 4, 5, 1, 1)
+        self.current_fileName = QtWidgets.QComboBox(self.tab_convert)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.current_fileName.sizePolicy().hasHeightForWidth())
+        self.current_fileName.setSizePolicy(sizePolicy)
+        self.current_fileName.setMinimumSize(QtCore.QSize(60, 22))
+        self.current_fileName.setMaximumSize(QtCore.QSize(224, 22))
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        self.current_fileName.setFont(font)
+        self.current_fileName.setEditable(True)
+        self.current_fileName.setObjectName("current_fileName")
+        self.current_fileName.addItem("")
+        self.current_fileName.setItemText(0, "[N]")
+        self.gridLayout_4.addWidget(self.current_fileName, 4, 0, 1, 1)
+        self.path_save = QtWidgets.QLineEdit(self.tab_convert)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(1)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.path_save.sizePolicy().hasHeightForWidth())
+        self.path_save.setSizePolicy(sizePolicy)
+        self.path_save.setMinimumSize(QtCore.QSize(60, 22))
+        self.path_save.setMaximumSize(QtCore.QSize(593, 22))
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        self.path_save.setFont(font)
+        self.path_save.setStyleSheet("")
+        self.path_save.setText("")
+        self.path_save.setObjectName("path_save")
+        self.gridLayout_4.addWidget(self.path_save, 4, 10, 1, 1)
+        self.gridLayout_2.addLayout(self.gridLayout_4, 0, 0, 1, 2)
+        self.gridLayout_6 = QtWidgets.QGridLayout()
+        self.gridLayout_6.setContentsMargins(-1, 0, -1, -1)
+        self.gridLayout_6.setHorizontalSpacing(4)
+        self.gridLayout_6.setVerticalSpacing(6)
+        self.gridLayout_6.setObjectName("gridLayout_6")
+        self.progressBar_download = QtWidgets.QProgressBar(self.tab_convert)
+        self.progressBar_download.setMaximumSize(QtCore.QSize(16777215, 22))
+        self.progressBar_download.setProperty("value", 0)
+        self.progressBar_download.setAlignment(QtCore.Qt.AlignCenter)
+        self.progressBar_download.setObjectName("progressBar_download")
+        self.gridLayout_6.addWidget(self.progressBar_download, 1, 1, 1, 1)
+        self.progressBar_translate = QtWidgets.QProgressBar(self.tab_convert)
+        self.progressBar_translate.setMaximumSize(QtCore.QSize(16777215, 22))
+        self.progressBar_translate.setProperty("value", 0)
+        self.progressBar_translate.setAlignment(QtCore.Qt.AlignCenter)
+        self.progressBar_translate.setObjectName("progressBar_translate")
+        self.gridLayout_6.addWidget(self.progressBar_translate, 1, 0, 1, 1)
+        self.gridLayout_8 = QtWidgets.QGridLayout()
+        self.gridLayout_8.setContentsMargins(-1, 0, -1, -1)
+        self.gridLayout_8.setHorizontalSpacing(4)
+        self.gridLayout_8.setObjectName("gridLayout_8")
+        self.progressBar_convert = QtWidgets.QProgressBar(self.tab_convert)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.progressBar_convert.sizePolicy().hasHeightForWidth())
+        self.progressBar_convert.setSizePolicy(sizePolicy)
+        self.progressBar_convert.setMaximumSize(QtCore.QSize(16777215, 22))
+        font = QtGui.QFont()
+        font.setBold(False)
+        font.setItalic(False)
+        font.setUnderline(False)
+        font.setWeight(50)
+        font.setStrikeOut(False)
+        font.setKerning(True)
+        self.progressBar_convert.setFont(font)
+        self.progressBar_convert.setContextMenuPolicy(QtCore.Qt.DefaultContextMenu)
+        self.progressBar_convert.setAccessibleDescription("")
+        self.progressBar_convert.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.progressBar_convert.setAutoFillBackground(False)
+        self.progressBar_convert.setProperty("value", 0)
+        self.progressBar_convert.setAlignment(QtCore.Qt.AlignCenter)
+        self.progressBar_convert.setTextVisible(True)
+        self.progressBar_convert.setObjectName("progressBar_convert")
+        self.gridLayout_8.addWidget(self.progressBar_convert, 0, 0, 1, 1)
+        self.btn_start = QtWidgets.QPushButton(self.tab_convert)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.btn_start.sizePolicy().hasHeightForWidth())
+        self.btn_start.setSizePolicy(sizePolicy)
+        self.btn_start.setMinimumSize(QtCore.QSize(74, 22))
+        self.btn_start.setMaximumSize(QtCore.QSize(74, 22))
+        self.btn_start.setObjectName("btn_start")
+        self.gridLayout_8.addWidget(self.btn_start, 0, 1, 1, 1)
+        self.btn_pause = QtWidgets.QPushButton(self.tab_convert)
+        self.btn_pause.setEnabled(False)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.btn_pause.sizePolicy().hasHeightForWidth())
+        self.btn_pause.setSizePolicy(sizePolicy)
+        self.btn_pause.setMinimumSize(QtCore.QSize(74, 22))
+        self.btn_pause.setMaximumSize(QtCore.QSize(74, 22))
+        self.btn_pause.setObjectName("btn_pause")
+        self.gridLayout_8.addWidget(self.btn_pause, 0, 2, 1, 1)
+        self.btn_stop = QtWidgets.QPushButton(self.tab_convert)
+        self.btn_stop.setEnabled(False)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.btn_stop.sizePolicy().hasHeightForWidth())
+        self.btn_stop.setSizePolicy(sizePolicy)
+        self.btn_stop.setMinimumSize(QtCore.QSize(74, 22))
+        self.btn_stop.setMaximumSize(QtCore.QSize(74, 22))
+        self.btn_stop.setObjectName("btn_stop")
+        self.gridLayout_8.addWidget(self.btn_stop, 0, 3, 1, 1)
+        self.gridLayout_6.addLayout(self.gridLayout_8, 1, 2, 1, 1)
+        self.gridLayout_2.addLayout(self.gridLayout_6, 3, 0, 1, 2)
+        self.frameFind = QtWidgets.QFrame(self.tab_convert)
+        self.frameFind.setEnabled(True)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.frameFind.sizePolicy().hasHeightForWidth())
+        self.frameFind.setSizePolicy(sizePolicy)
+        self.frameFind.setMaximumSize(QtCore.QSize(16777215, 56))
+        self.frameFind.setStyleSheet("")
+        self.frameFind.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.frameFind.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.frameFind.setObjectName("frameFind")
+        self.gridLayout_5 = QtWidgets.QGridLayout(self.frameFind)
+        self.gridLayout_5.setContentsMargins(0, 0, 0, 0)
+        self.gridLayout_5.setHorizontalSpacing(4)
+        self.gridLayout_5.setVerticalSpacing(0)
+        self.gridLayout_5.setObjectName("gridLayout_5")
+        self.comboBoxReplace = QtWidgets.QComboBox(self.frameFind)
+        self.comboBoxReplace.setMinimumSize(QtCore.QSize(64, 22))
+        self.comboBoxReplace.setMaximumSize(QtCore.QSize(16777215, 22))
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        self.comboBoxReplace.setFont(font)
+        self.comboBoxReplace.setStyleSheet("")
+        self.comboBoxReplace.setEditable(True)
+        self.comboBoxReplace.setObjectName("comboBoxReplace")
+        self.gridLayout_5.addWidget(self.comboBoxReplace, 1, 0, 1, 1)
+        self.btn_find = QtWidgets.QPushButton(self.frameFind)
+        self.btn_find.setMinimumSize(QtCore.QSize(64, 22))
+        self.btn_find.setMaximumSize(QtCore.QSize(64, 22))
+        self.btn_find.setObjectName("btn_find")
+        self.gridLayout_5.addWidget(self.btn_find, 0, 1, 1, 1)
+        self.btn_find_all = QtWidgets.QPushButton(self.frameFind)
+        self.btn_find_all.setMinimumSize(QtCore.QSize(64, 22))
+        self.btn_find_all.setMaximumSize(QtCore.QSize(64, 22))
+        self.btn_find_all.setObjectName("btn_find_all")
+        self.gridLayout_5.addWidget(self.btn_find_all, 0, 2, 1, 1)
+        self.btn_replace = QtWidgets.QPushButton(self.frameFind)
+        self.btn_replace.setMinimumSize(QtCore.QSize(64, 22))
+        self.btn_replace.setMaximumSize(QtCore.QSize(64, 22))
+        self.btn_replace.setObjectName("btn_replace")
+        self.gridLayout_5.addWidget(self.btn_replace, 1, 1, 1, 1)
+        self.btn_replace_all = QtWidgets.QPushButton(self.frameFind)
+        self.btn_replace_all.setMinimumSize(QtCore.QSize(64, 22))
+        self.btn_replace_all.setMaximumSize(QtCore.QSize(64, 22))
+        self.btn_replace_all.setObjectName("btn_replace_all")
+        self.gridLayout_5.addWidget(self.btn_replace_all, 1, 2, 1, 1)
+        self.checkBox_regex = QtWidgets.QCheckBox(self.frameFind)
+        self.checkBox_regex.setMinimumSize(QtCore.QSize(0, 22))
+        self.checkBox_regex.setObjectName("checkBox_regex")
+        self.gridLayout_5.addWidget(self.checkBox_regex, 0, 3, 1, 1)
+        self.comboBoxFind = QtWidgets.QComboBox(self.frameFind)
+        self.comboBoxFind.setMinimumSize(QtCore.QSize(64, 22))
+        self.comboBoxFind.setMaximumSize(QtCore.QSize(16777215, 22))
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        self.comboBoxFind.setFont(font)
+        self.comboBoxFind.setStatusTip("")
+        self.comboBoxFind.setStyleSheet("")
+        self.comboBoxFind.setEditable(True)
+        self.comboBoxFind.setObjectName("comboBoxFind")
+        self.gridLayout_5.addWidget(self.comboBoxFind, 0, 0, 1, 1)
+        self.gridLayout_2.addWidget(self.frameFind, 2, 0, 1, 2)
+        self.splitter = QtWidgets.QSplitter(self.tab_convert)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Expanding)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.splitter.sizePolicy().hasHeightForWidth())
+        self.splitter.setSizePolicy(sizePolicy)
+        self.splitter.setOrientation(QtCore.Qt.Horizontal)
+        self.splitter.setObjectName("splitter")
+        self.textEdit1 = NumberedTextEdit(self.splitter)
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        self.textEdit1.setFont(font)
+        self.textEdit1.setStyleSheet("")
+        self.textEdit1.setObjectName("textEdit1")
+        self.textEdit2 = NumberedTextEdit(self.splitter)
+        self.textEdit2.setEnabled(True)
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        self.textEdit2.setFont(font)
+        self.textEdit2.setStyleSheet("")
+        self.textEdit2.setObjectName("textEdit2")
+        self.textEdit3 = NumberedListView(self.splitter)
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        self.textEdit3.setFont(font)
+        self.textEdit3.setStyleSheet("")
+        self.textEdit3.setObjectName("textEdit3")
+        self.gridLayout_2.addWidget(self.splitter, 1, 0, 1, 2)
+        self.tabWidget.addTab(self.tab_convert, "")
+        self.tab_options = QtWidgets.QWidget()
+        self.tab_options.setObjectName("tab_options")
+        self.label_savePos = QtWidgets.QLabel(self.tab_options)
+        self.label_savePos.setGeometry(QtCore.QRect(84, 99, 149, 16))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_savePos.setFont(font)
+        self.label_savePos.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.label_savePos.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.label_savePos.setTextFormat(QtCore.Qt.AutoText)
+        self.label_savePos.setScaledContents(False)
+        self.label_savePos.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_savePos.setWordWrap(False)
+        self.label_savePos.setOpenExternalLinks(False)
+        self.label_savePos.setObjectName("label_savePos")
+        self.label_alwaysOnTop = QtWidgets.QLabel(self.tab_options)
+        self.label_alwaysOnTop.setGeometry(QtCore.QRect(84, 139, 103, 16))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_alwaysOnTop.setFont(font)
+        self.label_alwaysOnTop.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.label_alwaysOnTop.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.label_alwaysOnTop.setTextFormat(QtCore.Qt.AutoText)
+        self.label_alwaysOnTop.setScaledContents(False)
+        self.label_alwaysOnTop.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_alwaysOnTop.setWordWrap(False)
+        self.label_alwaysOnTop.setOpenExternalLinks(False)
+        self.label_alwaysOnTop.setObjectName("label_alwaysOnTop")
+        self.checkBox_alwaysOnTop = QtWidgets.QCheckBox(self.tab_options)
+        self.checkBox_alwaysOnTop.setGeometry(QtCore.QRect(65, 140, 16, 16))
+        self.checkBox_alwaysOnTop.setText("")
+        self.checkBox_alwaysOnTop.setObjectName("checkBox_alwaysOnTop")
+        self.checkBox_savePos = QtWidgets.QCheckBox(self.tab_options)
+        self.checkBox_savePos.setGeometry(QtCore.QRect(65, 100, 16, 16))
+        self.checkBox_savePos.setText("")
+        self.checkBox_savePos.setObjectName("checkBox_savePos")
+        self.checkBox_saveSize = QtWidgets.QCheckBox(self.tab_options)
+        self.checkBox_saveSize.setGeometry(QtCore.QRect(65, 120, 16, 16))
+        self.checkBox_saveSize.setText("")
+        self.checkBox_saveSize.setObjectName("checkBox_saveSize")
+        self.label_saveSize = QtWidgets.QLabel(self.tab_options)
+        self.label_saveSize.setGeometry(QtCore.QRect(84, 119, 140, 16))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_saveSize.setFont(font)
+        self.label_saveSize.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.label_saveSize.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.label_saveSize.setTextFormat(QtCore.Qt.AutoText)
+        self.label_saveSize.setScaledContents(False)
+        self.label_saveSize.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_saveSize.setWordWrap(False)
+        self.label_saveSize.setOpenExternalLinks(False)
+        self.label_saveSize.setObjectName("label_saveSize")
+        self.jobsCount = QtWidgets.QSpinBox(self.tab_options)
+        self.jobsCount.setGeometry(QtCore.QRect(32, 179, 49, 20))
+        self.jobsCount.setAlignment(QtCore.Qt.AlignCenter)
+        self.jobsCount.setMinimum(1)
+        self.jobsCount.setMaximum(64)
+        self.jobsCount.setProperty("value", 1)
+        self.jobsCount.setObjectName("jobsCount")
+        self.label_jobsCount = QtWidgets.QLabel(self.tab_options)
+        self.label_jobsCount.setGeometry(QtCore.QRect(84, 181, 160, 16))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_jobsCount.setFont(font)
+        self.label_jobsCount.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_jobsCount.setObjectName("label_jobsCount")
+        self.downloadsCount = QtWidgets.QSpinBox(self.tab_options)
+        self.downloadsCount.setGeometry(QtCore.QRect(32, 201, 49, 20))
+        self.downloadsCount.setAlignment(QtCore.Qt.AlignCenter)
+        self.downloadsCount.setMinimum(1)
+        self.downloadsCount.setMaximum(32)
+        self.downloadsCount.setProperty("value", 4)
+        self.downloadsCount.setObjectName("downloadsCount")
+        self.label_downloadsCount = QtWidgets.QLabel(self.tab_options)
+        self.label_downloadsCount.setGeometry(QtCore.QRect(84, 203, 160, 16))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_downloadsCount.setFont(font)
+        self.label_downloadsCount.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_downloadsCount.setObjectName("label_downloadsCount")
+        self.checkBox_resume = QtWidgets.QCheckBox(self.tab_options)
+        self.checkBox_resume.setGeometry(QtCore.QRect(65, 225, 16, 16))
+        self.checkBox_resume.setText("")
+        self.checkBox_resume.setObjectName("checkBox_resume")
+        self.label_resume = QtWidgets.QLabel(self.tab_options)
+        self.label_resume.setGeometry(QtCore.QRect(84, 225, 220, 16))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_resume.setFont(font)
+        self.label_resume.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_resume.setObjectName("label_resume")
+        self.checkBox_fastPath = QtWidgets.QCheckBox(self.tab_options)
+        self.checkBox_fastPath.setGeometry(QtCore.QRect(65, 245, 16, 16))
+        self.checkBox_fastPath.setText("")
+        self.checkBox_fastPath.setObjectName("checkBox_fastPath")
+        self.label_fastPath = QtWidgets.QLabel(self.tab_options)
+        self.label_fastPath.setGeometry(QtCore.QRect(84, 245, 300, 16))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_fastPath.setFont(font)
+        self.label_fastPath.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_fastPath.setObjectName("label_fastPath")
+        self.checkBox_segments = QtWidgets.QCheckBox(self.tab_options)
+        self.checkBox_segments.setGeometry(QtCore.QRect(65, 265, 16, 16))
+        self.checkBox_segments.setText("")
+        self.checkBox_segments.setObjectName("checkBox_segments")
+        self.label_segments = QtWidgets.QLabel(self.tab_options)
+        self.label_segments.setGeometry(QtCore.QRect(84, 265, 300, 16))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_segments.setFont(font)
+        self.label_segments.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_segments.setObjectName("label_segments")
+        self.checkBox_convertDownloads = QtWidgets.QCheckBox(self.tab_options)
+        self.checkBox_convertDownloads.setGeometry(QtCore.QRect(65, 285, 16, 16))
+        self.checkBox_convertDownloads.setText("")
+        self.checkBox_convertDownloads.setObjectName("checkBox_convertDownloads")
+        self.label_convertDownloads = QtWidgets.QLabel(self.tab_options)
+        self.label_convertDownloads.setGeometry(QtCore.QRect(84, 285, 300, 16))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_convertDownloads.setFont(font)
+        self.label_convertDownloads.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_convertDownloads.setObjectName("label_convertDownloads")
+        self.checkBox_adaptiveJobs = QtWidgets.QCheckBox(self.tab_options)
+        self.checkBox_adaptiveJobs.setGeometry(QtCore.QRect(65, 305, 16, 16))
+        self.checkBox_adaptiveJobs.setText("")
+        self.checkBox_adaptiveJobs.setObjectName("checkBox_adaptiveJobs")
+        self.label_adaptiveJobs = QtWidgets.QLabel(self.tab_options)
+        self.label_adaptiveJobs.setGeometry(QtCore.QRect(84, 305, 300, 16))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_adaptiveJobs.setFont(font)
+        self.label_adaptiveJobs.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_adaptiveJobs.setObjectName("label_adaptiveJobs")
+        self.jobsMinCount = QtWidgets.QSpinBox(self.tab_options)
+        self.jobsMinCount.setGeometry(QtCore.QRect(32, 323, 49, 20))
+        self.jobsMinCount.setAlignment(QtCore.Qt.AlignCenter)
+        self.jobsMinCount.setMinimum(1)
+        self.jobsMinCount.setMaximum(64)
+        self.jobsMinCount.setProperty("value", 1)
+        self.jobsMinCount.setObjectName("jobsMinCount")
+        self.label_jobsMinCount = QtWidgets.QLabel(self.tab_options)
+        self.label_jobsMinCount.setGeometry(QtCore.QRect(84, 325, 300, 16))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_jobsMinCount.setFont(font)
+        self.label_jobsMinCount.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_jobsMinCount.setObjectName("label_jobsMinCount")
+        self.checkBox_dedup = QtWidgets.QCheckBox(self.tab_options)
+        self.checkBox_dedup.setGeometry(QtCore.QRect(65, 345, 16, 16))
+        self.checkBox_dedup.setText("")
+        self.checkBox_dedup.setObjectName("checkBox_dedup")
+        self.label_dedup = QtWidgets.QLabel(self.tab_options)
+        self.label_dedup.setGeometry(QtCore.QRect(84, 345, 300, 16))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_dedup.setFont(font)
+        self.label_dedup.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_dedup.setObjectName("label_dedup")
+        self.layoutWidget = QtWidgets.QWidget(self.tab_options)
+        self.layoutWidget.setGeometry(QtCore.QRect(11, 9, 484, 80))
+        self.layoutWidget.setObjectName("layoutWidget")
+        self.gridLayout_3 = QtWidgets.QGridLayout(self.layoutWidget)
+        self.gridLayout_3.setContentsMargins(0, 0, 0, 0)
+        self.gridLayout_3.setObjectName("gridLayout_3")
+        self.path_ytdlp = QtWidgets.QLineEdit(self.layoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.path_ytdlp.sizePolicy().hasHeightForWidth())
+        self.path_ytdlp.setSizePolicy(sizePolicy)
+        self.path_ytdlp.setMinimumSize(QtCore.QSize(400, 22))
+        self.path_ytdlp.setMaximumSize(QtCore.QSize(400, 22))
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        font.setBold(False)
+        font.setWeight(50)
+        font.setKerning(True)
+        self.path_ytdlp.setFont(font)
+        self.path_ytdlp.setText("")
+        self.path_ytdlp.setFrame(True)
+        self.path_ytdlp.setObjectName("path_ytdlp")
+        self.gridLayout_3.addWidget(self.path_ytdlp, 2, 1, 1, 1)
+        self.label_ffmpeg = QtWidgets.QLabel(self.layoutWidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_ffmpeg.setFont(font)
+        self.label_ffmpeg.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.label_ffmpeg.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.label_ffmpeg.setTextFormat(QtCore.Qt.AutoText)
+        self.label_ffmpeg.setScaledContents(False)
+        self.label_ffmpeg.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_ffmpeg.setWordWrap(False)
+        self.label_ffmpeg.setOpenExternalLinks(False)
+        self.label_ffmpeg.setObjectName("label_ffmpeg")
+        self.gridLayout_3.addWidget(self.label_ffmpeg, 0, 0, 1, 1)
+        self.btn_path_ytdlp = QtWidgets.QToolButton(self.layoutWidget)
+        self.btn_path_ytdlp.setObjectName("btn_path_ytdlp")
+        self.gridLayout_3.addWidget(self.btn_path_ytdlp, 2, 2, 1, 1)
+        self.btn_path_ffmpeg = QtWidgets.QToolButton(self.layoutWidget)
+        self.btn_path_ffmpeg.setObjectName("btn_path_ffmpeg")
+        self.gridLayout_3.addWidget(self.btn_path_ffmpeg, 0, 2, 1, 1)
+        self.label_ydlp = QtWidgets.QLabel(self.layoutWidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_ydlp.setFont(font)
+        self.label_ydlp.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.label_ydlp.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.label_ydlp.setTextFormat(QtCore.Qt.AutoText)
+        self.label_ydlp.setScaledContents(False)
+        self.label_ydlp.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_ydlp.setWordWrap(False)
+        self.label_ydlp.setOpenExternalLinks(False)
+        self.label_ydlp.setObjectName("label_ydlp")
+        self.gridLayout_3.addWidget(self.label_ydlp, 2, 0, 1, 1)
+        self.path_ffmpeg = QtWidgets.QLineEdit(self.layoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Minimum)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.path_ffmpeg.sizePolicy().hasHeightForWidth())
+        self.path_ffmpeg.setSizePolicy(sizePolicy)
+        self.path_ffmpeg.setMinimumSize(QtCore.QSize(400, 22))
+        self.path_ffmpeg.setMaximumSize(QtCore.QSize(400, 22))
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        self.path_ffmpeg.setFont(font)
+        self.path_ffmpeg.setText("")
+        self.path_ffmpeg.setFrame(True)
+        self.path_ffmpeg.setObjectName("path_ffmpeg")
+        self.gridLayout_3.addWidget(self.path_ffmpeg, 0, 1, 1, 1)
+        self.comboBoxProxy = QtWidgets.QComboBox(self.layoutWidget)
+        sizePolicy = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Minimum, QtWidgets.QSizePolicy.Preferred)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.comboBoxProxy.sizePolicy().hasHeightForWidth())
+        self.comboBoxProxy.setSizePolicy(sizePolicy)
+        self.comboBoxProxy.setMinimumSize(QtCore.QSize(400, 22))
+        self.comboBoxProxy.setMaximumSize(QtCore.QSize(400, 22))
+        font = QtGui.QFont()
+        font.setFamily("Consolas")
+        self.comboBoxProxy.setFont(font)
+        self.comboBoxProxy.setMouseTracking(True)
+        self.comboBoxProxy.setAcceptDrops(False)
+        self.comboBoxProxy.setEditable(True)
+        self.comboBoxProxy.setObjectName("comboBoxProxy")
+        self.gridLayout_3.addWidget(self.comboBoxProxy, 3, 1, 1, 1)
+        self.label_proxy = QtWidgets.QLabel(self.layoutWidget)
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_proxy.setFont(font)
+        self.label_proxy.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.label_proxy.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.label_proxy.setTextFormat(QtCore.Qt.AutoText)
+        self.label_proxy.setScaledContents(False)
+        self.label_proxy.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_proxy.setWordWrap(False)
+        self.label_proxy.setOpenExternalLinks(False)
+        self.label_proxy.setObjectName("label_proxy")
+        self.gridLayout_3.addWidget(self.label_proxy, 3, 0, 1, 1)
+        self.checkBox_setDarkMode = QtWidgets.QCheckBox(self.tab_options)
+        self.checkBox_setDarkMode.setGeometry(QtCore.QRect(65, 160, 16, 16))
+        self.checkBox_setDarkMode.setText("")
+        self.checkBox_setDarkMode.setObjectName("checkBox_setDarkMode")
+        self.label_setDarkMode = QtWidgets.QLabel(self.tab_options)
+        self.label_setDarkMode.setGeometry(QtCore.QRect(84, 159, 103, 16))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        font.setBold(False)
+        font.setWeight(50)
+        self.label_setDarkMode.setFont(font)
+        self.label_setDarkMode.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.label_setDarkMode.setFrameShadow(QtWidgets.QFrame.Plain)
+        self.label_setDarkMode.setTextFormat(QtCore.Qt.AutoText)
+        self.label_setDarkMode.setScaledContents(False)
+        self.label_setDarkMode.setAlignment(QtCore.Qt.AlignLeading|QtCore.Qt.AlignLeft|QtCore.Qt.AlignVCenter)
+        self.label_setDarkMode.setWordWrap(False)
+        self.label_setDarkMode.setOpenExternalLinks(False)
+        self.label_setDarkMode.setObjectName("label_setDarkMode")
+        self.tabWidget.addTab(self.tab_options, "")
+        self.gridLayout.addWidget(self.tabWidget, 1, 0, 1, 1)
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.statusbar = QtWidgets.QStatusBar(MainWindow)
+        self.statusbar.setObjectName("statusbar")
+        MainWindow.setStatusBar(self.statusbar)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 927, 21))
+        self.menubar.setObjectName("menubar")
+        self.menuView = QtWidgets.QMenu(self.menubar)
+        self.menuView.setObjectName("menuView")
+        self.menuLayout = QtWidgets.QMenu(self.menuView)
+        self.menuLayout.setTearOffEnabled(True)
+        self.menuLayout.setObjectName("menuLayout")
+        self.menuFind = QtWidgets.QMenu(self.menubar)
+        self.menuFind.setObjectName("menuFind")
+        self.menuTools = QtWidgets.QMenu(self.menubar)
+        self.menuTools.setObjectName("menuTools")
+        MainWindow.setMenuBar(self.menubar)
+        self.action_textEdit1 = QtWidgets.QAction(MainWindow)
+        self.action_textEdit1.setCheckable(True)
+        self.action_textEdit1.setChecked(False)
+        self.action_textEdit1.setEnabled(True)
+        self.action_textEdit1.setShortcutVisibleInContextMenu(False)
+        self.action_textEdit1.setObjectName("action_textEdit1")
+        self.action_textEdit2 = QtWidgets.QAction(MainWindow)
+        self.action_textEdit2.setCheckable(True)
+        self.action_textEdit2.setChecked(True)
+        self.action_textEdit2.setObjectName("action_textEdit2")
+        self.action_textEdit3 = QtWidgets.QAction(MainWindow)
+        self.action_textEdit3.setCheckable(True)
+        self.action_textEdit3.setChecked(True)
+        self.action_textEdit3.setObjectName("action_textEdit3")
+        self.action_textEdit3_refresh = QtWidgets.QAction(MainWindow)
+        self.action_textEdit3_refresh.setCheckable(True)
+        self.action_textEdit3_refresh.setChecked(True)
+        self.action_textEdit3_refresh.setObjectName("action_textEdit3_refresh")
+        self.action_replace = QtWidgets.QAction(MainWindow)
+        self.action_replace.setCheckable(True)
+        self.action_replace.setChecked(True)
+        self.action_replace.setObjectName("action_replace")
+        self.action_pause_job = QtWidgets.QAction(MainWindow)
+        self.action_pause_job.setObjectName("action_pause_job")
+        self.action_cancel_job = QtWidgets.QAction(MainWindow)
+        self.action_cancel_job.setObjectName("action_cancel_job")
+        self.action_export_telemetry = QtWidgets.QAction(MainWindow)
+        self.action_export_telemetry.setObjectName("action_export_telemetry")
+        self.action_url_refresh = QtWidgets.QAction(MainWindow)
+        self.action_url_refresh.setCheckable(True)
+        self.action_url_refresh.setChecked(True)
+        self.action_url_refresh.setObjectName("action_url_refresh")
+        self.menuLayout.addAction(self.action_textEdit1)
+        self.menuLayout.addAction(self.action_textEdit2)
+        self.menuLayout.addAction(self.action_textEdit3)
+        self.menuLayout.addSeparator()
+        self.menuLayout.addAction(self.action_textEdit3_refresh)
+        self.menuLayout.addAction(self.action_url_refresh)
+        self.menuView.addAction(self.menuLayout.menuAction())
+        self.menuFind.addAction(self.action_replace)
+        self.menuTools.addAction(self.action_pause_job)
+        self.menuTools.addAction(self.action_cancel_job)
+        self.menuTools.addSeparator()
+        self.menuTools.addAction(self.action_export_telemetry)
+        self.menubar.addAction(self.menuView.menuAction())
+        self.menubar.addAction(self.menuFind.menuAction())
+        self.menubar.addAction(self.menuTools.menuAction())
+
+        self.retranslateUi(MainWindow)
+        self.tabWidget.setCurrentIndex(0)
+        self.list_codec.setCurrentIndex(0)
+        self.list_ffmpeg_preset.setCurrentIndex(5)
+        self.action_textEdit2.toggled['bool'].connect(self.textEdit2.setVisible) # type: ignore
+        self.action_textEdit3.toggled['bool'].connect(self.textEdit3.setVisible) # type: ignore
+        self.action_replace.toggled['bool'].connect(self.frameFind.setVisible) # type: ignore
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+        MainWindow.setTabOrder(self.path_save, self.list_codec)
+        MainWindow.setTabOrder(self.list_codec, self.crfCount)
+        MainWindow.setTabOrder(self.crfCount, self.fpsEnable)
+        MainWindow.setTabOrder(self.fpsEnable, self.fpsCount)
+        MainWindow.setTabOrder(self.fpsCount, self.list_ffmpeg_preset)
+        MainWindow.setTabOrder(self.list_ffmpeg_preset, self.btn_path_save)
+        MainWindow.setTabOrder(self.btn_path_save, self.tabWidget)
+        MainWindow.setTabOrder(self.tabWidget, self.btn_path_ytdlp)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Uconvert"))
+        self.list_codec.setItemText(0, _translate("MainWindow", "libx265"))
+        self.list_codec.setItemText(1, _translate("MainWindow", "libx264"))
+        self.list_codec.setItemText(2, _translate("MainWindow", "hevc_nvenc"))
+        self.list_codec.setItemText(3, _translate("MainWindow", "h264_nvenc"))
+        self.list_codec.setItemText(4, _translate("MainWindow", "hevc_qsv"))
+        self.list_codec.setItemText(5, _translate("MainWindow", "h264_qsv"))
+        self.list_ffmpeg_preset.setItemText(0, _translate("MainWindow", "ultrafast"))
+        self.list_ffmpeg_preset.setItemText(1, _translate("MainWindow", "superfast"))
+        self.list_ffmpeg_preset.setItemText(2, _translate("MainWindow", "veryfast"))
+        self.list_ffmpeg_preset.setItemText(3, _translate("MainWindow", "faster"))
+        self.list_ffmpeg_preset.setItemText(4, _translate("MainWindow", "fast"))
+        self.list_ffmpeg_preset.setItemText(5, _translate("MainWindow", "medium"))
+        self.list_ffmpeg_preset.setItemText(6, _translate("MainWindow", "slow"))
+        self.list_ffmpeg_preset.setItemText(7, _translate("MainWindow", "slower"))
+        self.list_ffmpeg_preset.setItemText(8, _translate("MainWindow", "veryslow"))
+        self.list_ffmpeg_preset.setItemText(9, _translate("MainWindow", "placebo"))
+        self.label_crf.setText(_translate("MainWindow", "CRF"))
+        self.btn_path_save.setText(_translate("MainWindow", "..."))
+        self.label_fps.setText(_translate("MainWindow", "FPS"))
+        self.current_fileName.setToolTip(_translate("MainWindow", "[N] file name, [###] line number, [P] folder, [DATE] modified date, [DUR] duration, [RES] resolution, [FPS] frame rate"))
+        self.path_save.setPlaceholderText(_translate("MainWindow", "Укажите путь для сохранения"))
+        self.progressBar_download.setFormat(_translate("MainWindow", "DOWNLOAD %p%"))
+        self.progressBar_translate.setFormat(_translate("MainWindow", "TRANSLATE %p%"))
+        self.progressBar_convert.setFormat(_translate("MainWindow", "RENDER %p%"))
+        self.btn_start.setText(_translate("MainWindow", "START"))
+        self.btn_start.setShortcut(_translate("MainWindow", "F12"))
+        self.btn_pause.setToolTip(_translate("MainWindow", "Pause running ffmpeg processes and stop starting new jobs"))
+        self.btn_pause.setText(_translate("MainWindow", "PAUSE"))
+        self.btn_stop.setToolTip(_translate("MainWindow", "Cancel the batch: conversions, downloads and translations are stopped and partial files removed"))
+        self.btn_stop.setText(_translate("MainWindow", "STOP"))
+        self.btn_find.setText(_translate("MainWindow", "Find"))
+        self.btn_find_all.setText(_translate("MainWindow", "Find All"))
+        self.btn_replace.setText(_translate("MainWindow", "Replace"))
+        self.btn_replace_all.setText(_translate("MainWindow", "Replace All"))
+        self.checkBox_regex.setToolTip(_translate("MainWindow", "Regular expressions: groups in Replace as \\1 or \\g<name>"))
+        self.checkBox_regex.setText(_translate("MainWindow", "Regex"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_convert), _translate("MainWindow", "convert"))
+        self.label_savePos.setText(_translate("MainWindow", "Запомнить позицию окна"))
+        self.label_alwaysOnTop.setText(_translate("MainWindow", "Поверх всех окон"))
+        self.label_saveSize.setText(_translate("MainWindow", "Запомнить размер окна"))
+        self.label_jobsCount.setText(_translate("MainWindow", "Параллельных конвертаций"))
+        self.label_downloadsCount.setText(_translate("MainWindow", "Параллельных загрузок"))
+        self.label_resume.setText(_translate("MainWindow", "Пропускать уже готовые файлы"))
+        self.label_fastPath.setText(_translate("MainWindow", "Быстрый режим: копировать подходящие потоки"))
+        self.label_segments.setText(_translate("MainWindow", "Кодировать длинные файлы по частям"))
+        self.label_convertDownloads.setText(_translate("MainWindow", "Конвертировать скачанные видео"))
+        self.checkBox_adaptiveJobs.setToolTip(_translate("MainWindow", "Start with the minimum and add conversions while the CPU has headroom and the total encoding speed grows; \"Параллельных конвертаций\" is the maximum"))
+        self.label_adaptiveJobs.setText(_translate("MainWindow", "Подбирать число конвертаций по нагрузке"))
+        self.label_jobsMinCount.setText(_translate("MainWindow", "Минимум конвертаций при подборе"))
+        self.checkBox_dedup.setToolTip(_translate("MainWindow", "A file with the same content and settings, or a link that was already downloaded, is not processed again: the existing result is hard-linked"))
+        self.label_dedup.setText(_translate("MainWindow", "Не обрабатывать повторно одинаковые файлы"))
+        self.path_ytdlp.setPlaceholderText(_translate("MainWindow", "Укажите путь к yt-dlp.exe"))
+        self.label_ffmpeg.setText(_translate("MainWindow", "ffmpeg:"))
+        self.btn_path_ytdlp.setText(_translate("MainWindow", "..."))
+        self.btn_path_ffmpeg.setText(_translate("MainWindow", "..."))
+        self.label_ydlp.setText(_translate("MainWindow", "yt-dlp:"))
+        self.path_ffmpeg.setPlaceholderText(_translate("MainWindow", "Укажите путь к ffmpeg.exe"))
+        self.label_proxy.setText(_translate("MainWindow", "proxy:"))
+        self.label_setDarkMode.setText(_translate("MainWindow", "Темная тема"))
+        self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_options), _translate("MainWindow", "options"))
+        self.menuView.setTitle(_translate("MainWindow", "View"))
+        self.menuLayout.setTitle(_translate("MainWindow", "Layout"))
+        self.menuFind.setTitle(_translate("MainWindow", "Find"))
+        self.menuTools.setTitle(_translate("MainWindow", "Tools"))
+        self.action_textEdit1.setText(_translate("MainWindow", "Input"))
+        self.action_textEdit1.setShortcut(_translate("MainWindow", "Alt+Shift+1"))
+        self.action_textEdit2.setText(_translate("MainWindow", "File Name"))
+        self.action_textEdit2.setShortcut(_translate("MainWindow", "Alt+Shift+2"))
+        self.action_textEdit3.setText(_translate("MainWindow", "File Info"))
+        self.action_textEdit3.setShortcut(_translate("MainWindow", "Alt+Shift+3"))
+        self.action_textEdit3_refresh.setText(_translate("MainWindow", "File Info Refresh"))
+        self.action_textEdit3_refresh.setShortcut(_translate("MainWindow", "Ctrl+R"))
+        self.action_replace.setText(_translate("MainWindow", "Replace"))
+        self.action_replace.setShortcut(_translate("MainWindow", "Ctrl+H"))
+        self.action_pause_job.setText(_translate("MainWindow", "Pause / Resume Job at Cursor"))
+        self.action_pause_job.setToolTip(_translate("MainWindow", "Pause or resume the conversion of the file on the current input line"))
+        self.action_pause_job.setShortcut(_translate("MainWindow", "Ctrl+Shift+P"))
+        self.action_cancel_job.setText(_translate("MainWindow", "Cancel Job at Cursor"))
+        self.action_cancel_job.setToolTip(_translate("MainWindow", "Cancel the conversion of the file on the current input line"))
+        self.action_cancel_job.setShortcut(_translate("MainWindow", "Ctrl+Shift+X"))
+        self.action_export_telemetry.setText(_translate("MainWindow", "Export Telemetry..."))
+        self.action_export_telemetry.setToolTip(_translate("MainWindow", "Save job timings and GUI stalls as a Chrome trace (.json) or JSON lines (.jsonl)"))
+        self.action_url_refresh.setText(_translate("MainWindow", "URL Refresh"))
+        self.action_url_refresh.setShortcut(_translate("MainWindow", "Ctrl+Shift+R"))
+from widgets.numbered_list_view import NumberedListView
+from widgets.numbered_text_edit import NumberedTextEdit
+
+UI_SOURCE_SHA1 = "cf9a2435ef2422ee15fa6f0c4480cccb53779a88"
@@ -0,0 +1,29 @@
+import hashlib
+import os
+
+def ui_source_hash(ui_path):
+    # Хэш .ui без учета переводов строк: git на Windows может заменить \n на \r\n
+    with open(ui_path, "rb") as f:
+        return hashlib.sha1(f.read().replace(b"\r\n", b"\n")).hexdigest()
+
+def load_main_window(window, ui_path):
+    # Интерфейс из заранее скомпилированного модуля (python interface/build_ui.py): разбор XML через uic
+    # и импорт самого uic заметно замедляют запуск. Если модуля нет или он собран из другой версии .ui,
+    # разбираем .ui как раньше
+    try:
+        from interface import main_window_ui
+    except ImportError:
+        main_window_ui = None
+
+    if main_window_ui is not None and (not os.path.exists(ui_path) or ui_source_hash(ui_path) == main_window_ui.UI_SOURCE_SHA1):
+        ui = main_window_ui.Ui_MainWindow()
+        ui.setupUi(window)
+        window.__dict__.update(vars(ui))  # Виджеты доступны как атрибуты окна, как после loadUi
+        return True
+
+    if not os.path.exists(ui_path):
+        raise FileNotFoundError(f"UI file not found: {ui_path}")
+    print("Скомпилированный интерфейс устарел или отсутствует, загружаем main_window.ui")
+    from PyQt5.uic import loadUi
+    loadUi(ui_path, window)
+    return False
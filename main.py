@@ -1,48 +1,63 @@
+from models.startup_timing import startup_timing  # Первым: замер запуска начинается с импорта main.py
 from interface.theme_main_window import setLightMode, setDarkMode
+from interface.ui_loader import load_main_window
+from models.dedup import dedup_index
 from models.find_replace import FindReplace
-from models.video_converter import ConvertVideoThread
-from models.video_downloader import VideoDownloader, DownloadThread
-from models.vot_cli_downloader import VotCliDownloader
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QColor
+from models.media_cache import media_cache
+from models.naming import is_url, normalize_input_path, render_output_name, safe_filename
+from models.process_utils import sibling_tool_path
+from models.telemetry import telemetry
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QColor, QIcon, QKeySequence
 from PyQt5.QtWidgets import (
     QAction, QApplication, QCheckBox, QComboBox, QFileDialog, QLineEdit,
-    QMainWindow, QProgressBar, QPushButton, QStatusBar
+    QMainWindow, QMessageBox, QProgressBar, QPushButton, QShortcut, QSpinBox, QStatusBar
 )
-from PyQt5.uic import loadUi
 from widgets.file_info_widget import FileInfoWidget
+from widgets.numbered_list_view import NumberedListView
 from widgets.numbered_text_edit import NumberedTextEdit
 import json
 import os
 import sys
 
+# Конвертер, загрузчики и журнал импортируются при первом запуске пакета, а не до первого кадра окна
+
 class MainUI(QMainWindow):
     CUSTOM_FPS_ENABLED = 2
 
     def __init__(self):
         super(MainUI, self).__init__()
         self.SETTINGS_FILE = "settings.json"
+        self.convert_job_status = {}  # Статусы активных задач конвертации
+        self.convert_queue = None  # Очередь задач текущей конвертации
+        self.download_jobs = {}  # Ссылка -> задача конвертации, которая ждет окончания загрузки
+        self.convert_line_jobs = {}  # Номер строки во входном списке -> индекс задачи конвертации
+        self.thread = None  # Поток конвертации текущего пакета
+        self.download_thread = None
+        self.vot_cli_thread = None
         self.setup_ui()
+        startup_timing.mark("интерфейс")
         self.connect_signals()
         self.load_settings()
+        startup_timing.mark("настройки")
 
     def setup_ui(self):
         base_path = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))  # Корректный путь для PyInstaller
         ui_path = os.path.join(base_path, "interface", "main_window.ui")  # Используем base_path для формирования пути
-        if not os.path.exists(ui_path):
-            raise FileNotFoundError(f"UI file not found: {ui_path}")
-
-        loadUi(ui_path, self)
+        if load_main_window(self, ui_path):
+            # В скомпилированном модуле путь к иконке относительный от текущей папки
+            self.setWindowIcon(QIcon(os.path.join(base_path, "icon", "logo_black.ico")))
         self.centralwidget.setContentsMargins(9, 0, 9, 9)
         self.tabWidget.setContentsMargins(9, 0, 9, 9)
 
         # Инициализация виджетов
         self.text_convert: NumberedTextEdit = self.findChild(NumberedTextEdit, "textEdit1")
         self.text_edit_middle: NumberedTextEdit = self.findChild(NumberedTextEdit, "textEdit2")
-        self.text_edit_right: NumberedTextEdit = self.findChild(NumberedTextEdit, "textEdit3")
+        self.text_edit_right: NumberedListView = self.findChild(NumberedListView, "textEdit3")  # Таблица может быть очень длинной
         self.current_fileName: QComboBox = self.findChild(QComboBox, "current_fileName")
         self.comboBoxFind: QComboBox = self.findChild(QComboBox, "comboBoxFind")
         self.comboBoxReplace: QComboBox = self.findChild(QComboBox, "comboBoxReplace")
+        self.checkBox_regex = self.findChild(QCheckBox, "checkBox_regex")
         self.file_info_widget = FileInfoWidget(self.text_convert, self.text_edit_middle, self.text_edit_right, self.current_fileName, self)
         self.progressBar_convert: QProgressBar = self.findChild(QProgressBar, "progressBar_convert")
         self.path_save: QLineEdit = self.findChild(QLineEdit, "path_save")
@@ -51,8 +66,21 @@ class MainUI(QMainWindow):
         self.comboBoxProxy: QComboBox = self.findChild(QComboBox, "comboBoxProxy")
         self.statusbar: QStatusBar = self.findChild(QStatusBar, "statusbar")
         self.btn_start: QPushButton = self.findChild(QPushButton, "btn_start")
+        self.btn_pause: QPushButton = self.findChild(QPushButton, "btn_pause")
+        self.btn_stop: QPushButton = self.findChild(QPushButton, "btn_stop")
         self.checkBox_setDarkMode = self.findChild(QCheckBox, "checkBox_setDarkMode")
-        self.find_replace = FindReplace(self.text_edit_middle, self.comboBoxFind, self.comboBoxReplace)
+        self.jobsCount: QSpinBox = self.findChild(QSpinBox, "jobsCount")
+        self.downloadsCount: QSpinBox = self.findChild(QSpinBox, "downloadsCount")
+        self.checkBox_resume = self.findChild(QCheckBox, "checkBox_resume")
+        self.checkBox_fastPath = self.findChild(QCheckBox, "checkBox_fastPath")
+        self.checkBox_segments = self.findChild(QCheckBox, "checkBox_segments")
+        self.checkBox_convertDownloads = self.findChild(QCheckBox, "checkBox_convertDownloads")
+        self.checkBox_adaptiveJobs = self.findChild(QCheckBox, "checkBox_adaptiveJobs")
+        self.jobsMinCount: QSpinBox = self.findChild(QSpinBox, "jobsMinCount")
+        self.checkBox_dedup = self.findChild(QCheckBox, "checkBox_dedup")
+        self.progressBar_download: QProgressBar = self.findChild(QProgressBar, "progressBar_download")
+        self.progressBar_translate: QProgressBar = self.findChild(QProgressBar, "progressBar_translate")
+        self.find_replace = FindReplace(self.text_edit_middle, self.comboBoxFind, self.comboBoxReplace, self.checkBox_regex)
 
         # QAction
         self.action_textEdit1 = self.findChild(QAction, "action_textEdit1")
@@ -60,12 +88,17 @@ class MainUI(QMainWindow):
         self.action_textEdit3 = self.findChild(QAction, "action_textEdit3")
         self.action_textEdit3_refresh = self.findChild(QAction, "action_textEdit3_refresh")
         self.action_replace = self.findChild(QAction, "action_replace")
+        self.action_export_telemetry = self.findChild(QAction, "action_export_telemetry")
+        self.action_pause_job = self.findChild(QAction, "action_pause_job")
+        self.action_cancel_job = self.findChild(QAction, "action_cancel_job")
 
     def connect_signals(self):
         # Настройка событий
         self.fpsEnable.stateChanged.connect(self.fpsCustom)
         self.checkBox_alwaysOnTop.stateChanged.connect(self.update_always_on_top)
         self.btn_start.clicked.connect(self.startPressed)
+        self.btn_pause.clicked.connect(self.toggle_pause)
+        self.btn_stop.clicked.connect(self.cancel_batch)
         self.btn_path_save.clicked.connect(self.select_folder_path_save)
         self.btn_path_ffmpeg.clicked.connect(self.select_path_ffmpeg)
         self.btn_path_ytdlp.clicked.connect(self.select_ytdlp_path)
@@ -78,11 +111,16 @@ class MainUI(QMainWindow):
         self.action_textEdit3.triggered.connect(self.on_action_textEdit3_triggered)
 
         self.action_textEdit3_refresh.triggered.connect(self.textEdit3RectColor)
+        self.action_export_telemetry.triggered.connect(self.export_telemetry)
+        self.action_pause_job.triggered.connect(self.toggle_job_pause)
+        self.action_cancel_job.triggered.connect(self.cancel_job)
 
         self.btn_find.clicked.connect(self.find_replace.find_next)
         self.btn_find_all.clicked.connect(self.find_replace.find_all)
         self.btn_replace.clicked.connect(self.find_replace.replace)
         self.btn_replace_all.clicked.connect(self.find_replace.replace_all)
+        QShortcut(QKeySequence("F3"), self, self.find_replace.find_next)
+        QShortcut(QKeySequence("Shift+F3"), self, self.find_replace.find_previous)
 
     def mousePressEvent(self, event):
         focus_widgets = [
@@ -96,6 +134,9 @@ class MainUI(QMainWindow):
             self.current_fileName,
             self.crfCount,
             self.fpsCount,
+            self.jobsCount,
+            self.jobsMinCount,
+            self.downloadsCount,
             self.comboBoxFind,
             self.comboBoxReplace
         ]
@@ -155,33 +196,55 @@ class MainUI(QMainWindow):
             print(f"Выбрана папка для сохранения: {folder_path}")
 
     def startPressed(self):
+        from models.download_scheduler import conversion_download_dir
+        from models.video_downloader import DownloadThread
+        from models.vot_cli_downloader import VotCliDownloader
+
+        # Второй пакет поверх первого запустил бы еще один набор процессов ffmpeg и загрузок
+        if self.is_busy():
+            self.update_status("Пакет еще выполняется: дождитесь окончания или нажмите STOP")
+            return
+
         print("Кнопка нажата, начинаем обработку...")
 
-        input_text = self.text_convert.toPlainText().strip().splitlines()
+        # Текст окна собирается из документа один раз: те же строки получает и convert_video
+        input_lines = self.text_convert.toPlainText().splitlines()
         urls = []
         files = []
 
-        for line in input_text:
+        for line in input_lines:
             line = line.strip()
-            if line.startswith("http://") or line.startswith("https://"):
+            if is_url(line):
                 urls.append(line)
-            else:
+            elif line:
                 files.append(line)
 
         output_dir = self.path_save.text()
         ytdlp_path = self.path_ytdlp.text()
         proxy = self.comboBoxProxy.currentText().strip()  # Получаем текст из QComboBoxProxy
 
+        # Скачанные видео попадают в очередь конвертации сразу, пока остальные еще скачиваются
+        convert_downloads = bool(urls) and self.checkBox_convertDownloads.isChecked()
+        converting = (files or convert_downloads) and self.convert_video(input_lines, convert_downloads)
+
         if urls:
-            self.download_thread = DownloadThread(urls, output_dir, ytdlp_path, proxy, self, self.file_info_widget)
+            download_dir = conversion_download_dir(output_dir) if converting and convert_downloads else output_dir
+            self.download_thread = DownloadThread(urls, download_dir, ytdlp_path, proxy, self.downloadsCount.value(),
+                                                  dedup=self.checkBox_dedup.isChecked())
+            self.download_thread.progress_signal.connect(self.progressBar_download.setValue)
+            self.download_thread.status_signal.connect(self.update_status)
+            if converting and convert_downloads:
+                self.download_thread.job_finished_signal.connect(self.queue_downloaded_file)
+                self.download_thread.finished.connect(self.convert_queue.close)
+            self.download_thread.finished.connect(self.update_convert_buttons)
             self.download_thread.start()
-            self.vot_cli_thread = VotCliDownloader(urls, output_dir, ytdlp_path, self.file_info_widget)
+            self.vot_cli_thread = VotCliDownloader(urls, output_dir, ytdlp_path, proxy, self.downloadsCount.value())
             self.vot_cli_thread.progress_signal.connect(self.update_status)
             self.vot_cli_thread.error_signal.connect(self.update_status)
+            self.vot_cli_thread.total_progress_signal.connect(self.progressBar_translate.setValue)
+            self.vot_cli_thread.finished.connect(self.update_convert_buttons)
             self.vot_cli_thread.start()
-
-        if files:
-            self.convert_video(files)
+            self.update_convert_buttons()
 
     def fpsCustom(self, state: int):
         if state == self.CUSTOM_FPS_ENABLED:
@@ -205,47 +268,202 @@ class MainUI(QMainWindow):
                 self.path_ytdlp.setText(self._process_path(file_path))
                 print(f"Выбран путь к ytdlp: {file_path}")
 
-    def convert_video(self, input_files):
+    def convert_video(self, input_files, convert_downloads=False):
+        # input_files - все строки входного окна, включая пустые: номер строки совпадает с номером в окне имен
+        from models.convert_job import build_jobs, JobQueue
+        from models.job_journal import JobJournal, default_journal_path
+        from models.video_converter import ConvertVideoThread
+
         codec = self.list_codec.currentText()
         crf = self.crfCount.value()
         # Передаем пользовательский FPS, если галочка установлена
         fps = self.fpsCount.value() if self.fpsEnable.isChecked() else None
         preset = self.list_ffmpeg_preset.currentText()
-        input_files = self.text_convert.toPlainText().splitlines()
+        output_names = self.text_edit_middle.toPlainText().splitlines()
         output_dir = self.path_save.text()
         ffmpeg_path = self.path_ffmpeg.text()
         current_file_name = self.current_fileName.currentText()
-
-        processed_input_files = []
-        for file in input_files:
-            file = file.strip().strip('"')
-            if file.startswith("file:///"):
-                file = file[8:]
-            processed_input_files.append(file)
+        max_jobs = self.jobsCount.value()
 
         print(f"Codec: {codec}, CRF: {crf}, FPS: {fps}, PRESET: {preset}")
-        print(f"Input Files: {processed_input_files}")
+        print(f"Input Files: {input_files}")
         print(f"Output Directory: {output_dir}")
         print(f"FFmpeg Path: {ffmpeg_path}")
         print(f"Current File Name: {current_file_name}")
+        print(f"Parallel Jobs: {max_jobs}")
 
-        if processed_input_files and output_dir and ffmpeg_path:
-            # Передаем выбранный FPS или None в поток для обработки
-            self.thread = ConvertVideoThread(codec, crf, fps, preset, processed_input_files, output_dir, ffmpeg_path, current_file_name, self.text_edit_middle)
-            self.thread.progress_signal.connect(self.update_progress_bar)
-            self.thread.status_signal.connect(self.update_status)
-            self.thread.start()
-        else:
+        if not (input_files and output_dir and ffmpeg_path):
             print("Отсутствуют необходимые параметры для конвертации.")
+            return False
+
+        if len(output_names) != len(input_files):
+            message = f"количество выходных имен ({len(output_names)}) не совпадает с количеством входных файлов ({len(input_files)})"
+            print(f"Ошибка: {message}.")
+            self.update_status(f"render: ошибка: {message}")
+            return False
+
+        # Задачи собираются здесь, в потоке GUI: поток конвертации не читает виджеты.
+        # Пустые строки пропускаем. Для ссылок задача создается сразу, а входной файл
+        # подставляется, когда загрузчик сообщит путь скачанного файла
+        pairs = []
+        self.convert_line_jobs = {}
+        for index, (file, name) in enumerate(zip(input_files, output_names)):
+            if not file.strip():
+                continue
+            self.convert_line_jobs[index] = len(pairs)  # Индекс задачи - номер непустой строки
+            if is_url(file.strip()):
+                # Заголовок видео - имя результата: очищаем его так же, как имя скачанного файла
+                pairs.append((file.strip(), name if name == FileInfoWidget.PENDING_TITLE else safe_filename(name)))
+                continue
+            if name == FileInfoWidget.PENDING_TITLE:
+                # Метаданные для шаблона еще собираются в фоне - получаем их для этого файла сейчас
+                name = render_output_name(current_file_name, index, file,
+                                          lambda path: media_cache.probe(path, sibling_tool_path(ffmpeg_path, "ffprobe")))
+            pairs.append((normalize_input_path(file), name))
+        jobs = build_jobs([file for file, _ in pairs], [name for _, name in pairs], output_dir, codec, crf, preset, fps,
+                          self.checkBox_fastPath.isChecked())
+        self.download_jobs = {job.input_file: job for job in jobs if is_url(job.input_file)} if convert_downloads else {}
+        jobs = [job for job in jobs if not is_url(job.input_file)]
+
+        # Журнал лежит рядом с результатами: по нему можно продолжить пакет после сбоя
+        journal = JobJournal(default_journal_path(output_dir))
+        # Длинный файл делится на части, которые кодируют несколько процессов ffmpeg
+        segment_workers = max(2, (os.cpu_count() or 1) // 4) if self.checkBox_segments.isChecked() else 0
+        # При подборе по нагрузке "Параллельных конвертаций" - верхний предел
+        min_jobs = min(self.jobsMinCount.value(), max_jobs) if self.checkBox_adaptiveJobs.isChecked() else None
+
+        # Пока идут загрузки, очередь открыта: конвертер ждет новые задачи
+        self.convert_queue = JobQueue(jobs, closed=not self.download_jobs)
+        self.convert_job_status = {}
+        self.thread = ConvertVideoThread(self.convert_queue, ffmpeg_path, max_jobs, journal, self.checkBox_resume.isChecked(),
+                                         segment_workers, min_jobs, self.checkBox_dedup.isChecked())
+        self.thread.progress_signal.connect(self.update_progress_bar)
+        self.thread.status_signal.connect(self.update_status)
+        self.thread.job_status_signal.connect(self.update_job_status)
+        self.thread.preflight_signal.connect(self.show_preflight_report)
+        self.thread.finished.connect(self.update_convert_buttons)
+        self.thread.start()
+        self.update_convert_buttons()
+        return True
+
+    def is_converting(self):
+        return self.thread is not None and self.thread.isRunning()
+
+    def running_threads(self):
+        return [thread for thread in (self.thread, self.download_thread, self.vot_cli_thread)
+                if thread is not None and thread.isRunning()]
+
+    def is_busy(self):
+        return bool(self.running_threads())
+
+    def update_convert_buttons(self):
+        converting = self.is_converting()
+        self.btn_pause.setEnabled(converting)
+        self.btn_stop.setEnabled(self.is_busy())  # STOP отменяет и загрузки с переводами
+        self.btn_pause.setText("RESUME" if converting and self.thread.is_paused() else "PAUSE")
+
+    def toggle_pause(self):
+        # Пауза освобождает процессор: процессы ffmpeg приостанавливаются, новые задачи не начинаются
+        if not self.is_converting():
+            return
+        if self.thread.is_paused():
+            self.thread.resume()
+        else:
+            self.thread.pause()
+        self.update_convert_buttons()
+
+    def cancel_batch(self):
+        # Отменяются конвертация, загрузки и переводы: их процессы завершаются, очереди не продолжаются
+        for thread in self.running_threads():
+            thread.cancel()
+        self.update_convert_buttons()
+
+    def current_job_index(self):
+        # Задача в строке входного списка, где стоит курсор
+        if not self.is_converting():
+            return None
+        index = self.convert_line_jobs.get(self.text_convert.textCursor().blockNumber())
+        if index is None:
+            self.update_status("В текущей строке нет задачи конвертации")
+        return index
+
+    def toggle_job_pause(self):
+        index = self.current_job_index()
+        if index is None:
+            return
+        if self.thread.is_paused(index):
+            self.thread.resume(index)
+        else:
+            self.thread.pause(index)
+
+    def cancel_job(self):
+        index = self.current_job_index()
+        if index is not None:
+            self.thread.cancel(index)
+
+    def queue_downloaded_file(self, index: int, url: str, ok: bool, file_path: str):
+        from dataclasses import replace
+
+        job = self.download_jobs.pop(url, None)
+        if job is None or not ok or not file_path or self.convert_queue.is_closed():
+            return  # Очередь закрыта, если пакет отменен
+
+        changes = {"input_file": file_path}
+        # Если заголовок еще не был получен, в среднем окне стоит заглушка - называем результат как скачанный файл
+        if os.path.splitext(os.path.basename(job.output_file))[0] == FileInfoWidget.PENDING_TITLE:
+            output_name = os.path.splitext(os.path.basename(file_path))[0] + ".mp4"
+            changes["output_file"] = os.path.join(os.path.dirname(job.output_file), output_name)
+        self.convert_queue.put(replace(job, **changes))
 
     def update_progress_bar(self, value: int):
         self.progressBar_convert.setValue(value)
 
+    def export_telemetry(self):
+        file_path, _ = QFileDialog.getSaveFileName(self, "Сохранить телеметрию", "uconvert_trace.json",
+                                                   "Chrome trace (*.json);;JSON lines (*.jsonl)")
+        if not file_path:
+            return
+        try:
+            telemetry.export(file_path)
+        except OSError as e:
+            self.update_status(f"Не удалось сохранить телеметрию: {e}")
+            return
+        print(telemetry.summary())
+        self.update_status(f"Телеметрия сохранена: {file_path}")
+
+    def show_preflight_report(self, report: str):
+        # Проблемы пакета видны сразу, а не через несколько часов; задачи с ошибками конвертер пропускает
+        # Окно немодальное: конвертация остальных задач уже идет
+        box = QMessageBox(QMessageBox.Warning, "Проверка перед конвертацией", report, QMessageBox.Ok, self)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.setModal(False)
+        box.show()
+
     def update_status(self, message: str):
         self.statusbar.showMessage(message)
 
+    def update_job_status(self, index: int, message: str):
+        # Показываем статусы всех активных задач одной строкой, завершенные убираем
+        if message.endswith(("status: done", "status: error", "status: skipped", "status: cancelled")):
+            self.convert_job_status.pop(index, None)
+        else:
+            self.convert_job_status[index] = message
+
+        if self.convert_job_status:
+            self.statusbar.showMessage(" | ".join(self.convert_job_status[i] for i in sorted(self.convert_job_status)))
+
     def closeEvent(self, event):
         self.save_settings()
+        # Процессы ffmpeg, yt-dlp и vot-cli не должны пережить окно: отменяем пакет и ждем,
+        # пока потоки удалят недописанные файлы
+        threads = self.running_threads()
+        for thread in threads:
+            thread.cancel()
+        for thread in threads:
+            thread.wait(15000)
+        self.file_info_widget.shutdown()
+        media_cache.save()
+        dedup_index.save()
         event.accept()
 
     def save_settings(self):
@@ -255,6 +473,16 @@ class MainUI(QMainWindow):
             "crfCount": self.crfCount.value(),
             "fpsEnable": self.fpsEnable.isChecked(),
             "fpsCount": self.fpsCount.value(),
+            "jobsCount": self.jobsCount.value(),
+            "downloadsCount": self.downloadsCount.value(),
+            "checkBox_resume": self.checkBox_resume.isChecked(),
+            "checkBox_fastPath": self.checkBox_fastPath.isChecked(),
+            "checkBox_segments": self.checkBox_segments.isChecked(),
+            "checkBox_convertDownloads": self.checkBox_convertDownloads.isChecked(),
+            "checkBox_adaptiveJobs": self.checkBox_adaptiveJobs.isChecked(),
+            "jobsMinCount": self.jobsMinCount.value(),
+            "checkBox_dedup": self.checkBox_dedup.isChecked(),
+            "checkBox_regex": self.checkBox_regex.isChecked(),
             "list_ffmpeg_preset": self.list_ffmpeg_preset.currentText(),
             "path_save": self.path_save.text(),
             "path_ffmpeg": self.path_ffmpeg.text(),
@@ -303,6 +531,16 @@ class MainUI(QMainWindow):
         self.crfCount.setValue(settings.get("crfCount", 23))
         self.fpsEnable.setChecked(settings.get("fpsEnable", False))
         self.fpsCount.setValue(settings.get("fpsCount", 30))
+        self.jobsCount.setValue(settings.get("jobsCount", max(1, (os.cpu_count() or 1) // 4)))  # Каждый ffmpeg сам использует несколько потоков
+        self.downloadsCount.setValue(settings.get("downloadsCount", 4))
+        self.checkBox_resume.setChecked(settings.get("checkBox_resume", False))
+        self.checkBox_fastPath.setChecked(settings.get("checkBox_fastPath", False))
+        self.checkBox_segments.setChecked(settings.get("checkBox_segments", False))
+        self.checkBox_convertDownloads.setChecked(settings.get("checkBox_convertDownloads", False))
+        self.checkBox_adaptiveJobs.setChecked(settings.get("checkBox_adaptiveJobs", False))
+        self.jobsMinCount.setValue(settings.get("jobsMinCount", 1))
+        self.checkBox_dedup.setChecked(settings.get("checkBox_dedup", False))
+        self.checkBox_regex.setChecked(settings.get("checkBox_regex", False))
         self.list_ffmpeg_preset.setCurrentText(settings.get("list_ffmpeg_preset", "medium"))
         self.path_save.setText(settings.get("path_save", ""))
         self.path_ffmpeg.setText(settings.get("path_ffmpeg", ""))
@@ -373,8 +611,16 @@ class MainUI(QMainWindow):
         self.update_actions()
 
 if __name__ == "__main__":
+    startup_timing.mark("импорт")
     app = QApplication(sys.argv)
     app.setStyle('Fusion')  # Стиль
+    startup_timing.mark("QApplication")
     window = MainUI()
     window.show()
+
+    def first_frame():
+        startup_timing.mark("первый кадр")
+        print(startup_timing.report())
+
+    QTimer.singleShot(0, first_frame)  # Срабатывает после того, как цикл событий отрисовал окно
     sys.exit(app.exec_())
\ No newline at end of file
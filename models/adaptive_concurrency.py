@@ -0,0 +1,206 @@
+import os
+import threading
+import time
+
+try:
+    import psutil  # Необязателен: без него нагрузка читается из /proc (Linux) или через WinAPI
+except ImportError:
+    psutil = None
+
+class LoadMonitor:
+    # Загрузка процессора (0..1 по всем ядрам, между двумя замерами) и доля доступной памяти.
+    # Если значение на этой системе получить нельзя, вместо него None
+    def __init__(self):
+        self._cpu_times = None
+        self.cpu_usage()  # Загрузка считается между замерами: первый только запоминает точку отсчета
+
+    def sample(self):
+        return self.cpu_usage(), self.memory_available()
+
+    def cpu_usage(self):
+        if psutil is not None:
+            return psutil.cpu_percent(interval=None) / 100
+        times = _system_cpu_times()
+        if times is None:
+            if hasattr(os, "getloadavg"):
+                return min(1.0, os.getloadavg()[0] / (os.cpu_count() or 1))
+            return None
+        previous, self._cpu_times = self._cpu_times, times
+        if previous is None:
+            return None
+        busy = times[0] - previous[0]
+        total = times[1] - previous[1]
+        return busy / total if total > 0 else None
+
+    def memory_available(self):
+        if psutil is not None:
+            memory = psutil.virtual_memory()
+            return memory.available / memory.total
+        if os.name == 'nt':
+            return _windows_memory_available()
+        try:
+            with open("/proc/meminfo", "r") as f:
+                values = {key: int(value.split()[0]) for key, _, value in (line.partition(":") for line in f) if value}
+            return values["MemAvailable"] / values["MemTotal"]
+        except (OSError, KeyError, ValueError, ZeroDivisionError):
+            return None
+
+def _system_cpu_times():
+    # (занятое время, общее время) с момента запуска системы
+    if os.name == 'nt':
+        return _windows_cpu_times()
+    try:
+        with open("/proc/stat", "r") as f:
+            values = [int(value) for value in f.readline().split()[1:]]
+    except (OSError, ValueError):
+        return None
+    idle = values[3] + (values[4] if len(values) > 4 else 0)  # idle + iowait
+    total = sum(values[:8])  # guest уже учтен в user
+    return total - idle, total
+
+def _windows_cpu_times():
+    import ctypes
+    from ctypes import wintypes
+    idle, kernel, user = wintypes.FILETIME(), wintypes.FILETIME(), wintypes.FILETIME()
+    if not ctypes.windll.kernel32.GetSystemTimes(ctypes.byref(idle), ctypes.byref(kernel), ctypes.byref(user)):
+        return None
+    idle, kernel, user = (value.dwHighDateTime << 32 | value.dwLowDateTime for value in (idle, kernel, user))
+    total = kernel + user  # Время ядра уже включает простой
+    return total - idle, total
+
+def _windows_memory_available():
+    import ctypes
+
+    class MEMORYSTATUSEX(ctypes.Structure):
+        _fields_ = [("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong)]
+
+    status = MEMORYSTATUSEX()
+    status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+    if not ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+        return None
+    return status.ullAvailPhys / status.ullTotalPhys
+
+class AdaptiveConcurrency:
+    # Сколько задач конвертации работают одновременно, в пределах floor..ceiling. Начинаем с floor и
+    # добавляем по одной задаче, пока процессор не загружен и в очереди есть задачи. После каждого
+    # увеличения сравниваем суммарную скорость кодирования - сколько секунд видео закодировано за секунду
+    # по всем задачам: если она почти не выросла, процессы только мешают друг другу, и лишняя задача убирается.
+    # speed= из ffmpeg для этого не подходит: это среднее с начала файла, у только что запущенного
+    # процесса оно завышено, поэтому скорость считается по приросту out_time за интервал.
+    # При нехватке памяти число задач уменьшается. Запущенные задачи не прерываются: при уменьшении
+    # новые задачи просто не начинаются, пока работающих не станет меньше предела
+    INTERVAL = 5.0  # Секунд между решениями
+    SETTLE_INTERVALS = 2  # После изменения ждем, пока новые процессы разгонятся
+    COOLDOWN_INTERVALS = 12  # После отката не пробуем увеличивать около минуты
+    CPU_LOW = 0.85  # Ниже этой загрузки можно добавить задачу
+    MEMORY_LOW = 0.10  # Доля доступной памяти, ниже которой число задач уменьшается
+    MIN_GAIN = 0.05  # Минимальный прирост суммарной скорости, ради которого стоит держать лишний процесс
+
+    def __init__(self, floor=1, ceiling=None, monitor=None):
+        self.floor = max(1, int(floor))
+        self.ceiling = max(self.floor, int(ceiling or os.cpu_count() or 1))
+        self.monitor = monitor if monitor is not None else LoadMonitor()
+        self.limit = self.floor
+        self.active = 0
+        self.positions = {}  # Индекс задачи -> сколько секунд видео уже закодировано
+        self.encoded = 0.0  # Секунд видео, закодированных всеми задачами
+        self._window = (0.0, time.monotonic())  # (encoded, время) в начале интервала измерения
+        self.stopped = False
+        self._baseline = None  # (предел, суммарная скорость) перед последним увеличением
+        self._wait = 0  # Сколько интервалов еще не принимать решений
+        self._cooldown = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        # Ждет свободного места; после stop() пропускает сразу, чтобы потоки могли завершиться
+        with self._condition:
+            while self.active >= self.limit and not self.stopped:
+                self._condition.wait()
+            self.active += 1
+
+    def release(self):
+        with self._condition:
+            self.active -= 1
+            self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self.stopped = True
+            self._condition.notify_all()
+
+    def report_progress(self, index, out_time):
+        if out_time is None:
+            return
+        with self._condition:
+            previous = self.positions.get(index, 0.0)
+            if out_time > previous:
+                self.encoded += out_time - previous
+                self.positions[index] = out_time
+
+    def job_finished(self, index):
+        with self._condition:
+            self.positions.pop(index, None)
+
+    def throughput(self):
+        # Суммарная скорость (во сколько раз быстрее реального времени) с предыдущего вызова
+        with self._condition:
+            now = time.monotonic()
+            encoded, start = self._window
+            self._window = (self.encoded, now)
+            return (self.encoded - encoded) / (now - start) if now > start else 0.0
+
+    def update(self, pending):
+        # Вызывается раз в INTERVAL секунд. pending - сколько задач ждет в очереди.
+        # Возвращает (новый предел, причина), если предел изменился, иначе None
+        cpu, memory = self.monitor.sample()
+        change = self.decide(cpu, memory, pending, self.throughput())
+        if change is not None:
+            with self._condition:
+                self.limit = change[0]
+                self._condition.notify_all()
+        return change
+
+    def decide(self, cpu, memory, pending, throughput):
+        limit = self.limit
+        self._cooldown = max(0, self._cooldown - 1)
+        if memory is not None and memory < self.MEMORY_LOW:
+            self._baseline = None
+            if limit > self.floor:
+                self._wait = self.SETTLE_INTERVALS
+                return limit - 1, f"мало памяти: доступно {memory:.0%}"
+            return None
+
+        if self._wait:
+            self._wait -= 1
+            return None
+
+        if self._baseline is not None:
+            base_limit, base_throughput = self._baseline
+            self._baseline = None
+            if self.active >= limit and throughput < base_throughput * (1 + self.MIN_GAIN):
+                self._cooldown = self.COOLDOWN_INTERVALS
+                self._wait = self.SETTLE_INTERVALS
+                return base_limit, f"скорость не выросла: {base_throughput:.2f}x -> {throughput:.2f}x"
+
+        memory_ok = memory is None or memory >= 2 * self.MEMORY_LOW
+        cpu_ok = cpu is None or cpu < self.CPU_LOW
+        if pending and self.active >= limit and limit < self.ceiling and cpu_ok and memory_ok and not self._cooldown:
+            self._baseline = (limit, throughput)
+            self._wait = self.SETTLE_INTERVALS
+            return limit + 1, f"процессор загружен на {cpu:.0%}" if cpu is not None else "есть задачи в очереди"
+        return None
+
+    def run(self, pending, stop_event, on_change=None, paused=None):
+        # Цикл решений в отдельном потоке, пока не установлен stop_event. pending() - длина очереди,
+        # paused() - пауза пакета: приостановленные процессы не кодируют, и их скорость ничего не значит
+        while not stop_event.wait(self.INTERVAL):
+            if paused is not None and paused():
+                self.throughput()  # Интервал с паузой не сравниваем с остальными
+                continue
+            change = self.update(pending())
+            if change is not None and on_change:
+                on_change(*change)
@@ -0,0 +1,128 @@
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Optional
+import hashlib
+import json
+import os
+import threading
+import time
+
+@dataclass
+class ConvertJob:
+    # Всё, что нужно для конвертации одного файла. Не содержит ссылок на виджеты,
+    # поэтому задачу можно сохранить в файл и выполнить в другом процессе или на другой машине.
+    index: int
+    input_file: str
+    output_file: str
+    codec: str
+    crf: int
+    preset: str
+    fps: Optional[float] = None  # None - FPS исходного файла
+    fast_path: bool = False  # Копировать потоки, которые уже подходят, вместо перекодирования
+
+    def to_dict(self):
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{key: data[key] for key in cls.__dataclass_fields__ if key in data})
+
+    def key(self):
+        # Ключ задачи для журнала: не зависит от номера строки, но меняется вместе с параметрами кодирования
+        data = self.to_dict()
+        del data["index"]
+        data["input_file"] = os.path.normcase(os.path.abspath(self.input_file))
+        data["output_file"] = os.path.normcase(os.path.abspath(self.output_file))
+        return hashlib.sha1(json.dumps(data, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def partial_file(self):
+        # Временный файл, в который пишет ffmpeg; после успешного завершения он переименовывается в output_file,
+        # поэтому недописанный файл никогда не выглядит готовым
+        root, ext = os.path.splitext(self.output_file)
+        return f"{root}.part{ext}"
+
+def build_jobs(input_files, output_names, output_dir, codec, crf, preset, fps=None, fast_path=False, indexes=None):
+    # indexes - номера задач, например номера строк во входном списке, где кроме файлов есть ссылки;
+    # по умолчанию задачи нумеруются подряд
+    if len(output_names) != len(input_files):
+        raise ValueError(f"количество выходных имен ({len(output_names)}) не совпадает "
+                         f"с количеством входных файлов ({len(input_files)})")
+    if indexes is None:
+        indexes = range(len(input_files))
+
+    return [ConvertJob(index, input_file, os.path.join(output_dir, output_name.strip() + ".mp4"), codec, crf, preset, fps, fast_path)
+            for index, input_file, output_name in zip(indexes, input_files, output_names)]
+
+class JobQueue:
+    # Потокобезопасная очередь задач. Пока очередь не закрыта, get() ждет новые задачи,
+    # поэтому задачи можно добавлять во время работы конвертера.
+    def __init__(self, jobs=(), closed=True):
+        now = time.monotonic()
+        self._jobs = deque((job, now) for job in jobs)  # (задача, когда поставлена в очередь)
+        self.total = len(self._jobs)  # Сколько задач было добавлено за всё время
+        self._closed = closed
+        self._condition = threading.Condition()
+
+    def put(self, job):
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("очередь задач закрыта")
+            self._jobs.append((job, time.monotonic()))
+            self.total += 1
+            self._condition.notify()
+
+    def close(self):
+        # Новых задач не будет: get() вернет None, когда очередь опустеет
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def cancel(self):
+        # Отмена пакета: очередь закрывается, задачи, которые еще не начались, убираются из нее и возвращаются
+        with self._condition:
+            self._closed = True
+            jobs = [job for job, _ in self._jobs]
+            self._jobs.clear()
+            self._condition.notify_all()
+            return jobs
+
+    def is_closed(self):
+        with self._condition:
+            return self._closed
+
+    def get(self):
+        return self.get_with_wait()[0]
+
+    def get_with_wait(self):
+        # Задача и сколько секунд она простояла в очереди; (None, 0), когда задач больше не будет
+        with self._condition:
+            while not self._jobs and not self._closed:
+                self._condition.wait()
+            if not self._jobs:
+                return None, 0
+            job, queued_at = self._jobs.popleft()
+            return job, time.monotonic() - queued_at
+
+    def jobs(self):
+        with self._condition:
+            return [job for job, _ in self._jobs]
+
+    def __len__(self):
+        with self._condition:
+            return len(self._jobs)
+
+    def shard(self, shard_index, shard_count):
+        # Часть задач для одного из shard_count процессов или машин; разбиение зависит только от номера задачи
+        return JobQueue([job for job in self.jobs() if job.index % shard_count == shard_index])
+
+    def save(self, path):
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for job in self.jobs():
+                f.write(json.dumps(job.to_dict(), ensure_ascii=False) + "\n")
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls([ConvertJob.from_dict(json.loads(line)) for line in f if line.strip()])
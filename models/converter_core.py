@@ -0,0 +1,506 @@
+from models.adaptive_concurrency import AdaptiveConcurrency
+from models.dedup import dedup_index, link_or_copy
+from models.encode_plan import plan_streams, TRANSCODE
+from models.ffmpeg_command import build_convert_command
+from models.ffmpeg_progress import run_ffmpeg, Throttle
+from models.media_cache import audio_streams, media_cache, video_fps
+from models.preflight import Preflight
+from models.process_control import ConvertControl
+from models.process_utils import sibling_tool_path
+from models.segment_encoder import SegmentEncoder
+from models.telemetry import telemetry
+import os
+import re
+import threading
+import time
+
+class VideoConverter:
+    # Конвертация задач из JobQueue без Qt: используется ConvertVideoThread и консольным режимом
+    _DURATION_RX = re.compile(r"Duration: (\d{2}):(\d{2}):(\d{2}\.\d+)")
+    PROGRESS_INTERVAL = 0.25  # Не чаще четырех обновлений прогресса в секунду на задачу
+    SEGMENT_MIN_DURATION = 600  # Файлы короче 10 минут кодируются одним процессом
+
+    def __init__(self, ffmpeg_path, max_jobs=1, on_progress=None, on_status=None, on_job_progress=None, on_job_status=None,
+                 journal=None, resume=False, segment_workers=0, preflight=True, on_preflight=None, min_jobs=None,
+                 dedup=False):
+        self.ffmpeg_path = ffmpeg_path
+        self.max_jobs = max(1, int(max_jobs))  # Количество одновременно запущенных процессов ffmpeg
+        # С min_jobs число одновременных задач подбирается по нагрузке в пределах min_jobs..max_jobs
+        self.concurrency = AdaptiveConcurrency(min_jobs, self.max_jobs) if min_jobs is not None and min_jobs < self.max_jobs else None
+        self.on_progress = on_progress  # (общий прогресс)
+        self.on_status = on_status  # (сообщение)
+        self.on_job_progress = on_job_progress  # (индекс задачи, прогресс задачи)
+        self.on_job_status = on_job_status  # (индекс задачи, сообщение)
+        self.journal = journal  # JobJournal или None
+        self.resume = resume  # Пропускать задачи, которые по журналу уже готовы
+        self.segment_workers = segment_workers  # Процессов ffmpeg на один длинный файл; 0 или 1 - не делить файлы
+        self.preflight = preflight  # Проверить пакет до запуска первого ffmpeg
+        self.on_preflight = on_preflight  # (PreflightReport)
+        self.preflight_report = None
+        self.dedup = dedup  # Не кодировать повторно файл с тем же содержимым и параметрами, а взять готовый результат
+        self.control = ConvertControl()  # Пауза и отмена; создается заранее, чтобы отмена до запуска тоже сработала
+        self.job_queue = None
+        self.job_progress = {}
+        self.running = {}  # Индекс задачи -> (порядковый номер, имя файла) для задач, которые сейчас конвертируются
+        self.outputs = {}  # Файл результата -> индекс задачи, которая его пишет в этом запуске
+        self.started_files = 0
+        self.finished_files = 0  # Задачи с итоговым статусом, какой бы он ни был
+        self.done_files = 0  # Успешно сконвертированные, в том числе взятые из готовых результатов
+        self.failed_files = 0
+        self.skipped_files = 0
+        self.cancelled_files = 0
+        self.deduplicated_files = 0
+        self._lock = threading.Lock()
+
+    def run(self, job_queue):
+        # Обрабатывает задачи, пока очередь не закрыта и не опустела. Одновременно работает
+        # не больше max_jobs процессов ffmpeg
+        self.job_queue = job_queue
+        self.job_progress = {}
+        self.outputs = {}
+        self.started_files = 0
+        self.finished_files = 0
+        self.done_files = 0
+        self.failed_files = 0
+        self.skipped_files = 0
+        self.cancelled_files = 0
+        self.deduplicated_files = 0
+
+        if self.journal is not None:
+            self.journal.compact()
+            for job in job_queue.jobs():
+                if not (self.resume and self.journal.is_complete(job)):
+                    self.journal.record(job, self.journal.PENDING)
+
+        # Задачи, которые добавятся позже (после загрузки), проверяются уже при конвертации
+        self.preflight_report = self.run_preflight(job_queue.jobs()) if self.preflight else None
+
+        workers = [threading.Thread(target=self._worker, daemon=True) for _ in range(self.max_jobs)]
+        for worker in workers:
+            worker.start()
+        adapt_stop = threading.Event()
+        if self.concurrency is not None:
+            self._status(f"render: параллельных конвертаций: {self.concurrency.limit}, подбирается по нагрузке "
+                         f"до {self.concurrency.ceiling}")
+            threading.Thread(target=self.concurrency.run, args=(lambda: len(job_queue), adapt_stop, self._on_concurrency_change,
+                                                                lambda: self.control.paused), daemon=True).start()
+        for worker in workers:
+            worker.join()
+        adapt_stop.set()
+
+        media_cache.save()
+        dedup_index.save()
+        self._progress(100)
+        self._status(self.summary())
+        return self.failed_files == 0 and self.cancelled_files == 0
+
+    def summary(self):
+        # Итог пакета: ошибки считаются отдельно от готовых задач и видны в итоговом статусе
+        total_files = self.job_queue.total if self.job_queue is not None else 0
+        counts = [f"готово: {self.done_files}", f"ошибок: {self.failed_files}"]
+        for label, count in (("пропущено", self.skipped_files), ("дубликатов", self.deduplicated_files),
+                             ("отменено", self.cancelled_files)):
+            if count:
+                counts.append(f"{label}: {count}")
+        state = "cancelled" if self.control.cancelled else "error" if self.failed_files else "done"
+        return f"render: ({self.finished_files}/{total_files}) {', '.join(counts)} status: {state}"
+
+    def pause_jobs(self, index=None):
+        # index=None - весь пакет. Методы управления вызываются из другого потока (GUI, обработчик Ctrl+C)
+        indexes = self.control.pause(index)
+        if index is None:
+            self._status(f"render: пауза, приостановлено задач: {len(indexes)}")
+        self._control_status(indexes, "paused")
+
+    def resume_jobs(self, index=None):
+        indexes = self.control.resume(index)
+        if index is None:
+            self._status("render: продолжение")
+        self._control_status(indexes, "resumed")
+
+    def cancel_jobs(self, index=None):
+        # Запущенные процессы ffmpeg завершаются, их недописанные файлы удаляют потоки задач.
+        # При отмене пакета задачи, которые еще не начались, сразу убираются из очереди
+        self.control.cancel(index)
+        if index is None and self.concurrency is not None:
+            self.concurrency.stop()
+        if index is None and self.job_queue is not None:
+            total_files = self.job_queue.total
+            for job in self.job_queue.cancel():
+                self._record_telemetry(job, "cancelled")
+                self._cancelled(job, job.index + 1, total_files)
+
+    def _control_status(self, indexes, state):
+        total_files = self.job_queue.total if self.job_queue is not None else 1
+        with self._lock:
+            running = [(index, self.running[index]) for index in indexes if index in self.running]
+        for index, (position, filename) in running:
+            self._job_status(index, f"render: ({position}/{total_files}) name: {filename} status: {state}")
+
+    def run_preflight(self, jobs):
+        self._status(f"preflight: проверка файлов: {len(jobs)}")
+        with telemetry.span("preflight", "convert", jobs=len(jobs)):
+            report = Preflight(sibling_tool_path(self.ffmpeg_path, "ffprobe"), journal=self.journal, resume=self.resume).run(jobs)
+        for line in report.lines()[1:]:
+            print(line)
+        self._status(report.summary())
+        if self.on_preflight:
+            self.on_preflight(report)
+        return report
+
+    def _on_concurrency_change(self, limit, reason):
+        telemetry.record("concurrency", "convert", time.perf_counter(), 0, limit=limit, reason=reason)
+        self._status(f"render: параллельных конвертаций: {limit} ({reason})")
+
+    def _worker(self):
+        while True:
+            self.control.wait_while_paused()  # На паузе пакета новые задачи не начинаются
+            if self.concurrency is not None:
+                self.concurrency.acquire()  # Потоков max_jobs, но работают не больше текущего предела
+            try:
+                job, queue_wait = self.job_queue.get_with_wait()
+                if job is None:
+                    return
+                telemetry.record("queue", "queue", time.perf_counter() - queue_wait, queue_wait, index=job.index)
+                with self._lock:
+                    self.started_files += 1
+                    position = self.started_files  # Порядковый номер задачи в этом запуске, для статуса
+                self.convert(job, position, queue_wait)
+            finally:
+                if self.concurrency is not None:
+                    self.concurrency.release()
+
+    def convert(self, job, position=None, queue_wait=None):
+        total_files = self.job_queue.total if self.job_queue is not None else 1
+        index = job.index
+        position = position or index + 1
+        filename = os.path.basename(job.input_file)
+        ok = False
+
+        if self.resume and self.journal is not None and self.journal.is_complete(job):
+            self._record_telemetry(job, "skipped", queue_wait=queue_wait)
+            return self._skip(job, position, total_files)
+        reason = self.preflight_report.error(job) if self.preflight_report is not None else None
+        if reason is None:
+            reason = self._output_error(job)
+        if reason is not None:
+            self._record_telemetry(job, "rejected", queue_wait=queue_wait)
+            return self._reject(job, position, total_files, reason)
+        processes = self.control.group(index)
+        if processes.cancelled:
+            self.control.release(index)
+            self._record_telemetry(job, "cancelled", queue_wait=queue_wait)
+            return self._cancelled(job, position, total_files)
+
+        dedup_key = dedup_index.job_key(job) if self.dedup else None
+        owns_key = False
+        if dedup_key is not None:
+            existing, owns_key = self._claim_output(dedup_key, processes)
+            if existing is not None and self._reuse_output(job, existing, position, total_files):
+                self.control.release(index)
+                self._record_telemetry(job, "deduplicated", queue_wait=queue_wait)
+                return True
+
+        with self._lock:
+            self.running[index] = (position, filename)
+        if self.journal is not None:
+            self.journal.record(job, self.journal.RUNNING)
+        partial_file = job.partial_file()
+        mode = None
+        probe_time = encode_time = None
+        stream_state = {"duration": None}
+
+        try:
+            probe_start = time.perf_counter()
+            info = self.probe(job.input_file)
+            probe_time = time.perf_counter() - probe_start
+            telemetry.record("probe", "convert", probe_start, probe_time, index=index)
+
+            # Используем пользовательский FPS, если он задан
+            if job.fps is not None:
+                fps = job.fps
+                print(f"Принудительный FPS: {fps} для видео {filename}")
+            else:
+                # Если пользовательский FPS не задан, извлекаем FPS из видео
+                fps = video_fps(info)
+                if fps is None:
+                    print(f"Не удалось извлечь FPS для {filename}, используем FPS по умолчанию.")
+                    fps = 30  # Можно установить FPS по умолчанию, если ничего не извлечено
+
+            # В быстром режиме подходящие потоки копируются без перекодирования
+            video_copy, audio_copy, mode = plan_streams(info, job.codec, job.fps) if job.fast_path else (False, False, TRANSCODE)
+
+            print(f"Обработка файла: {job.input_file} -> {job.output_file} ({mode})")  # Для отладки
+
+            # Длительность берем из кэша метаданных, а если ffprobe не справился - из заголовка ffmpeg в stderr
+            stream_state["duration"] = info.get("duration") if info else None
+            throttle = Throttle(self.PROGRESS_INTERVAL)
+
+            def on_stderr_line(line):
+                if stream_state["duration"] is None and 'Duration:' in line:
+                    stream_state["duration"] = self._get_duration(line)
+
+            def on_time(out_time, speed, force=False):
+                if self.concurrency is not None:
+                    self.concurrency.report_progress(index, out_time)
+                if throttle.ready(force=force):
+                    self._report_time(index, position, total_files, filename, out_time, speed, stream_state["duration"])
+
+            # ffmpeg пишет во временный файл; готовый файл появляется только после успешного завершения
+            encode_start = time.perf_counter()
+            if self.use_segments(info, video_copy):
+                print(f"Кодирование по частям: {filename}, процессов: {self.segment_workers}")
+                encoder = SegmentEncoder(self.ffmpeg_path, self.segment_workers, on_progress=on_time, processes=processes)
+                ok = encoder.encode(job.input_file, partial_file, job.codec, job.crf, job.preset, fps, stream_state["duration"],
+                                    has_audio=bool(audio_streams(info)), audio_copy=audio_copy)
+            else:
+                command = build_convert_command(self.ffmpeg_path, job.input_file, partial_file, job.codec, job.crf, job.preset, fps,
+                                                overwrite=True, progress_pipe=True, video_copy=video_copy, audio_copy=audio_copy)
+                returncode, stderr_tail = run_ffmpeg(command, lambda snapshot: on_time(snapshot["out_time"], snapshot["speed"], snapshot["end"]),
+                                                     on_stderr_line, processes=processes)
+                ok = returncode == 0
+                if not ok and not processes.cancelled:
+                    print(f"ffmpeg завершился с кодом {returncode} для {filename}:\n{stderr_tail}")
+            encode_time = time.perf_counter() - encode_start
+            telemetry.record("encode", "convert", encode_start, encode_time, index=index, mode=mode, ok=ok)
+
+            if ok:
+                os.replace(partial_file, job.output_file)
+        except Exception as e:
+            # Ошибка одной задачи не должна останавливать остальные
+            print(f"Ошибка конвертации {filename}: {e}")
+
+        if owns_key:
+            if ok:
+                dedup_index.record(dedup_key, job.output_file)
+            dedup_index.release(dedup_key)  # Задачи с тем же содержимым ждали этот результат
+        self.control.release(index)
+        if self.concurrency is not None:
+            self.concurrency.job_finished(index)
+        with self._lock:
+            self.running.pop(index, None)
+        if not ok and processes.cancelled:
+            # Процесс завершен по отмене: недописанный файл удаляется, в журнале задача остается незавершенной
+            _remove_file(partial_file)
+            self._record_telemetry(job, "cancelled", mode, queue_wait, probe_time, encode_time, stream_state["duration"])
+            return self._cancelled(job, position, total_files)
+
+        self._record_result(job, ok, partial_file)
+        self._record_telemetry(job, "done" if ok else "error", mode, queue_wait, probe_time, encode_time, stream_state["duration"])
+
+        # У задачи один итоговый статус: done или error
+        self.update_job_progress(index, 100)
+        with self._lock:
+            if ok:
+                self.done_files += 1
+            else:
+                self.failed_files += 1
+            self.finished_files += 1
+            finished_files = self.finished_files
+        state = "done" if ok else "error"
+        self._job_status(index, f"render: ({position}/{total_files}) "
+                                f"remaining: 00:00:00 "
+                                f"name: {filename} status: {state}")
+        self._status(f"render: ({finished_files}/{total_files}) "
+                     f"remaining: 00:00:00 "
+                     f"name: {filename} status: {state}")
+        return ok
+
+    def use_segments(self, info, video_copy):
+        # По частям кодируем только длинные файлы, которые действительно перекодируются
+        duration = info.get("duration") if info else None
+        return (self.segment_workers > 1 and not video_copy and duration is not None
+                and duration >= self.SEGMENT_MIN_DURATION)
+
+    def _report_time(self, index, position, total_files, filename, out_time, speed, total_duration):
+        remaining_time = self.calculate_remaining_time(out_time, speed, total_duration)
+        self._job_status(index, f"render: ({position}/{total_files}) "
+                                f"remaining: {self.format_time(remaining_time)} "
+                                f"name: {filename}")
+
+        progress = self._get_progress(out_time, total_duration)
+        if progress is not None:
+            self.update_job_progress(index, progress)
+
+    def _skip(self, job, position, total_files):
+        filename = os.path.basename(job.input_file)
+        self.update_job_progress(job.index, 100)
+        with self._lock:
+            self.skipped_files += 1
+            self.finished_files += 1
+            finished_files = self.finished_files
+        self._job_status(job.index, f"render: ({position}/{total_files}) name: {filename} status: skipped")
+        self._status(f"render: ({finished_files}/{total_files}) name: {filename} status: skipped")
+        return True
+
+    def _output_error(self, job):
+        # Предварительная проверка видит только задачи, которые были в очереди при запуске. Задачи, добавленные
+        # позже (скачанные во время работы), и запуск без проверки тоже не должны перезаписать вход или чужой результат
+        output_key = os.path.normcase(os.path.abspath(job.output_file))
+        if output_key == os.path.normcase(os.path.abspath(job.input_file)):
+            return "результат совпадает со входным файлом"
+        with self._lock:
+            owner = self.outputs.setdefault(output_key, job.index)
+        if owner != job.index:
+            return f"имя результата совпадает с задачей {owner + 1}: {os.path.basename(job.output_file)}"
+        return None
+
+    def _claim_output(self, key, processes):
+        # Возвращает (готовый результат или None, должна ли задача сама получить результат для ключа).
+        # Если такой же файл сейчас кодирует другая задача, ждем ее и берем ее результат
+        while True:
+            existing = dedup_index.lookup(key)
+            if existing is not None:
+                return existing, False
+            event = dedup_index.claim(key)
+            if event is None:
+                return None, True
+            while not event.wait(0.5):
+                if processes.cancelled:
+                    return None, False
+
+    def _reuse_output(self, job, existing, position, total_files):
+        # Результат для того же содержимого и параметров уже есть: ссылка на него вместо кодирования
+        filename = os.path.basename(job.input_file)
+        try:
+            if os.path.normcase(existing) == os.path.normcase(os.path.abspath(job.output_file)):
+                how = "уже готов"
+            else:
+                how = "жесткая ссылка" if link_or_copy(existing, job.output_file) else "копия"
+        except OSError as e:
+            print(f"Не удалось использовать готовый результат {existing} для {filename}: {e}")
+            return False
+
+        print(f"Дубликат: {filename} -> {job.output_file} ({how}: {existing})")
+        self._record_result(job, True, job.partial_file())
+        self.update_job_progress(job.index, 100)
+        with self._lock:
+            self.deduplicated_files += 1
+            self.done_files += 1
+            self.finished_files += 1
+            finished_files = self.finished_files
+        self._job_status(job.index, f"render: ({position}/{total_files}) name: {filename} status: done")
+        self._status(f"render: ({finished_files}/{total_files}) name: {filename} ({how}: {os.path.basename(existing)}) status: done")
+        return True
+
+    def _cancelled(self, job, position, total_files):
+        filename = os.path.basename(job.input_file)
+        print(f"Отменено: {filename}")
+        if self.journal is not None:
+            self.journal.record(job, self.journal.CANCELLED)
+        self.update_job_progress(job.index, 100)
+        with self._lock:
+            self.cancelled_files += 1
+            self.finished_files += 1
+            finished_files = self.finished_files
+        self._job_status(job.index, f"render: ({position}/{total_files}) name: {filename} status: cancelled")
+        self._status(f"render: ({finished_files}/{total_files}) name: {filename} status: cancelled")
+        return False
+
+    def _record_telemetry(self, job, status, mode=None, queue_wait=None, probe_time=None, encode_time=None, duration=None):
+        # Коэффициент реального времени: сколько секунд видео кодируется за секунду работы
+        telemetry.record_job(index=job.index, input_file=job.input_file, output_file=job.output_file, codec=job.codec,
+                             status=status, mode=mode, queue_wait=queue_wait, probe_time=probe_time, encode_time=encode_time,
+                             duration=duration, realtime_factor=duration / encode_time if duration and encode_time else None,
+                             bytes_in=_file_size(job.input_file), bytes_out=_file_size(job.output_file) if status == "done" else None)
+
+    def _reject(self, job, position, total_files, reason):
+        # Задача не прошла предварительную проверку: ffmpeg не запускается
+        filename = os.path.basename(job.input_file)
+        print(f"Пропуск {filename}: {reason}")
+        if self.journal is not None:
+            self.journal.record(job, self.journal.FAILED, reason=reason)
+        self.update_job_progress(job.index, 100)
+        with self._lock:
+            self.failed_files += 1
+            self.finished_files += 1
+            finished_files = self.finished_files
+        self._job_status(job.index, f"render: ({position}/{total_files}) name: {filename} status: error")
+        self._status(f"render: ({finished_files}/{total_files}) name: {filename} status: error: {reason}")
+        return False
+
+    def _record_result(self, job, ok, partial_file):
+        if not ok:
+            _remove_file(partial_file)
+        if self.journal is None:
+            return
+        if not ok:
+            self.journal.record(job, self.journal.FAILED)
+            return
+        try:
+            input_stat = os.stat(job.input_file)
+            self.journal.record(job, self.journal.DONE, output_size=os.path.getsize(job.output_file),
+                                input_size=input_stat.st_size, input_mtime=input_stat.st_mtime)
+        except OSError as e:
+            print(f"Не удалось записать результат {job.output_file} в журнал: {e}")
+
+    def update_job_progress(self, index, progress):
+        # Прогресс пакета - среднее по всем задачам
+        with self._lock:
+            if self.job_progress.get(index) == progress:
+                return
+            self.job_progress[index] = progress
+            total = self.job_queue.total if self.job_queue is not None else 1
+            total_progress = sum(self.job_progress.values()) // max(total, 1)
+        if self.on_job_progress:
+            self.on_job_progress(index, progress)
+        self._progress(total_progress)
+
+    def _progress(self, progress):
+        if self.on_progress:
+            self.on_progress(progress)
+
+    def _status(self, message):
+        if self.on_status:
+            self.on_status(message)
+
+    def _job_status(self, index, message):
+        if self.on_job_status:
+            self.on_job_status(index, message)
+
+    def probe(self, input_file):
+        # Метаданные берем из общего кэша, ffprobe запускается только если файла там нет
+        return media_cache.probe(input_file, sibling_tool_path(self.ffmpeg_path, "ffprobe"))
+
+    def get_video_fps(self, input_file):
+        return video_fps(self.probe(input_file))
+
+    def _get_duration(self, line):
+        match = self._DURATION_RX.search(line)
+        if match:
+            hours, minutes, seconds = map(float, match.groups())
+            return hours * 3600 + minutes * 60 + seconds
+        return None
+
+    def calculate_remaining_time(self, current_time, speed, total_duration):
+        if not speed or speed <= 0 or current_time is None or not total_duration:
+            return 0
+
+        # Оставшееся время в секундах: остаток видео делим на скорость кодирования
+        remaining_seconds = total_duration - current_time
+        if remaining_seconds < 0:
+            return 0
+        return remaining_seconds / speed
+
+    def format_time(self, seconds):
+        hours, remainder = divmod(int(seconds), 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return f"{hours:02}:{minutes:02}:{seconds:02}"
+
+    def _get_progress(self, current_time, total_duration):
+        if current_time is None or not total_duration:
+            return None
+        return max(0, min(100, int(current_time / total_duration * 100)))
+
+def _remove_file(path):
+    if os.path.exists(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def _file_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
@@ -0,0 +1,159 @@
+from collections import OrderedDict
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+CHUNK_SIZE = 1 << 20  # Сколько байт читается с начала и с конца файла для отпечатка
+
+class DedupIndex:
+    # Постоянный индекс уже полученных результатов: отпечаток входного файла вместе с параметрами
+    # кодирования -> файл результата, ссылка -> скачанный файл. Запись действительна, пока файл
+    # на месте и его размер не изменился. Хранится так же, как кэш метаданных: JSON, подмена через временный файл
+    def __init__(self, index_file="dedup_index.json", max_entries=20000):
+        self.index_file = index_file
+        self.max_entries = max_entries
+        self.entries = OrderedDict()  # ключ -> {"path": ..., "size": ...}
+        self.fingerprints = {}  # (путь, размер, время изменения) -> отпечаток, только в памяти
+        self.in_flight = {}  # ключ -> threading.Event, пока результат получает другой поток
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.exists(self.index_file):
+            return
+        try:
+            with open(self.index_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for key, entry in data.get("entries", []):
+                self.entries[key] = entry
+        except (OSError, ValueError) as e:
+            print(f"Ошибка чтения индекса дубликатов: {e}")
+            self.entries.clear()
+
+    def fingerprint(self, file_path):
+        # Быстрый отпечаток: размер, первый и последний мегабайт. Файл целиком не читается,
+        # поэтому даже для многогигабайтных файлов это доли секунды
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        cache_key = (os.path.normcase(os.path.abspath(file_path)), stat.st_size, stat.st_mtime)
+        with self._lock:
+            fingerprint = self.fingerprints.get(cache_key)
+        if fingerprint is not None:
+            return fingerprint
+
+        digest = hashlib.sha1(str(stat.st_size).encode("ascii"))
+        try:
+            with open(file_path, "rb") as f:
+                digest.update(f.read(CHUNK_SIZE))
+                if stat.st_size > 2 * CHUNK_SIZE:
+                    f.seek(stat.st_size - CHUNK_SIZE)
+                digest.update(f.read(CHUNK_SIZE))
+        except OSError as e:
+            print(f"Не удалось прочитать {file_path} для поиска дубликатов: {e}")
+            return None
+
+        fingerprint = digest.hexdigest()
+        with self._lock:
+            self.fingerprints[cache_key] = fingerprint
+        return fingerprint
+
+    def job_key(self, job):
+        # Одинаковое содержимое с одинаковыми параметрами дает одинаковый результат, путь и номер не важны
+        fingerprint = self.fingerprint(job.input_file)
+        if fingerprint is None:
+            return None
+        params = json.dumps([fingerprint, job.codec, job.crf, job.preset, job.fps, job.fast_path])
+        return "convert:" + hashlib.sha1(params.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def url_key(url):
+        return "url:" + url.strip()
+
+    def lookup(self, key):
+        with self._lock:
+            self._load()
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            try:
+                valid = os.path.getsize(entry["path"]) == entry["size"]
+            except OSError:
+                valid = False
+            if not valid:
+                # Результат удален или изменен - запись больше не действительна
+                del self.entries[key]
+                self._dirty = True
+                return None
+            self.entries.move_to_end(key)
+            return entry["path"]
+
+    def record(self, key, path):
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return
+        with self._lock:
+            self._load()
+            self.entries[key] = {"path": os.path.abspath(path), "size": size}
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            self._dirty = True
+
+    def claim(self, key):
+        # Возвращает None, если результат для ключа получает вызывающий поток (тогда по окончании нужен release),
+        # иначе Event, который будет установлен, когда другой поток закончит
+        with self._lock:
+            event = self.in_flight.get(key)
+            if event is None:
+                self.in_flight[key] = threading.Event()
+            return event
+
+    def release(self, key):
+        with self._lock:
+            event = self.in_flight.pop(key, None)
+        if event is not None:
+            event.set()
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"entries": list(self.entries.items())}
+            self._dirty = False
+
+        temp_file = self.index_file + ".tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_file, self.index_file)
+        except OSError as e:
+            print(f"Ошибка сохранения индекса дубликатов: {e}")
+
+def link_or_copy(source, target):
+    # Жесткая ссылка не занимает места; если ее нельзя создать (другой диск, FAT/exFAT), файл копируется.
+    # Результат появляется под своим именем только целиком, как и после кодирования
+    if os.path.exists(target) and os.path.samefile(source, target):
+        return True  # Уже ссылка на тот же файл; rename между двумя ссылками на один файл ничего бы не сделал
+    root, ext = os.path.splitext(target)
+    temp_target = f"{root}.part{ext}"
+    if os.path.exists(temp_target):
+        os.remove(temp_target)
+    try:
+        os.link(source, temp_target)
+        linked = True
+    except (OSError, AttributeError):
+        shutil.copyfile(source, temp_target)
+        linked = False
+    os.replace(temp_target, target)
+    return linked
+
+dedup_index = DedupIndex()  # Общий индекс для конвертера и загрузчика
@@ -0,0 +1,227 @@
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from models.dedup import dedup_index, link_or_copy
+from models.process_control import ProcessGroup
+from models.process_utils import hidden_window_kwargs
+from urllib.parse import urlsplit
+import os
+import re
+import subprocess
+import threading
+
+DOWNLOAD_SUBDIR = "downloads"
+
+def conversion_download_dir(output_dir):
+    # Видео, которые скачиваются для конвертации, лежат в подпапке: yt-dlp часто сам скачивает mp4,
+    # и в папке результатов исходник и результат конвертации получили бы одно и то же имя
+    return os.path.join(output_dir, DOWNLOAD_SUBDIR)
+
+class VideoDownloader:
+    _PROGRESS_RX = re.compile(r"\[download\]\s+(\d+(?:\.\d+)?)%")
+
+    def __init__(self, ytdlp_path):
+        self.ytdlp_path = ytdlp_path
+
+    def download_video(self, url, output_dir, filename_template='%(title)s.%(ext)s', proxy=None, on_progress=None, processes=None):
+        # Возвращает (успех, путь к скачанному файлу). processes - ProcessGroup, через которую загрузку можно отменить.
+        # --newline: каждая строка прогресса выводится отдельно, её можно разобрать.
+        # --print after_move:filepath печатает итоговый путь файла; --print отключает вывод прогресса,
+        # поэтому --progress включает его обратно
+        command = [self.ytdlp_path, '--newline', '--progress', '--print', 'after_move:filepath']
+
+        if proxy:
+            command += ['--proxy', proxy]
+
+        command += [url, '-o', os.path.join(output_dir, filename_template)]
+
+        file_path = None
+        try:
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                       encoding='utf-8', errors='replace', **hidden_window_kwargs())
+            if processes is not None:
+                processes.add(process)
+            try:
+                for line in process.stdout:
+                    match = self._PROGRESS_RX.search(line)
+                    if match:
+                        if on_progress:
+                            on_progress(float(match.group(1)))
+                    elif not line.startswith('[') and os.path.isfile(line.strip()):
+                        file_path = line.strip()
+                process.wait()
+            finally:
+                if processes is not None:
+                    processes.discard(process)
+        except OSError as e:
+            print(f"Ошибка при скачивании видео: {e}")
+            return False, None
+
+        if process.returncode != 0:
+            print(f"Ошибка при скачивании видео {url}: код возврата {process.returncode}")
+            return False, None
+        return True, file_path
+
+class DownloadScheduler:
+    # Одновременно скачивается не больше max_jobs ссылок и не больше max_per_host с одного сайта
+    # (по умолчанию ограничение только общее: обычно все ссылки с одного сайта).
+    # Неудачная загрузка повторяется retries раз с растущей паузой.
+    # С dedup повторная ссылка в списке скачивается один раз, а ссылка, которая уже скачивалась раньше
+    # и файл которой на месте, не скачивается совсем
+    def __init__(self, ytdlp_path, max_jobs=4, max_per_host=None, retries=3, backoff=2.0, proxy=None,
+                 on_progress=None, on_status=None, on_finished=None, dedup=False):
+        self.downloader = VideoDownloader(ytdlp_path)
+        self.max_jobs = max(1, max_jobs)
+        self.max_per_host = max(1, max_per_host or self.max_jobs)
+        self.retries = retries
+        self.backoff = backoff
+        self.proxy = proxy
+        self.on_progress = on_progress  # (индекс, процент)
+        self.on_status = on_status  # (индекс, сообщение)
+        self.on_finished = on_finished  # (индекс, url, успех, путь к файлу)
+        self.dedup = dedup
+        self.processes = ProcessGroup()  # Запущенные yt-dlp; cancel() завершает их
+        self._condition = threading.Condition()
+
+    def cancel(self):
+        # Ссылки, которые еще ждут, не запускаются, запущенные yt-dlp завершаются, повторов после ошибки нет.
+        # Можно вызывать из любого потока, в том числе до run()
+        self.processes.cancel()
+        with self._condition:
+            self._condition.notify_all()
+
+    def is_cancelled(self):
+        return self.processes.cancelled
+
+    @staticmethod
+    def host_of(url):
+        host = (urlsplit(url).hostname or "").lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def run(self, urls, output_dir, filename_templates=None):
+        # Блокирует до окончания всех загрузок, возвращает список успешно скачанных ссылок
+        filename_templates = filename_templates or {}
+        os.makedirs(output_dir, exist_ok=True)
+        pending = deque(enumerate(urls))
+        repeats = {}  # Ссылка -> индексы ее повторов в списке; они получают результат первой загрузки
+        if self.dedup:
+            first_indexes = {}
+            for index, url in list(pending):
+                if url in first_indexes:
+                    repeats.setdefault(url, []).append(index)
+                    pending.remove((index, url))
+                else:
+                    first_indexes[url] = index
+        active_hosts = Counter()
+        active = 0
+        completed = []
+
+        def job(index, url, host):
+            nonlocal active
+            try:
+                file_path = self.download(index, url, output_dir, filename_templates.get(url, '%(title)s.%(ext)s'))
+                for repeat_index in [index] + repeats.get(url, []):
+                    if file_path is not None:
+                        completed.append(url)
+                    if repeat_index != index:
+                        self._progress(repeat_index, 100.0 if file_path is not None else 0.0)
+                        if self.on_finished:
+                            self.on_finished(repeat_index, url, file_path is not None, file_path or "")
+            finally:
+                with self._condition:
+                    active -= 1
+                    active_hosts[host] -= 1
+                    self._condition.notify()
+
+        with ThreadPoolExecutor(max_workers=self.max_jobs) as executor:
+            with self._condition:
+                while pending or active:
+                    if self.is_cancelled():
+                        pending.clear()  # Дожидаемся только уже запущенных загрузок
+                        if not active:
+                            break
+                    # Берем первую ссылку, для сайта которой есть свободное место
+                    ready = None
+                    if active < self.max_jobs:
+                        for item in pending:
+                            if active_hosts[self.host_of(item[1])] < self.max_per_host:
+                                ready = item
+                                break
+
+                    if ready is None:
+                        self._condition.wait()
+                        continue
+
+                    pending.remove(ready)
+                    index, url = ready
+                    host = self.host_of(url)
+                    active += 1
+                    active_hosts[host] += 1
+                    executor.submit(job, index, url, host)
+
+        if self.dedup:
+            dedup_index.save()
+        return completed
+
+    def download(self, index, url, output_dir, filename_template):
+        # Возвращает путь к скачанному файлу ("" - если yt-dlp его не сообщил) или None при ошибке
+        file_path = self.find_downloaded(url, output_dir) if self.dedup else None
+        if file_path is not None:
+            self._progress(index, 100.0)
+            self._status(index, f"download: {url} уже скачан: {file_path} status: done")
+            if self.on_finished:
+                self.on_finished(index, url, True, file_path)
+            return file_path
+
+        for attempt in range(self.retries + 1):
+            if self.is_cancelled():
+                break
+            if attempt:
+                delay = self.backoff * 2 ** (attempt - 1)
+                self._status(index, f"download: повтор {attempt}/{self.retries} через {delay:.0f} с: {url}")
+                with self._condition:
+                    if self._condition.wait_for(self.is_cancelled, delay):  # Отмена прерывает паузу перед повтором
+                        break
+
+            self._status(index, f"download: {url}")
+            ok, file_path = self.downloader.download_video(url, output_dir, filename_template, self.proxy,
+                                                           lambda percent: self._progress(index, percent), self.processes)
+            if ok:
+                if self.dedup and file_path:
+                    dedup_index.record(dedup_index.url_key(url), file_path)
+                self._progress(index, 100.0)
+                self._status(index, f"download: {url} status: done")
+                if self.on_finished:
+                    self.on_finished(index, url, True, file_path or "")
+                return file_path or ""
+
+        self._status(index, f"download: {url} status: {'cancelled' if self.is_cancelled() else 'error'}")
+        if self.on_finished:
+            self.on_finished(index, url, False, "")
+        return None
+
+    def find_downloaded(self, url, output_dir):
+        # Файл из прошлой загрузки; если он в другой папке, в папке загрузки появляется жесткая ссылка на него
+        existing = dedup_index.lookup(dedup_index.url_key(url))
+        if existing is None:
+            return None
+        target = os.path.join(output_dir, os.path.basename(existing))
+        if os.path.normcase(os.path.abspath(target)) == os.path.normcase(existing):
+            return existing
+        try:
+            if os.path.exists(target):
+                if os.path.getsize(target) != os.path.getsize(existing):
+                    return None  # Под этим именем лежит другой файл, не трогаем его
+            else:
+                link_or_copy(existing, target)
+        except OSError as e:
+            print(f"Не удалось использовать ранее скачанный файл {existing}: {e}")
+            return None
+        return target
+
+    def _progress(self, index, percent):
+        if self.on_progress:
+            self.on_progress(index, percent)
+
+    def _status(self, index, message):
+        if self.on_status:
+            self.on_status(index, message)
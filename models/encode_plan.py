@@ -0,0 +1,42 @@
+from models.media_cache import audio_streams, video_fps, video_streams
+
+# Кодек, который получается на выходе энкодера (так его называет ffprobe)
+ENCODER_CODECS = {
+    "libx264": "h264",
+    "libx265": "hevc",
+    "h264_nvenc": "h264",
+    "hevc_nvenc": "hevc",
+    "h264_qsv": "h264",
+    "hevc_qsv": "hevc",
+}
+
+# Аудио, которое можно положить в mp4 без перекодирования
+COPY_AUDIO_CODECS = {"aac"}
+
+# Способы обработки файла в быстром режиме
+REMUX = "remux"  # Оба потока копируются, меняется только контейнер
+AUDIO_COPY = "audio copy"  # Видео кодируется, звук копируется
+VIDEO_COPY = "video copy"  # Видео копируется, звук кодируется в aac
+TRANSCODE = "transcode"
+
+def plan_streams(info, codec, fps=None):
+    # Решает по метаданным ffprobe, какие потоки можно скопировать.
+    # Возвращает (копировать видео, копировать звук, название способа)
+    if not info or not video_streams(info):
+        return False, False, TRANSCODE
+
+    video = video_streams(info)[0]
+    source_fps = video_fps(info)
+    same_fps = fps is None or (source_fps is not None and abs(source_fps - fps) < 0.01)
+    copy_video = video.get("codec_name") == ENCODER_CODECS.get(codec) and same_fps
+
+    audio = audio_streams(info)
+    copy_audio = not audio or audio[0].get("codec_name") in COPY_AUDIO_CODECS
+
+    if copy_video and copy_audio:
+        return True, True, REMUX
+    if copy_video:
+        return True, False, VIDEO_COPY
+    if copy_audio:
+        return False, True, AUDIO_COPY
+    return False, False, TRANSCODE
@@ -0,0 +1,23 @@
+# Аппаратные энкодеры не понимают -crf и пресеты x264, поэтому качество и пресет для них переводятся
+NVENC_PRESETS = {"ultrafast": "p1", "superfast": "p1", "veryfast": "p2", "faster": "p3", "fast": "p4",
+                 "medium": "p5", "slow": "p6", "slower": "p7", "veryslow": "p7"}
+QSV_PRESETS = {"ultrafast": "veryfast", "superfast": "veryfast"}
+
+AUDIO_ENCODER_OPTIONS = ['-c:a', 'aac', '-b:a', '128k']
+
+def video_encoder_options(codec, crf, preset):
+    if codec.endswith("_nvenc"):
+        return ['-c:v', codec, '-rc', 'vbr', '-cq', str(crf), '-b:v', '0', '-preset', NVENC_PRESETS.get(preset, "p4")]
+    if codec.endswith("_qsv"):
+        return ['-c:v', codec, '-global_quality', str(crf), '-preset', QSV_PRESETS.get(preset, preset)]
+    return ['-c:v', codec, '-crf', str(crf), '-preset', preset]
+
+def build_convert_command(ffmpeg_path, input_file, output_file, codec, crf, preset, fps, overwrite=False, progress_pipe=False,
+                          video_copy=False, audio_copy=False, audio=True):
+    # Команда конвертации одного файла, общая для GUI и бенчмарка.
+    # progress_pipe: прогресс в stdout блоками key=value вместо строк статистики в stderr.
+    # video_copy / audio_copy: поток копируется без перекодирования (быстрый режим); audio=False - без звука
+    options = (['-y'] if overwrite else []) + (['-progress', 'pipe:1', '-nostats'] if progress_pipe else [])
+    video = ['-c:v', 'copy'] if video_copy else ['-r', str(fps)] + video_encoder_options(codec, crf, preset)
+    audio_options = ['-an'] if not audio else ['-c:a', 'copy'] if audio_copy else AUDIO_ENCODER_OPTIONS
+    return [ffmpeg_path] + options + ['-i', input_file] + video + audio_options + [output_file]
@@ -0,0 +1,94 @@
+from collections import deque
+from models.process_utils import hidden_window_kwargs
+import subprocess
+import threading
+import time
+
+class FfmpegProgressParser:
+    # Разбор потока `-progress pipe:1`: ffmpeg пишет блоки строк key=value,
+    # каждый блок заканчивается строкой progress=continue или progress=end
+    def __init__(self):
+        self.values = {}
+
+    def feed(self, line):
+        # Возвращает снимок прогресса, когда блок закончен, иначе None
+        key, sep, value = line.strip().partition("=")
+        if not sep:
+            return None
+        if key != "progress":
+            self.values[key] = value
+            return None
+
+        values, self.values = self.values, {}
+        return {
+            "frame": _to_int(values.get("frame")),
+            "fps": _to_float(values.get("fps")),
+            "out_time": _out_time(values),
+            "speed": _to_float(values.get("speed", "").rstrip("x")),
+            "total_size": _to_int(values.get("total_size")),
+            "end": value == "end",
+        }
+
+class Throttle:
+    # Пропускает не чаще одного события за interval секунд
+    def __init__(self, interval):
+        self.interval = interval
+        self._last = None
+
+    def ready(self, force=False):
+        now = time.monotonic()
+        if force or self._last is None or now - self._last >= self.interval:
+            self._last = now
+            return True
+        return False
+
+def _out_time(values):
+    # out_time_us - микросекунды; out_time_ms в ffmpeg исторически тоже в микросекундах
+    microseconds = _to_int(values.get("out_time_us")) or _to_int(values.get("out_time_ms"))
+    return microseconds / 1000000 if microseconds is not None else None
+
+def _to_int(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def run_ffmpeg(command, on_snapshot=None, on_stderr_line=None, tail_lines=20, processes=None):
+    # Запускает ffmpeg, у которого в команде есть `-progress pipe:1`, и передает снимки прогресса в on_snapshot.
+    # stderr читается в отдельном потоке, иначе ffmpeg может заблокироваться на заполненном канале.
+    # processes - ProcessGroup задачи: через нее процесс можно приостановить или завершить из другого потока.
+    # Возвращает код завершения и последние строки stderr для сообщения об ошибке
+    if processes is not None and processes.cancelled:
+        return None, "отменено\n"
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True,
+                               **hidden_window_kwargs())
+    if processes is not None:
+        processes.add(process)
+    tail = deque(maxlen=tail_lines)
+
+    def drain_stderr():
+        for line in process.stderr:
+            tail.append(line)
+            if on_stderr_line:
+                on_stderr_line(line)
+
+    stderr_reader = threading.Thread(target=drain_stderr, daemon=True)
+    stderr_reader.start()
+
+    parser = FfmpegProgressParser()
+    for line in process.stdout:
+        snapshot = parser.feed(line)
+        if snapshot is not None and on_snapshot:
+            on_snapshot(snapshot)
+
+    process.wait()
+    stderr_reader.join()
+    if processes is not None:
+        processes.discard(process)
+    return process.returncode, "".join(tail)
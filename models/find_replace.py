@@ -1,104 +1,190 @@
-import re
-from PyQt5.QtWidgets import QComboBox
+from bisect import bisect_left
+from models.telemetry import telemetry
+from PyQt5.QtGui import QTextCursor
+from PyQt5.QtWidgets import QCheckBox, QComboBox
 from widgets.numbered_text_edit import NumberedTextEdit
+import re
 
 class FindReplace:
-    def __init__(self, text_edit: NumberedTextEdit, combo_box_find: QComboBox, combo_box_replace: QComboBox):
+    # Индекс совпадений: отсортированные позиции начала и конца каждого вхождения.
+    # Строится один раз для пары (шаблон, режим), дальше обновляется по contentsChange только
+    # на измененных строках, поэтому поиск следующего вхождения - bisect, а не проход по всему тексту.
+    # Совпадения ищутся внутри строки: в списке имен шаблон не должен захватывать перевод строки
+    MAX_HIGHLIGHTS = 2000  # Подсветка каждого вхождения - отдельный курсор документа, он сдвигается вместе с текстом
+
+    def __init__(self, text_edit: NumberedTextEdit, combo_box_find: QComboBox, combo_box_replace: QComboBox,
+                 check_box_regex: QCheckBox = None):
         self.text_edit = text_edit
         self.combo_box_find = combo_box_find
         self.combo_box_replace = combo_box_replace
-        self.current_find_index = -1  # Индекс текущего найденного слова
-        self.positions = []  # Позиции всех найденных вхождений
+        self.check_box_regex = check_box_regex
+        self.pattern = None  # Скомпилированный шаблон, для которого построен индекс
+        self.pattern_key = None  # (текст поиска, режим регулярных выражений)
+        self.starts = []  # Позиции начала вхождений в документе
+        self.ends = []  # Позиции конца вхождений
+        self.highlight = False  # Подсвечены ли все вхождения (после find_all)
 
-    def find_next(self):
+        self.text_edit.document().contentsChange.connect(self.on_contents_change)
+
+    def is_regex(self):
+        return self.check_box_regex is not None and self.check_box_regex.isChecked()
+
+    def update_index(self):
+        # Возвращает True, если есть шаблон; индекс перестраивается только при смене шаблона или режима
         text_to_find = self.combo_box_find.currentText()
         if not text_to_find:
+            self.reset_index()
+            return False
+
+        key = (text_to_find, self.is_regex())
+        if key == self.pattern_key:
+            return True
+
+        try:
+            pattern = re.compile(text_to_find if key[1] else re.escape(text_to_find))
+        except re.error as e:
+            print(f"Неверное регулярное выражение {text_to_find!r}: {e}")
+            self.reset_index()
+            return False
+
+        self.pattern = pattern
+        self.pattern_key = key
+        self.build_index()
+        if self.highlight:
+            self.set_highlight(False)  # Подсветка относилась к прежнему шаблону
+        return True
+
+    def build_index(self):
+        self.starts, self.ends = [], []
+        position = 0
+        for line in self.text_edit.toPlainText().split('\n'):
+            self.scan_line(line, position, self.starts, self.ends)
+            position += len(line) + 1
+
+    def reset_index(self):
+        self.pattern = None
+        self.pattern_key = None
+        self.starts, self.ends = [], []
+        if self.highlight:
+            self.set_highlight(False)
+
+    def scan_line(self, line, position, starts, ends):
+        for match in self.pattern.finditer(line):
+            if match.end() > match.start():  # Пустые совпадения (например, ^) нечего выделять
+                starts.append(position + match.start())
+                ends.append(position + match.end())
+
+    @telemetry.measure("gui")
+    def on_contents_change(self, position, chars_removed, chars_added):
+        if self.pattern is None:
             return
 
-        # Получаем текст из текстового поля
-        text = self.text_edit.toPlainText()
+        document = self.text_edit.document()
+        if position == 0 and chars_added >= document.characterCount() - 1:
+            # Заменен весь документ (setPlainText): Qt сообщает размеры с точностью до символа конца,
+            # проще построить индекс заново
+            self.build_index()
+            return
 
-        # Если мы еще не искали или текст изменился, обновляем список позиций
-        if self.current_find_index == -1 or not self.positions:
-            self.positions = [i.start() for i in re.finditer(re.escape(text_to_find), text)]
+        # Изменение расширяется до целых строк: старые вхождения в них выбрасываются,
+        # строки сканируются заново, а позиции после изменения сдвигаются на разницу длин
+        first_block = document.findBlock(position)
+        last_block = document.findBlock(position + chars_added)
+        if not last_block.isValid():
+            last_block = document.lastBlock()
+        region_start = first_block.position()
+        region_end = last_block.position() + last_block.length()
+        delta = chars_added - chars_removed
+
+        starts, ends = [], []
+        block = first_block
+        while block.isValid() and block.position() < region_end:
+            self.scan_line(block.text(), block.position(), starts, ends)
+            block = block.next()
+
+        low = bisect_left(self.starts, region_start)
+        high = bisect_left(self.starts, region_end - delta, low)
+        self.starts[low:] = starts + [start + delta for start in self.starts[high:]]
+        self.ends[low:] = ends + [end + delta for end in self.ends[high:]]
+
+    def select(self, number):
+        cursor = self.text_edit.textCursor()
+        cursor.setPosition(self.starts[number])
+        cursor.setPosition(self.ends[number], QTextCursor.KeepAnchor)
+        self.text_edit.setTextCursor(cursor)
 
-        if self.positions:
-            # Увеличиваем индекс и сбрасываем его, если он выходит за пределы
-            self.current_find_index = (self.current_find_index + 1) % len(self.positions)
+    def find_next(self):
+        if not self.update_index() or not self.starts:
+            return
+        number = bisect_left(self.starts, self.text_edit.textCursor().selectionEnd())
+        self.select(number if number < len(self.starts) else 0)
 
-            # Устанавливаем курсор на следующую позицию
-            cursor = self.text_edit.textCursor()
-            cursor.setPosition(self.positions[self.current_find_index])
-            cursor.movePosition(cursor.Right, cursor.KeepAnchor, len(text_to_find))
-            self.text_edit.setTextCursor(cursor)
-        else:
-            # Если вхождений не найдено, сбрасываем индекс
-            self.current_find_index = -1
+    def find_previous(self):
+        if not self.update_index() or not self.starts:
+            return
+        number = bisect_left(self.starts, self.text_edit.textCursor().selectionStart()) - 1
+        self.select(number if number >= 0 else len(self.starts) - 1)
 
     def find_all(self):
-        text_to_find = self.combo_box_find.currentText()
-        if not text_to_find:
+        # Подсвечивает все вхождения и выделяет первое
+        if not self.update_index():
             return
+        self.set_highlight(True)
+        if self.starts:
+            self.select(0)
+            print(f"Найдено вхождений: {len(self.starts)}")
 
-        # Получаем текст из текстового поля
-        text = self.text_edit.toPlainText()
+    def set_highlight(self, enabled):
+        self.highlight = enabled
+        self.refresh_highlight()
 
-        # Ищем все вхождения и запоминаем их позиции
-        self.positions = [i.start() for i in re.finditer(re.escape(text_to_find), text)]
-
-        # Теперь выделяем все найденные вхождения
-        for pos in self.positions:
-            cursor = self.text_edit.textCursor()
-            cursor.setPosition(pos)
-            cursor.movePosition(cursor.Right, cursor.KeepAnchor, len(text_to_find))
-            self.text_edit.setTextCursor(cursor)
+    def refresh_highlight(self):
+        if not hasattr(self.text_edit, "setSearchHighlights"):
+            return
+        ranges = list(zip(self.starts[:self.MAX_HIGHLIGHTS], self.ends[:self.MAX_HIGHLIGHTS])) if self.highlight else []
+        self.text_edit.setSearchHighlights(ranges)
 
-    def replace(self):
-        text_to_find = self.combo_box_find.currentText()
+    def expand(self, match):
+        # В режиме регулярных выражений замена может ссылаться на группы: \1, \g<name>
         text_to_replace = self.combo_box_replace.currentText()
+        return match.expand(text_to_replace) if self.is_regex() else text_to_replace
 
-        if not text_to_find:
+    def replace(self):
+        if not self.update_index():
             return
 
+        # Заменяем, только если выделено ровно одно из найденных вхождений; индекс обновится по contentsChange
         cursor = self.text_edit.textCursor()
+        start, end = cursor.selectionStart(), cursor.selectionEnd()
+        number = bisect_left(self.starts, start)
+        if cursor.hasSelection() and number < len(self.starts) and self.starts[number] == start and self.ends[number] == end:
+            block = self.text_edit.document().findBlock(start)
+            match = self.pattern.match(block.text(), start - block.position())
+            if match and match.end() == end - block.position():
+                try:
+                    cursor.insertText(self.expand(match))
+                except re.error as e:
+                    print(f"Неверный шаблон замены: {e}")
+                    return
+                self.text_edit.setTextCursor(cursor)
 
-        # Проверяем, есть ли выделение
-        if cursor.hasSelection():
-            # Получаем выделенный текст
-            selected_text = cursor.selectedText()
-
-            # Проверяем, совпадает ли выделенный текст с текстом, который мы ищем
-            if selected_text == text_to_find:
-                # Заменяем текст
-                cursor.insertText(text_to_replace)
-
-                # Сохраняем текущую позицию курсора после замены
-                current_position = cursor.position()
-
-                # Обновляем текстовое поле
-                updated_text = self.text_edit.toPlainText()
-
-                # Обновляем список позиций для нового текста
-                self.positions = [m.start() for m in re.finditer(re.escape(text_to_find), updated_text)]
-
-                # Находим новое положение для текущего индекса, чтобы продолжить с того места
-                # где курсор остановился
-                self.current_find_index = -1  # Сброс индекса
-                for i, pos in enumerate(self.positions):
-                    if pos >= current_position:
-                        self.current_find_index = i - 1  # Обновляем индекс для следующего поиска
-                        break
-
-        # Теперь вызываем find_next для выделения следующего вхождения
         self.find_next()
 
+    @telemetry.measure("gui")
     def replace_all(self):
-        text_to_find = self.combo_box_find.currentText()
-        text_to_replace = self.combo_box_replace.currentText()
-
-        if not text_to_find:
+        # Индекс не нужен: в режиме регулярных выражений пустые совпадения тоже заменяются (^ - префикс к каждой строке)
+        if not self.update_index():
             return
+        if self.highlight:
+            self.set_highlight(False)  # Курсоры подсветки замедляют большую правку
 
-        text = self.text_edit.toPlainText()
-        new_text = text.replace(text_to_find, text_to_replace)
-        self.text_edit.setPlainText(new_text)
\ No newline at end of file
+        # Шаблон замены передается в sub строкой, чтобы re разобрал его один раз, а не для каждого вхождения.
+        # Замена по строкам и одна правка документа: один шаг отмены, перерисовывается только измененный участок
+        text_to_replace = self.combo_box_replace.currentText()
+        template = text_to_replace if self.is_regex() else text_to_replace.replace('\\', '\\\\')
+        try:
+            lines = [self.pattern.sub(template, line) for line in self.text_edit.lines()]
+        except re.error as e:
+            print(f"Неверный шаблон замены: {e}")
+            return
+        self.text_edit.setLines(lines)
@@ -0,0 +1,85 @@
+import json
+import os
+import threading
+import time
+
+class JobJournal:
+    # Журнал состояний задач конвертации: pending / running / done / failed / cancelled.
+    # Файл только дописывается, каждая запись сразу сбрасывается на диск, поэтому после
+    # падения программы известно, какие файлы уже готовы. Оборванная последняя строка пропускается.
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"  # Отменена пользователем; при --resume запускается заново, как и незавершенная
+
+    def __init__(self, path):
+        self.path = path
+        self.states = {}  # ключ задачи -> последняя запись
+        self.record_count = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Строка, которую не успели дописать до конца
+                self.states[record["key"]] = record
+                self.record_count += 1
+
+    def record(self, job, state, **extra):
+        record = {"key": job.key(), "state": state, "time": time.time(), "output_file": job.output_file}
+        record.update(extra)
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self.states[record["key"]] = record
+            self.record_count += 1
+
+    def state(self, job):
+        with self._lock:
+            record = self.states.get(job.key())
+            return record["state"] if record else None
+
+    def is_complete(self, job):
+        # Готовой считается задача, для которой записан done, выходной файл на месте
+        # и его размер совпадает с записанным, а исходный файл с тех пор не менялся
+        with self._lock:
+            record = self.states.get(job.key())
+        if not record or record["state"] != self.DONE:
+            return False
+        try:
+            output_size = os.path.getsize(job.output_file)
+            input_stat = os.stat(job.input_file)
+        except OSError:
+            return False
+        return (output_size > 0 and output_size == record.get("output_size")
+                and input_stat.st_size == record.get("input_size")
+                and input_stat.st_mtime == record.get("input_mtime"))
+
+    def compact(self):
+        # Оставляем только последнюю запись по каждой задаче; файл подменяется целиком
+        with self._lock:
+            if self.record_count <= len(self.states):
+                return
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                for record in self.states.values():
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+            self.record_count = len(self.states)
+
+def default_journal_path(output_dir):
+    return os.path.join(output_dir, ".uconvert_journal.jsonl")
@@ -0,0 +1,156 @@
+from collections import OrderedDict
+from fractions import Fraction
+from models.process_utils import hidden_window_kwargs
+import json
+import os
+import subprocess
+import threading
+
+class MediaInfoCache:
+    # Кэш результатов ffprobe на диске. Ключ - путь к файлу, запись считается
+    # устаревшей, если изменился размер или время изменения файла.
+    STREAM_KEYS = ("index", "codec_type", "codec_name", "profile", "width", "height", "pix_fmt",
+                   "r_frame_rate", "avg_frame_rate", "sample_rate", "channels", "bit_rate")
+
+    def __init__(self, cache_file="media_cache.json", max_entries=5000):
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.probe_count = 0  # Сколько раз реально запускался ffprobe
+        self._loaded = False
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _key(self, file_path):
+        return os.path.normcase(os.path.abspath(file_path))
+
+    def _load(self):
+        # Файл кэша читаем при первом обращении, а не при импорте
+        if self._loaded:
+            return
+        self._loaded = True
+        if not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            for key, entry in data.get("entries", []):
+                self.entries[key] = entry
+        except (OSError, ValueError) as e:
+            print(f"Ошибка чтения кэша метаданных: {e}")
+            self.entries.clear()
+
+    def get(self, file_path):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        key = self._key(file_path)
+        with self._lock:
+            self._load()
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if entry["size"] != stat.st_size or entry["mtime"] != stat.st_mtime:
+                # Файл изменился - запись больше не действительна
+                del self.entries[key]
+                self._dirty = True
+                return None
+            self.entries.move_to_end(key)
+            return entry["info"]
+
+    def put(self, file_path, info):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return
+
+        key = self._key(file_path)
+        with self._lock:
+            self._load()
+            self.entries[key] = {"size": stat.st_size, "mtime": stat.st_mtime, "info": info}
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)  # Вытесняем давно не использованные записи
+            self._dirty = True
+
+    def probe(self, file_path, ffprobe_path="ffprobe"):
+        info = self.get(file_path)
+        if info is not None:
+            return info
+
+        info = self.run_ffprobe(file_path, ffprobe_path)
+        if info is not None:
+            self.put(file_path, info)
+        return info
+
+    def run_ffprobe(self, file_path, ffprobe_path="ffprobe"):
+        command = [
+            ffprobe_path, '-v', 'error', '-show_entries',
+            'format=duration,format_name,bit_rate', '-show_streams', '-of', 'json', file_path
+        ]
+
+        try:
+            with self._lock:
+                self.probe_count += 1
+            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                    universal_newlines=True, **hidden_window_kwargs())
+            # Файл, который ffprobe не смог разобрать, тоже кэшируем, чтобы не запускать его повторно
+            metadata = json.loads(result.stdout) if result.returncode == 0 else {}
+        except (OSError, ValueError) as e:
+            print(f"Ошибка запуска ffprobe для {file_path}: {e}")
+            return None
+
+        media_format = metadata.get("format", {})
+        return {
+            "duration": _to_float(media_format.get("duration")),
+            "format_name": media_format.get("format_name", ""),
+            "bit_rate": _to_float(media_format.get("bit_rate")),
+            "streams": [{key: stream[key] for key in self.STREAM_KEYS if key in stream}
+                        for stream in metadata.get("streams", [])]
+        }
+
+    def save(self):
+        # Пишем во временный файл и подменяем, чтобы не испортить кэш при падении
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"entries": list(self.entries.items())}
+            self._dirty = False
+
+        temp_file = self.cache_file + ".tmp"
+        try:
+            with open(temp_file, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_file, self.cache_file)
+        except OSError as e:
+            print(f"Ошибка сохранения кэша метаданных: {e}")
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+def parse_frame_rate(value):
+    # "30000/1001" -> 29.97
+    try:
+        rate = float(Fraction(value))
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+    return rate if rate > 0 else None
+
+def video_streams(info):
+    return [s for s in info.get("streams", []) if s.get("codec_type") == "video"]
+
+def audio_streams(info):
+    return [s for s in info.get("streams", []) if s.get("codec_type") == "audio"]
+
+def video_fps(info):
+    streams = video_streams(info) if info else []
+    if not streams:
+        return None
+    return parse_frame_rate(streams[0].get("r_frame_rate"))
+
+media_cache = MediaInfoCache()  # Общий кэш для окна информации и конвертера
@@ -0,0 +1,42 @@
+from concurrent.futures import as_completed, ThreadPoolExecutor
+from PyQt5.QtCore import pyqtSignal, QThread
+
+class MediaProbeThread(QThread):
+    row_ready = pyqtSignal(int, int, str, list)  # поколение, номер строки, путь, строка таблицы
+
+    def __init__(self, generation, jobs, row_builder, max_workers=8):
+        super(MediaProbeThread, self).__init__()
+        self.generation = generation  # Номер запроса, по нему окно отбрасывает устаревшие результаты
+        self.jobs = jobs  # Список (номер строки, путь)
+        self.row_builder = row_builder
+        self.max_workers = max_workers
+        self.cancelled = False
+
+    def cancel(self):
+        # Уже запущенные ffprobe дорабатывают, новые не запускаются
+        self.cancelled = True
+
+    def run(self):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Задачи ставятся в порядке строк, чтобы первыми заполнялись верхние строки
+            futures = {executor.submit(self.build_row, path): (index, path) for index, path in self.jobs}
+            for future in as_completed(futures):
+                if self.cancelled:
+                    break
+                index, path = futures[future]
+                row = future.result()
+                if row is not None:
+                    self.row_ready.emit(self.generation, index, path, row)
+
+            if self.cancelled:
+                for future in futures:
+                    future.cancel()
+
+    def build_row(self, path):
+        if self.cancelled:
+            return None
+        try:
+            return self.row_builder(path)
+        except Exception as e:
+            print(f"Ошибка получения информации о файле {path}: {e}")
+            return None
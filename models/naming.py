@@ -0,0 +1,126 @@
+from datetime import datetime
+from functools import lru_cache
+from models.media_cache import video_fps, video_streams
+import os
+import re
+
+def is_url(line):
+    return line.startswith("http://") or line.startswith("https://")
+
+def normalize_input_path(file):
+    # Путь из входного окна: без кавычек и префикса file:///
+    file = file.strip().strip('"')
+    if file.startswith("file:///"):
+        file = file[8:]
+    return file
+
+_PLACEHOLDER_RX = re.compile(r'\[(#+|N|P|DATE|DUR|RES|FPS)\]')
+_MEDIA_PLACEHOLDERS = ("DUR", "RES", "FPS")
+_UNSET = object()
+
+class NameTemplate:
+    # Шаблон имени выходного файла. Разбирается один раз в список частей: строки копируются как есть,
+    # подстановки - функции (номер строки, путь, поля файла). Подстановки:
+    # [N] - имя исходного файла, [###] - номер строки с ведущими нулями, [P] - имя папки файла,
+    # [DATE] - дата изменения файла, [DUR] - длительность, [RES] - разрешение, [FPS] - частота кадров.
+    # Дата и метаданные вычисляются, только если они есть в шаблоне; остальные скобки остаются как есть
+    def __init__(self, template):
+        self.template = template
+        self.parts = []
+        self.needs_fields = False  # Нужны stat или метаданные файла
+        self.needs_media = False  # Нужны метаданные ffprobe
+
+        position = 0
+        for match in _PLACEHOLDER_RX.finditer(template):
+            if match.start() > position:
+                self.parts.append(template[position:match.start()])
+            self.parts.append(self._compile_placeholder(match.group(1)))
+            position = match.end()
+        if position < len(template):
+            self.parts.append(template[position:])
+
+    def _compile_placeholder(self, name):
+        if name == 'N':
+            return lambda index, file, fields: os.path.splitext(os.path.basename(file))[0]
+        if name.startswith('#'):
+            width = len(name)
+            return lambda index, file, fields: str(index + 1).zfill(width)
+        if name == 'P':
+            return lambda index, file, fields: os.path.basename(os.path.dirname(normalize_input_path(file)))
+
+        self.needs_fields = True
+        if name in _MEDIA_PLACEHOLDERS:
+            self.needs_media = True
+        return {
+            'DATE': _FileFields.date,
+            'DUR': _FileFields.duration,
+            'RES': _FileFields.resolution,
+            'FPS': _FileFields.fps,
+        }[name]
+
+    def render(self, index, file, media_lookup=None):
+        # media_lookup(путь) -> метаданные или None; без него [DUR], [RES], [FPS] пустые
+        if not file.strip():
+            return ''
+        fields = _FileFields(file, media_lookup) if self.needs_fields else None
+        return ''.join([part if part.__class__ is str else part(index, file, fields) for part in self.parts])
+
+class _FileFields:
+    # Данные одной строки, общие для нескольких подстановок; stat и метаданные запрашиваются один раз
+    def __init__(self, file, media_lookup):
+        self.path = normalize_input_path(file)
+        self.media_lookup = media_lookup
+        self._info = _UNSET
+
+    def info(self):
+        if self._info is _UNSET:
+            self._info = self.media_lookup(self.path) if self.media_lookup else None
+        return self._info
+
+    def video(self):
+        streams = video_streams(self.info() or {})
+        return streams[0] if streams else {}
+
+    @staticmethod
+    def date(index, file, fields):
+        try:
+            return datetime.fromtimestamp(os.path.getmtime(fields.path)).strftime('%Y-%m-%d')
+        except OSError:
+            return ''
+
+    @staticmethod
+    def duration(index, file, fields):
+        seconds = (fields.info() or {}).get("duration")
+        if seconds is None:
+            return ''
+        hours, remainder = divmod(int(seconds), 3600)
+        minutes, seconds = divmod(remainder, 60)
+        return f"{hours:02}h{minutes:02}m{seconds:02}s"  # Двоеточие в имени файла запрещено
+
+    @staticmethod
+    def resolution(index, file, fields):
+        video = fields.video()
+        return f"{video['width']}x{video['height']}" if video.get('width') and video.get('height') else ''
+
+    @staticmethod
+    def fps(index, file, fields):
+        fps = video_fps(fields.info())
+        return f"{fps:.3f}".rstrip('0').rstrip('.') if fps else ''
+
+@lru_cache(maxsize=32)
+def compile_template(template):
+    return NameTemplate(template)
+
+def render_output_name(template, index, file, media_lookup=None):
+    return compile_template(template).render(index, file, media_lookup)
+
+_UNSAFE_FILENAME_RX = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+
+def safe_filename(name):
+    # Заголовок видео как имя файла: символы, запрещенные в Windows, заменяются на "_"
+    return _UNSAFE_FILENAME_RX.sub('_', name).strip().rstrip('.') or '_'
+
+def ytdlp_filename_template(title):
+    # Шаблон -o для yt-dlp: то же безопасное имя, что и у перевода от vot-cli, поэтому видео и перевод
+    # называются одинаково. "%" удваивается, иначе yt-dlp примет его за начало подстановки
+    return safe_filename(title).replace('%', '%%') + '.%(ext)s'
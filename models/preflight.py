@@ -0,0 +1,133 @@
+from concurrent.futures import ThreadPoolExecutor
+from models.media_cache import media_cache
+import os
+import shutil
+
+class PreflightReport:
+    # Итог проверки пакета до начала кодирования
+    MAX_LINES = 20  # Сколько проблем перечислять поименно, остальные только считаются
+
+    def __init__(self):
+        self.checked = 0
+        self.errors = {}  # (номер, вход, результат) -> (задача, причина); такие задачи не запускаются
+        self.warnings = []  # Сообщения, которые не мешают запуску
+        self.estimated_bytes = {}  # Папка результатов -> ожидаемый объем результатов
+        self.free_bytes = {}  # Папка результатов -> свободное место на диске
+
+    def error(self, job):
+        entry = self.errors.get(_job_id(job))
+        return entry[1] if entry else None
+
+    def has_problems(self):
+        return bool(self.errors or self.warnings)
+
+    def summary(self):
+        estimated = sum(self.estimated_bytes.values())
+        free = sum(self.free_bytes.values())
+        return (f"preflight: файлов: {self.checked}, ошибок: {len(self.errors)}, предупреждений: {len(self.warnings)}, "
+                f"нужно ~{format_bytes(estimated)}, свободно {format_bytes(free)}")
+
+    def lines(self):
+        lines = [self.summary()]
+        problems = [f"{os.path.basename(job.input_file)}: {reason}" for job, reason in self.errors.values()] + self.warnings
+        lines += problems[:self.MAX_LINES]
+        if len(problems) > self.MAX_LINES:
+            lines.append(f"... и еще {len(problems) - self.MAX_LINES}")
+        return lines
+
+class Preflight:
+    # Проверка пакета перед запуском: входные файлы читаются и пробуются параллельно (метаданные попадают
+    # в общий кэш, и конвертер потом не запускает ffprobe повторно), затем ищутся совпадающие имена
+    # результатов, уже существующие файлы и нехватка места на диске. Иначе такие ошибки всплывают
+    # только через несколько часов работы пакета
+    def __init__(self, ffprobe_path="ffprobe", max_workers=8, journal=None, resume=False):
+        self.ffprobe_path = ffprobe_path
+        self.max_workers = max(1, int(max_workers))
+        self.journal = journal
+        self.resume = resume
+
+    def run(self, jobs):
+        report = PreflightReport()
+        report.checked = len(jobs)
+        if not jobs:
+            return report
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self.inspect, jobs))
+
+        outputs = {}
+        for job, (reason, estimated_bytes, done) in zip(jobs, results):
+            output_key = os.path.normcase(os.path.abspath(job.output_file))
+            if reason is None and output_key in outputs:
+                reason = f"имя результата совпадает с задачей {outputs[output_key].index + 1}: {os.path.basename(job.output_file)}"
+            if reason is None and output_key == os.path.normcase(os.path.abspath(job.input_file)):
+                reason = "результат совпадает со входным файлом"
+            if reason is not None:
+                report.errors[_job_id(job)] = (job, reason)
+                continue
+
+            outputs[output_key] = job
+            if done:
+                continue  # Задача уже готова по журналу и будет пропущена
+            if os.path.exists(job.output_file):
+                report.warnings.append(f"{os.path.basename(job.output_file)}: файл уже существует и будет перезаписан")
+            output_dir = os.path.dirname(os.path.abspath(job.output_file))
+            report.estimated_bytes[output_dir] = report.estimated_bytes.get(output_dir, 0) + estimated_bytes
+
+        self.check_free_space(report)
+        return report
+
+    def inspect(self, job):
+        # Выполняется в пуле потоков. Возвращает (причина ошибки или None, ожидаемый размер результата, готова ли задача)
+        try:
+            input_stat = os.stat(job.input_file)
+        except OSError as e:
+            return f"входной файл недоступен: {e.strerror or e}", 0, False
+        if not os.access(job.input_file, os.R_OK):
+            return "нет прав на чтение входного файла", 0, False
+        if not os.path.basename(job.output_file).rpartition(".")[0].strip():
+            return "пустое имя результата", 0, False
+        if not os.path.isdir(os.path.dirname(os.path.abspath(job.output_file))):
+            return "папка для результатов не существует", 0, False
+
+        if self.resume and self.journal is not None and self.journal.is_complete(job):
+            return None, 0, True
+
+        info = media_cache.probe(job.input_file, self.ffprobe_path)
+        if not info or not info.get("streams"):
+            return "ffprobe не нашел в файле аудио или видео", 0, False
+
+        # Без перекодирования результат примерно равен исходнику, при перекодировании его битрейт
+        # обычно не выше исходного, поэтому оценка сверху - длительность на битрейт исходника
+        duration, bit_rate = info.get("duration"), info.get("bit_rate")
+        estimated_bytes = int(duration * bit_rate / 8) if duration and bit_rate else input_stat.st_size
+        return None, estimated_bytes, False
+
+    def check_free_space(self, report):
+        # Папки на одном диске складываются: место у них общее
+        devices = {}
+        for output_dir, estimated_bytes in report.estimated_bytes.items():
+            try:
+                device = os.stat(output_dir).st_dev
+                free_bytes = shutil.disk_usage(output_dir).free
+            except OSError:
+                continue
+            needed, _, dirs = devices.get(device, (0, free_bytes, []))
+            devices[device] = (needed + estimated_bytes, free_bytes, dirs + [output_dir])
+
+        for needed, free_bytes, dirs in devices.values():
+            report.free_bytes[dirs[0]] = free_bytes
+            if needed > free_bytes:
+                report.warnings.append(f"{dirs[0]}: может не хватить места: нужно ~{format_bytes(needed)}, "
+                                       f"свободно {format_bytes(free_bytes)}")
+
+def _job_id(job):
+    # Не job.key(): одинаковые строки во входном списке дают одинаковый ключ, а заблокировать нужно только повтор
+    return job.index, job.input_file, job.output_file
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.2f} {unit}"
+        size /= 1024
+    return f"{size:.2f} TB"
@@ -0,0 +1,176 @@
+import os
+import signal
+import threading
+
+try:
+    import psutil  # Необязателен: без него на Windows используется NtSuspendProcess, на других системах - сигналы
+except ImportError:
+    psutil = None
+
+_PROCESS_ERRORS = (OSError, ValueError) + ((psutil.Error,) if psutil is not None else ())
+
+def set_suspended(process, suspended):
+    # Приостанавливает или продолжает процесс subprocess.Popen. Завершившийся процесс пропускается
+    if process.poll() is not None:
+        return
+    try:
+        if psutil is not None:
+            target = psutil.Process(process.pid)
+            target.suspend() if suspended else target.resume()
+        elif os.name == 'nt':
+            _windows_set_suspended(process.pid, suspended)
+        else:
+            os.kill(process.pid, signal.SIGSTOP if suspended else signal.SIGCONT)
+    except _PROCESS_ERRORS as e:
+        print(f"Не удалось {'приостановить' if suspended else 'продолжить'} процесс {process.pid}: {e}")
+
+def _windows_set_suspended(pid, suspended):
+    # Свой дескриптор процесса с правом PROCESS_SUSPEND_RESUME: без psutil других публичных способов нет
+    import ctypes
+    from ctypes import wintypes
+    PROCESS_SUSPEND_RESUME = 0x0800
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    ntdll = ctypes.WinDLL("ntdll")
+    function = ntdll.NtSuspendProcess if suspended else ntdll.NtResumeProcess
+    function.argtypes = (wintypes.HANDLE,)
+
+    handle = kernel32.OpenProcess(PROCESS_SUSPEND_RESUME, False, pid)
+    if not handle:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        status = function(handle)
+        if status:
+            raise OSError(f"NTSTATUS 0x{status & 0xFFFFFFFF:08X}")
+    finally:
+        kernel32.CloseHandle(handle)
+
+def kill_process(process):
+    # Недописанный файл все равно удаляется, поэтому корректное завершение ffmpeg не нужно: на SIGTERM
+    # он сначала дописывает буферы кодировщика, у x265 это секунды. Не ждет завершения - код возврата
+    # заберет поток, который запустил процесс
+    if process.poll() is not None:
+        return
+    try:
+        process.kill()
+    except OSError:
+        pass
+
+class ProcessGroup:
+    # Процессы ffmpeg одной задачи (при кодировании по частям их несколько). Пауза и отмена
+    # действуют и на процессы, которые задача запустит позже
+    def __init__(self):
+        self.processes = set()
+        self.paused = False
+        self.cancelled = False
+        self._lock = threading.Lock()
+
+    def add(self, process):
+        with self._lock:
+            self.processes.add(process)
+            paused, cancelled = self.paused, self.cancelled
+        if cancelled:
+            kill_process(process)
+        elif paused:
+            set_suspended(process, True)
+
+    def discard(self, process):
+        with self._lock:
+            self.processes.discard(process)
+
+    def pause(self):
+        with self._lock:
+            if self.paused or self.cancelled:
+                return False
+            self.paused = True
+            processes = list(self.processes)
+        for process in processes:
+            set_suspended(process, True)
+        return True
+
+    def resume(self):
+        with self._lock:
+            if not self.paused:
+                return False
+            self.paused = False
+            processes = list(self.processes)
+        for process in processes:
+            set_suspended(process, False)
+        return True
+
+    def cancel(self):
+        with self._lock:
+            if self.cancelled:
+                return False
+            self.cancelled = True
+            self.paused = False
+            processes = list(self.processes)
+        for process in processes:
+            kill_process(process)
+        return True
+
+class ConvertControl:
+    # Пауза и отмена пакета и отдельных задач. Группа процессов создается и для задачи, которая еще
+    # стоит в очереди: отмененная заранее задача не запустит ffmpeg, приостановленная - запустит его
+    # приостановленным. На паузе пакета свободные потоки не берут новые задачи, а задачи, которые
+    # уже начались, приостанавливаются целиком
+    def __init__(self):
+        self.groups = {}  # Индекс задачи -> ProcessGroup
+        self.paused = False
+        self.cancelled = False
+        self._condition = threading.Condition()
+
+    def group(self, index):
+        with self._condition:
+            group = self.groups.get(index)
+            if group is None:
+                group = self.groups[index] = ProcessGroup()
+                group.cancelled = self.cancelled
+                group.paused = self.paused and not self.cancelled
+            return group
+
+    def release(self, index):
+        # Задача завершена: ее процессы больше не нужно приостанавливать или отменять
+        with self._condition:
+            self.groups.pop(index, None)
+
+    def is_paused(self, index):
+        with self._condition:
+            group = self.groups.get(index)
+            return group is not None and group.paused
+
+    def wait_while_paused(self):
+        with self._condition:
+            while self.paused and not self.cancelled:
+                self._condition.wait()
+            return not self.cancelled
+
+    def pause(self, index=None):
+        # Возвращает индексы задач, которые действительно приостановлены
+        if index is not None:
+            return [index] if self.group(index).pause() else []
+        with self._condition:
+            self.paused = True
+            groups = list(self.groups.items())
+        return [index for index, group in groups if group.pause()]
+
+    def resume(self, index=None):
+        if index is not None:
+            return [index] if self.group(index).resume() else []
+        with self._condition:
+            self.paused = False
+            self._condition.notify_all()
+            groups = list(self.groups.items())
+        return [index for index, group in groups if group.resume()]
+
+    def cancel(self, index=None):
+        if index is not None:
+            return [index] if self.group(index).cancel() else []
+        with self._condition:
+            self.cancelled = True
+            self.paused = False
+            self._condition.notify_all()
+            groups = list(self.groups.items())
+        return [index for index, group in groups if group.cancel()]
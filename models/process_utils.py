@@ -0,0 +1,21 @@
+import os
+import subprocess
+
+def hidden_window_kwargs():
+    # Параметры subprocess, чтобы на Windows не появлялось окно консоли. На других системах ничего не нужно
+    if os.name != 'nt':
+        return {}
+
+    startupinfo = subprocess.STARTUPINFO()
+    startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    return {"startupinfo": startupinfo, "creationflags": subprocess.CREATE_NO_WINDOW}
+
+def sibling_tool_path(tool_path, name):
+    # Путь к соседней утилите (например ffprobe рядом с ffmpeg), иначе ищем её в PATH
+    if tool_path:
+        directory = os.path.dirname(tool_path)
+        extension = os.path.splitext(tool_path)[1]
+        candidate = os.path.join(directory, name + extension)
+        if directory and os.path.exists(candidate):
+            return candidate
+    return name
@@ -0,0 +1,113 @@
+from concurrent.futures import ThreadPoolExecutor
+from models.ffmpeg_command import AUDIO_ENCODER_OPTIONS, build_convert_command
+from models.ffmpeg_progress import run_ffmpeg
+import csv
+import os
+import shutil
+import tempfile
+import threading
+
+class SegmentEncoder:
+    # Кодирование одного длинного файла по частям: видео режется по ключевым кадрам без перекодирования,
+    # части кодируются параллельно несколькими процессами ffmpeg, звук кодируется один раз целиком,
+    # затем части склеиваются concat-демультиплексором без потерь
+    MIN_SEGMENT_SECONDS = 30
+    SEGMENTS_PER_WORKER = 4  # Частей больше, чем процессов, чтобы процессы не простаивали в конце
+
+    def __init__(self, ffmpeg_path, max_workers=2, on_progress=None, processes=None):
+        self.ffmpeg_path = ffmpeg_path
+        self.max_workers = max(1, int(max_workers))
+        self.on_progress = on_progress  # (закодировано секунд видео, суммарная скорость)
+        self.processes = processes  # ProcessGroup задачи: пауза и отмена действуют на все процессы частей
+        self._segment_progress = {}
+        self._lock = threading.Lock()
+
+    def encode(self, input_file, output_file, codec, crf, preset, fps, duration, has_audio=True, audio_copy=False):
+        # Временные файлы лежат рядом с результатом: на том же диске хватает места и склейка не копирует данные между дисками
+        work_dir = tempfile.mkdtemp(prefix=".uconvert_segments_", dir=os.path.dirname(os.path.abspath(output_file)))
+        try:
+            segment_time = max(self.MIN_SEGMENT_SECONDS, duration / (self.max_workers * self.SEGMENTS_PER_WORKER))
+            segments = self.split(input_file, work_dir, segment_time)
+            if not segments:
+                return False
+
+            self._segment_progress = {}
+            audio_file = os.path.join(work_dir, "audio.m4a") if has_audio else None
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [executor.submit(self.encode_segment, number, segment_file, codec, crf, preset, fps)
+                           for number, segment_file in enumerate(segments)]
+                if audio_file:
+                    futures.append(executor.submit(self.encode_audio, input_file, audio_file, audio_copy))
+                results = [future.result() for future in futures]
+            if not all(results):
+                return False
+
+            return self.concat([self.encoded_file(segment_file) for segment_file in segments], audio_file, output_file, work_dir)
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def split(self, input_file, work_dir, segment_time):
+        # Режем только видеопоток: -c copy разрезает файл на ближайших ключевых кадрах
+        list_file = os.path.join(work_dir, "segments.csv")
+        command = [self.ffmpeg_path, '-y', '-v', 'error', '-progress', 'pipe:1', '-nostats', '-i', input_file,
+                   '-map', '0:v:0', '-c', 'copy', '-f', 'segment', '-segment_time', f"{segment_time:.3f}",
+                   '-reset_timestamps', '1', '-segment_list', list_file, '-segment_list_type', 'csv',
+                   os.path.join(work_dir, "segment_%05d.mkv")]
+        returncode, stderr_tail = run_ffmpeg(command, processes=self.processes)
+        if returncode != 0:
+            print(f"Не удалось разрезать {input_file} на части:\n{stderr_tail}")
+            return []
+
+        # Строки списка: имя файла, начало, конец
+        with open(list_file, "r", encoding="utf-8", newline="") as f:
+            return [os.path.join(work_dir, row[0]) for row in csv.reader(f) if row]
+
+    def encoded_file(self, segment_file):
+        root, _ = os.path.splitext(segment_file)
+        return root + "_encoded.mkv"
+
+    def encode_segment(self, number, segment_file, codec, crf, preset, fps):
+        def on_snapshot(snapshot):
+            self._update_progress(number, snapshot["out_time"], 0 if snapshot["end"] else snapshot["speed"])
+
+        command = build_convert_command(self.ffmpeg_path, segment_file, self.encoded_file(segment_file), codec, crf, preset, fps,
+                                        overwrite=True, progress_pipe=True, audio=False)
+        returncode, stderr_tail = run_ffmpeg(command, on_snapshot, processes=self.processes)
+        if returncode != 0:
+            print(f"Ошибка кодирования части {os.path.basename(segment_file)}:\n{stderr_tail}")
+        return returncode == 0
+
+    def encode_audio(self, input_file, audio_file, audio_copy):
+        audio_options = ['-c:a', 'copy'] if audio_copy else AUDIO_ENCODER_OPTIONS
+        command = [self.ffmpeg_path, '-y', '-v', 'error', '-progress', 'pipe:1', '-nostats', '-i', input_file,
+                   '-map', '0:a:0', '-vn'] + audio_options + [audio_file]
+        returncode, stderr_tail = run_ffmpeg(command, processes=self.processes)
+        if returncode != 0:
+            print(f"Ошибка кодирования звука {os.path.basename(input_file)}:\n{stderr_tail}")
+        return returncode == 0
+
+    def concat(self, encoded_files, audio_file, output_file, work_dir):
+        # Пути в списке относительные: concat ищет их рядом с файлом списка
+        list_file = os.path.join(work_dir, "concat.txt")
+        with open(list_file, "w", encoding="utf-8") as f:
+            for encoded_file in encoded_files:
+                f.write(f"file '{os.path.basename(encoded_file)}'\n")
+
+        command = [self.ffmpeg_path, '-y', '-v', 'error', '-progress', 'pipe:1', '-nostats',
+                   '-f', 'concat', '-safe', '0', '-i', list_file]
+        if audio_file:
+            command += ['-i', audio_file, '-map', '0:v', '-map', '1:a']
+        command += ['-c', 'copy', output_file]
+        returncode, stderr_tail = run_ffmpeg(command, processes=self.processes)
+        if returncode != 0:
+            print(f"Не удалось склеить части в {output_file}:\n{stderr_tail}")
+        return returncode == 0
+
+    def _update_progress(self, number, out_time, speed):
+        with self._lock:
+            previous_time, _ = self._segment_progress.get(number, (0, 0))
+            self._segment_progress[number] = (out_time if out_time is not None else previous_time, speed or 0)
+            done_seconds = sum(seconds for seconds, _ in self._segment_progress.values())
+            total_speed = sum(speed for _, speed in self._segment_progress.values())
+        if self.on_progress:
+            self.on_progress(done_seconds, total_speed)
@@ -0,0 +1,19 @@
+import time
+
+class StartupTiming:
+    # Замеры запуска по этапам: от импорта main.py до первого кадра окна
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages = []  # (этап, секунды)
+        self._last = self.started
+
+    def mark(self, stage):
+        now = time.perf_counter()
+        self.stages.append((stage, now - self._last))
+        self._last = now
+
+    def report(self):
+        stages = ", ".join(f"{stage} {seconds * 1000:.0f} мс" for stage, seconds in self.stages)
+        return f"Запуск: {stages}, всего {(self._last - self.started) * 1000:.0f} мс"
+
+startup_timing = StartupTiming()  # Создается при первом импорте, поэтому main.py импортирует его первым
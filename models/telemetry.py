@@ -0,0 +1,125 @@
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+import inspect
+import json
+import os
+import threading
+import time
+
+class Telemetry:
+    # Журнал измерений в памяти: отрезки времени (этапы задач, обработчики в потоке GUI) и итоги задач.
+    # Потокобезопасен, объем ограничен, экспортируется в JSON lines или в формат Chrome trace
+    # (открывается в chrome://tracing или ui.perfetto.dev)
+    MAX_EVENTS = 100000
+    STALL_THRESHOLD = 0.05  # Обработчик в потоке GUI дольше 50 мс заметен как подвисание
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.started_wall = time.time()
+        self.events = deque(maxlen=self.MAX_EVENTS)
+        self._lock = threading.Lock()
+        self._local = threading.local()  # Глубина вложенных измеряемых вызовов в каждом потоке
+
+    def record(self, name, category, start, duration, **args):
+        # start - значение time.perf_counter() в начале отрезка, duration - секунды
+        thread = threading.current_thread()
+        event = {"type": "span", "name": name, "category": category, "start": start - self.started,
+                 "duration": duration, "thread": thread.name, "thread_id": thread.ident, "args": args}
+        with self._lock:
+            self.events.append(event)
+
+    def record_job(self, **values):
+        # Итог одной задачи конвертации: тайминги этапов, коэффициент реального времени, объемы
+        event = {"type": "job", "time": time.perf_counter() - self.started, **values}
+        with self._lock:
+            self.events.append(event)
+
+    @contextmanager
+    def span(self, name, category, **args):
+        start = time.perf_counter()
+        try:
+            yield args  # В args можно дописать результаты этапа
+        finally:
+            self.record(name, category, start, time.perf_counter() - start, **args)
+
+    def measure(self, category):
+        # Декоратор для обработчиков сигналов: время каждого вызова попадает в журнал.
+        # Подвисанием считается только внешний вызов, иначе вложенные обработчики посчитаются дважды
+        def decorator(function):
+            # PyQt сам отбрасывает лишние аргументы сигнала (clicked(bool) -> slot(self)), но у обертки
+            # сигнатура *args, поэтому лишние аргументы отбрасываем здесь
+            code = function.__code__
+            max_args = None if code.co_flags & inspect.CO_VARARGS else code.co_argcount
+
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                depth = getattr(self._local, "depth", 0)
+                self._local.depth = depth + 1
+                start = time.perf_counter()
+                try:
+                    return function(*args[:max_args], **kwargs)
+                finally:
+                    duration = time.perf_counter() - start
+                    self._local.depth = depth
+                    self.record(function.__qualname__, category, start, duration,
+                                stall=depth == 0 and duration >= self.STALL_THRESHOLD)
+            return wrapper
+        return decorator
+
+    def snapshot(self):
+        with self._lock:
+            return list(self.events)
+
+    def clear(self):
+        with self._lock:
+            self.events.clear()
+
+    def jobs(self):
+        return [event for event in self.snapshot() if event["type"] == "job"]
+
+    def stalls(self):
+        return [event for event in self.snapshot() if event["type"] == "span" and event["args"].get("stall")]
+
+    def summary(self):
+        jobs = self.jobs()
+        stalls = self.stalls()
+        encode_time = sum(job.get("encode_time") or 0 for job in jobs)
+        return (f"telemetry: задач: {len(jobs)}, кодирование {encode_time:.1f} с, "
+                f"подвисаний GUI: {len(stalls)}, самое долгое {max((e['duration'] for e in stalls), default=0) * 1000:.0f} мс")
+
+    def export(self, path):
+        # Формат по расширению: .jsonl - построчный JSON, иначе Chrome trace
+        if path.lower().endswith(".jsonl"):
+            self.export_jsonl(path)
+        else:
+            self.export_chrome_trace(path)
+
+    def export_jsonl(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(json.dumps({"type": "session", "started": self.started_wall, "pid": os.getpid()}) + "\n")
+            for event in self.snapshot():
+                f.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+    def export_chrome_trace(self, path):
+        # Отрезки - события "X" (complete) в микросекундах, итоги задач - мгновенные события "i" с полями в args
+        pid = os.getpid()
+        trace_events = []
+        threads = {}
+        for event in self.snapshot():
+            if event["type"] == "span":
+                threads[event["thread_id"]] = event["thread"]
+                trace_events.append({"name": event["name"], "cat": event["category"], "ph": "X", "pid": pid,
+                                     "tid": event["thread_id"], "ts": event["start"] * 1e6, "dur": event["duration"] * 1e6,
+                                     "args": event["args"]})
+            else:
+                args = {key: value for key, value in event.items() if key not in ("type", "time")}
+                trace_events.append({"name": f"job {args.get('index', '')}", "cat": "job", "ph": "i", "s": "p", "pid": pid,
+                                     "tid": 0, "ts": event["time"] * 1e6, "args": args})
+        for thread_id, thread_name in threads.items():
+            trace_events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": thread_name}})
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, f, ensure_ascii=False)
+
+telemetry = Telemetry()  # Общий журнал для GUI, конвертера и консольного режима
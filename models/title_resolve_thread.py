@@ -0,0 +1,16 @@
+from models.title_resolver import title_resolver
+from PyQt5.QtCore import pyqtSignal, QThread
+
+class TitleResolveThread(QThread):
+    titles_ready = pyqtSignal(dict)  # url -> заголовок
+
+    def __init__(self, urls, ytdlp_path=None, proxy=None):
+        super(TitleResolveThread, self).__init__()
+        self.urls = urls
+        self.ytdlp_path = ytdlp_path
+        self.proxy = proxy
+
+    def run(self):
+        # Все ссылки запрашиваются одним запуском yt-dlp
+        titles = title_resolver.resolve_many(self.urls, self.ytdlp_path, self.proxy)
+        self.titles_ready.emit(titles)
@@ -0,0 +1,98 @@
+from models.process_utils import hidden_window_kwargs
+import subprocess
+import threading
+import time
+
+class TitleResolver:
+    # Получение заголовков видео через yt-dlp. Все неизвестные ссылки запрашиваются
+    # одним запуском yt-dlp, результаты хранятся в памяти ttl секунд.
+    def __init__(self, ytdlp_path="yt-dlp", ttl=3600):
+        self.ytdlp_path = ytdlp_path
+        self.ttl = ttl
+        self.titles = {}  # url -> (заголовок, время получения)
+        self.in_flight = {}  # url -> threading.Event, пока заголовок запрашивается в другом потоке
+        self.run_count = 0  # Сколько раз реально запускался yt-dlp
+        self._lock = threading.Lock()
+
+    def get_cached(self, url):
+        with self._lock:
+            return self._get_cached(url)
+
+    def _get_cached(self, url):
+        entry = self.titles.get(url)
+        if entry is None:
+            return None
+        title, resolved_at = entry
+        if time.monotonic() - resolved_at > self.ttl:
+            del self.titles[url]
+            return None
+        return title
+
+    def resolve(self, url, ytdlp_path=None, proxy=None):
+        return self.resolve_many([url], ytdlp_path, proxy).get(url)
+
+    def resolve_many(self, urls, ytdlp_path=None, proxy=None):
+        results = {}
+        to_fetch = []
+        to_wait = []
+
+        with self._lock:
+            for url in dict.fromkeys(urls):
+                title = self._get_cached(url)
+                if title is not None:
+                    results[url] = title
+                elif url in self.in_flight:
+                    to_wait.append((url, self.in_flight[url]))  # Эту ссылку уже запрашивает другой поток
+                else:
+                    self.in_flight[url] = threading.Event()
+                    to_fetch.append(url)
+
+        if to_fetch:
+            fetched = {}
+            try:
+                fetched = self.fetch_titles(to_fetch, ytdlp_path or self.ytdlp_path, proxy)
+            finally:
+                with self._lock:
+                    now = time.monotonic()
+                    for url in to_fetch:
+                        if url in fetched:
+                            self.titles[url] = (fetched[url], now)
+                        self.in_flight.pop(url).set()
+            results.update(fetched)
+
+        for url, event in to_wait:
+            event.wait()
+            title = self.get_cached(url)
+            if title is not None:
+                results[url] = title
+
+        return results
+
+    def fetch_titles(self, urls, ytdlp_path, proxy=None):
+        # original_url выводится рядом с заголовком, чтобы сопоставить результат со ссылкой,
+        # даже если часть ссылок не удалось обработать
+        command = [ytdlp_path, '--skip-download', '--ignore-errors', '--no-warnings', '--no-playlist',
+                   '--encoding', 'utf-8', '--print', '%(original_url)s\t%(title)s']
+        if proxy:
+            command += ['--proxy', proxy]
+        command += urls
+
+        with self._lock:
+            self.run_count += 1
+
+        try:
+            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                    encoding='utf-8', errors='replace', **hidden_window_kwargs())
+        except OSError as e:
+            print(f"Ошибка при получении заголовка видео: {e}")
+            return {}
+
+        requested = set(urls)
+        titles = {}
+        for line in result.stdout.splitlines():
+            url, separator, title = line.partition('\t')
+            if separator and url in requested and title.strip():
+                titles[url] = title.strip()
+        return titles
+
+title_resolver = TitleResolver()  # Общий экземпляр для окна имен, загрузчика и vot-cli
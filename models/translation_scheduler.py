@@ -0,0 +1,102 @@
+from concurrent.futures import ThreadPoolExecutor
+from models.naming import safe_filename
+from models.process_control import ProcessGroup
+from models.process_utils import hidden_window_kwargs
+import re
+import shutil
+import subprocess
+import threading
+
+class TranslationScheduler:
+    # Скачивание переводов через vot-cli: несколько процессов одновременно, у каждого свой таймаут.
+    # Команда передается списком аргументов без shell, поэтому кавычки в заголовках ничего не ломают
+    _PERCENT_RX = re.compile(r"(\d{1,3}(?:\.\d+)?)\s*%")
+
+    def __init__(self, vot_cli_path="vot-cli", max_jobs=4, timeout=600, on_progress=None, on_status=None, on_error=None,
+                 on_finished=None):
+        # В Windows vot-cli - это vot-cli.cmd из npm; shutil.which находит его с учетом PATHEXT
+        self.vot_cli_path = shutil.which(vot_cli_path) or vot_cli_path
+        self.max_jobs = max(1, max_jobs)
+        self.timeout = timeout  # Секунд на одну ссылку
+        self.on_progress = on_progress  # (индекс, процент)
+        self.on_status = on_status  # (индекс, сообщение)
+        self.on_error = on_error  # (индекс, сообщение об ошибке)
+        self.on_finished = on_finished  # (индекс, url, успех)
+        self.processes = ProcessGroup()  # Запущенные vot-cli; cancel() завершает их
+
+    def cancel(self):
+        # Ссылки, которые еще ждут в пуле, не запускаются, запущенные vot-cli завершаются
+        self.processes.cancel()
+
+    def run(self, urls, output_dir, titles):
+        # Блокирует до окончания всех загрузок, возвращает список ссылок, для которых перевод скачан.
+        # titles - уже полученные заголовки (url -> заголовок); ссылки без заголовка пропускаются
+        completed = []
+        with ThreadPoolExecutor(max_workers=self.max_jobs) as executor:
+            futures = {executor.submit(self.download, index, url, output_dir, titles[url]): url
+                       for index, url in enumerate(urls) if titles.get(url)}
+            for future, url in futures.items():
+                if future.result():
+                    completed.append(url)
+        return completed
+
+    def download(self, index, url, output_dir, title):
+        output_file = f"{safe_filename(title)}.mp3"
+        command = [self.vot_cli_path, f"--output={output_dir}", f"--output-file={output_file}", url]
+        if self.processes.cancelled:
+            return self._finish(index, url, False, f"Перевод отменен: {title}")
+        self._status(index, f"translate: {title}")
+        self._progress(index, 0.0)
+
+        try:
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                       encoding='utf-8', errors='replace', **hidden_window_kwargs())
+        except OSError as e:
+            return self._finish(index, url, False, f"Ошибка при запуске vot-cli для {url}: {e}")
+        self.processes.add(process)  # После отмены процесс сразу завершается
+
+        # Процесс, который не уложился в таймаут, завершается принудительно
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(self.timeout, kill)
+        timer.start()
+        try:
+            for line in process.stdout:
+                match = self._PERCENT_RX.search(line)
+                if match:
+                    self._progress(index, min(float(match.group(1)), 100.0))
+            process.wait()
+        finally:
+            timer.cancel()
+            self.processes.discard(process)
+
+        if self.processes.cancelled:
+            return self._finish(index, url, False, f"Перевод отменен: {title}")
+        if timed_out.is_set():
+            return self._finish(index, url, False, f"Ошибка при скачивании {url}: превышено время ожидания ({self.timeout} с)")
+        if process.returncode != 0:
+            return self._finish(index, url, False, f"Ошибка при скачивании {url}: код возврата {process.returncode}")
+
+        self._progress(index, 100.0)
+        return self._finish(index, url, True, f"Скачивание завершено: {title}")
+
+    def _finish(self, index, url, ok, message):
+        if ok:
+            self._status(index, message)
+        elif self.on_error:
+            self.on_error(index, message)
+        if self.on_finished:
+            self.on_finished(index, url, ok)
+        return ok
+
+    def _progress(self, index, percent):
+        if self.on_progress:
+            self.on_progress(index, percent)
+
+    def _status(self, index, message):
+        if self.on_status:
+            self.on_status(index, message)
@@ -1,41 +1,52 @@
-import subprocess
-import os
 from PyQt5.QtCore import QThread, pyqtSignal
-
-class VideoDownloader:
-    def __init__(self, ytdlp_path):
-        self.ytdlp_path = ytdlp_path
-
-    def download_video(self, url, output_dir, filename_template='%(title)s.%(ext)s', proxy=None):
-        command = [self.ytdlp_path]
-
-        if proxy:
-            command += ['--proxy', proxy]
-
-        command += [url, '-o', os.path.join(output_dir, filename_template)]
-        startupinfo = subprocess.STARTUPINFO()
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-
-        try:
-            subprocess.run(command, check=True, startupinfo=startupinfo, creationflags=subprocess.CREATE_NO_WINDOW)
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"Ошибка при скачивании видео: {e}")
-            return False
+from models.download_scheduler import DownloadScheduler
+from models.naming import ytdlp_filename_template
+from models.title_resolver import title_resolver
+import threading
 
 class DownloadThread(QThread):
-    def __init__(self, urls, output_dir, ytdlp_path, proxy=None, parent_ui=None, file_info_widget=None):
+    progress_signal = pyqtSignal(int)  # Общий прогресс всех загрузок
+    status_signal = pyqtSignal(str)
+    job_progress_signal = pyqtSignal(int, int)  # индекс ссылки, прогресс загрузки
+    job_finished_signal = pyqtSignal(int, str, bool, str)  # индекс ссылки, ссылка, успех, путь к скачанному файлу
+
+    def __init__(self, urls, output_dir, ytdlp_path, proxy=None, max_jobs=4, max_per_host=None, dedup=False):
         super().__init__()
         self.urls = urls
         self.output_dir = output_dir
         self.ytdlp_path = ytdlp_path
         self.proxy = proxy
-        self.parent_ui = parent_ui
-        self.file_info_widget = file_info_widget
+        self.max_jobs = max_jobs
+        self.max_per_host = max_per_host
+        self.dedup = dedup  # Не скачивать повторно ссылки, которые уже есть в индексе скачанных файлов
+        self.job_progress = [0] * len(urls)
+        self._lock = threading.Lock()
+        # Планировщик создается сразу, чтобы отмена сработала и пока запрашиваются заголовки
+        self.scheduler = DownloadScheduler(self.ytdlp_path, self.max_jobs, self.max_per_host, proxy=self.proxy,
+                                           on_progress=self.update_job_progress,
+                                           on_status=lambda index, message: self.status_signal.emit(message),
+                                           on_finished=self.job_finished_signal.emit, dedup=self.dedup)
 
     def run(self):
-        downloader = VideoDownloader(self.ytdlp_path)
-        for url in self.urls:
-            video_title = self.file_info_widget.get_video_title(url)
-            filename_template = f"{video_title}.%(ext)s"
-            downloader.download_video(url, self.output_dir, filename_template, self.proxy)
\ No newline at end of file
+        # Заголовки всех ссылок запрашиваются одним запуском yt-dlp (или берутся из общего кэша)
+        titles = title_resolver.resolve_many(self.urls, self.ytdlp_path, self.proxy)
+        filename_templates = {url: ytdlp_filename_template(title) for url, title in titles.items()}
+
+        completed = self.scheduler.run(self.urls, self.output_dir, filename_templates)
+        state = "cancelled" if self.scheduler.is_cancelled() else "done"
+        self.status_signal.emit(f"download: ({len(completed)}/{len(self.urls)}) status: {state}")
+
+    def cancel(self):
+        # Вызывается из потока GUI
+        self.scheduler.cancel()
+
+    def update_job_progress(self, index, percent):
+        # Общий прогресс - среднее по всем ссылкам
+        progress = int(percent)
+        with self._lock:
+            if self.job_progress[index] == progress:
+                return
+            self.job_progress[index] = progress
+            total_progress = sum(self.job_progress) // len(self.job_progress)
+        self.job_progress_signal.emit(index, progress)
+        self.progress_signal.emit(total_progress)
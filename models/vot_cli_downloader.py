@@ -1,30 +1,46 @@
-import subprocess
-import os
 from PyQt5.QtCore import QThread, pyqtSignal
-from models.video_downloader import VideoDownloader
+from models.title_resolver import title_resolver
+from models.translation_scheduler import TranslationScheduler
+import threading
 
 class VotCliDownloader(QThread):
     progress_signal = pyqtSignal(str)
     error_signal = pyqtSignal(str)
+    total_progress_signal = pyqtSignal(int)  # Общий прогресс всех переводов
+    job_progress_signal = pyqtSignal(int, int)  # индекс ссылки, прогресс перевода
 
-    def __init__(self, urls, output_dir, ytdlp_path, file_info_widget):
+    def __init__(self, urls, output_dir, ytdlp_path, proxy=None, max_jobs=4, vot_cli_path="vot-cli"):
         super().__init__()
         self.urls = urls
         self.output_dir = output_dir
         self.ytdlp_path = ytdlp_path
-        self.file_info_widget = file_info_widget
+        self.proxy = proxy
+        self.max_jobs = max_jobs
+        self.vot_cli_path = vot_cli_path
+        self.job_progress = [0] * len(urls)
+        self._lock = threading.Lock()
+        self.scheduler = TranslationScheduler(self.vot_cli_path, self.max_jobs,
+                                              on_progress=self.update_job_progress,
+                                              on_status=lambda index, message: self.progress_signal.emit(message),
+                                              on_error=lambda index, message: self.error_signal.emit(message))
 
     def run(self):
-        for url in self.urls:
-            video_title = self.file_info_widget.get_video_title(url)
-            if video_title:
-                self.download_translation(url, video_title)
+        # Заголовки берутся из общего кэша: загрузчик видео запрашивает их для тех же ссылок
+        titles = title_resolver.resolve_many(self.urls, self.ytdlp_path, self.proxy)
+        self.scheduler.run(self.urls, self.output_dir, titles)
+        self.total_progress_signal.emit(100)
 
-    def download_translation(self, url, video_title):
-        filename_template = f"{video_title}.mp3"
-        command = f'vot-cli --output="{self.output_dir}" --output-file="{filename_template}" "{url}"'
-        try:
-            subprocess.run(command, shell=True, check=True, startupinfo=subprocess.STARTUPINFO())
-            self.progress_signal.emit(f"Скачивание завершено: {video_title}")
-        except subprocess.CalledProcessError as e:
-            self.error_signal.emit(f"Ошибка при скачивании {url}: {e}")
\ No newline at end of file
+    def cancel(self):
+        # Вызывается из потока GUI
+        self.scheduler.cancel()
+
+    def update_job_progress(self, index, percent):
+        # Общий прогресс - среднее по всем ссылкам
+        progress = int(percent)
+        with self._lock:
+            if self.job_progress[index] == progress:
+                return
+            self.job_progress[index] = progress
+            total_progress = sum(self.job_progress) // len(self.job_progress)
+        self.job_progress_signal.emit(index, progress)
+        self.total_progress_signal.emit(total_progress)
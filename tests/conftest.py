@@ -0,0 +1,22 @@
+import os
+import stat
+import sys
+import textwrap
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+@pytest.fixture
+def fake_tool(tmp_path):
+    # Исполняемый скрипт на Python вместо yt-dlp или vot-cli: тесты не ходят в сеть
+    if os.name == 'nt':
+        pytest.skip("скрипты-заглушки запускаются через shebang")
+
+    def make(name, body):
+        path = tmp_path / name
+        path.write_text(f"#!{sys.executable}\n" + textwrap.dedent(body), encoding="utf-8")
+        path.chmod(path.stat().st_mode | stat.S_IEXEC)
+        return str(path)
+
+    return make
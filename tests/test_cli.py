@@ -0,0 +1,16 @@
+from models.convert_job import JobQueue
+import cli
+import os
+
+def test_blank_lines_keep_line_numbers_like_the_gui(tmp_path):
+    # Номер для шаблона и номер задачи - номер строки вместе с пустыми строками, как в окнах GUI
+    list_file = tmp_path / "list.txt"
+    list_file.write_text("/videos/a.mp4\n\n/videos/b.mp4\n   \n/videos/c.mp4\n", encoding="utf-8")
+    jobs_file = tmp_path / "jobs.jsonl"
+
+    assert cli.main(["--list", str(list_file), "-o", str(tmp_path / "out"), "--template", "[###]_[N]",
+                     "--save-jobs", str(jobs_file)]) == 0
+
+    jobs = JobQueue.load(str(jobs_file)).jobs()
+    assert [job.index for job in jobs] == [0, 2, 4]
+    assert [os.path.basename(job.output_file) for job in jobs] == ["001_a.mp4", "003_b.mp4", "005_c.mp4"]
@@ -0,0 +1,112 @@
+from models.title_resolver import TitleResolver
+import json
+import threading
+import time
+
+import pytest
+
+YTDLP = """
+import json, os, sys, time
+args = sys.argv[1:]
+with open({log!r}, "a", encoding="utf-8") as f:
+    f.write(json.dumps(args) + "\\n")
+while {gate!r} and not os.path.exists({gate!r}):
+    time.sleep(0.02)
+for url in [arg for arg in args if arg.startswith("http")]:
+    if "bad" in url:
+        print("ERROR: " + url, file=sys.stderr)
+        continue
+    print(url + "\\tVideo \\"" + url.rsplit("/", 1)[1] + "\\" with spaces")
+"""
+
+@pytest.fixture
+def ytdlp(fake_tool, tmp_path):
+    log = tmp_path / "calls.jsonl"
+
+    def make(gate=""):
+        return fake_tool("yt-dlp", YTDLP.format(log=str(log), gate=gate))
+
+    make.calls = lambda: [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()] if log.exists() else []
+    return make
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "условие не выполнилось за отведенное время"
+        time.sleep(0.01)
+
+def test_resolve_many_uses_one_call(ytdlp):
+    resolver = TitleResolver(ytdlp())
+    urls = ["https://x.com/a", "https://x.com/b", "https://x.com/bad", "https://x.com/a"]
+
+    titles = resolver.resolve_many(urls)
+
+    assert titles == {"https://x.com/a": 'Video "a" with spaces', "https://x.com/b": 'Video "b" with spaces'}
+    assert resolver.run_count == 1
+    calls = ytdlp.calls()
+    assert len(calls) == 1
+    assert calls[0][-3:] == ["https://x.com/a", "https://x.com/b", "https://x.com/bad"]
+    assert "--skip-download" in calls[0]
+
+def test_cached_titles_are_not_requested_again(ytdlp):
+    resolver = TitleResolver(ytdlp())
+    resolver.resolve_many(["https://x.com/a"])
+
+    titles = resolver.resolve_many(["https://x.com/a", "https://x.com/b"])
+
+    assert set(titles) == {"https://x.com/a", "https://x.com/b"}
+    assert [call[-1] for call in ytdlp.calls()] == ["https://x.com/a", "https://x.com/b"]
+
+def test_failed_titles_are_not_cached(ytdlp):
+    resolver = TitleResolver(ytdlp())
+
+    assert resolver.resolve("https://x.com/bad") is None
+    assert resolver.resolve("https://x.com/bad") is None
+    assert resolver.run_count == 2
+    assert resolver.in_flight == {}
+
+def test_titles_expire_after_ttl(ytdlp, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("models.title_resolver.time.monotonic", lambda: now[0])
+    resolver = TitleResolver(ytdlp(), ttl=60)
+
+    resolver.resolve("https://x.com/a")
+    now[0] += 59
+    assert resolver.get_cached("https://x.com/a") is not None
+    resolver.resolve("https://x.com/a")
+    assert resolver.run_count == 1
+
+    now[0] += 2
+    assert resolver.get_cached("https://x.com/a") is None
+    assert resolver.resolve("https://x.com/a") == 'Video "a" with spaces'
+    assert resolver.run_count == 2
+
+def test_waits_for_in_flight_lookup(ytdlp, tmp_path):
+    gate = tmp_path / "gate"
+    resolver = TitleResolver(ytdlp(str(gate)))
+    results = {}
+
+    def resolve(name):
+        results[name] = resolver.resolve("https://x.com/a")
+
+    first = threading.Thread(target=resolve, args=("first",))
+    first.start()
+    wait_until(lambda: "https://x.com/a" in resolver.in_flight)
+    second = threading.Thread(target=resolve, args=("second",))
+    second.start()
+    time.sleep(0.2)
+    assert second.is_alive()  # Ждет ответа первого запроса, а не запускает свой
+
+    gate.touch()
+    first.join(5)
+    second.join(5)
+
+    assert results == {"first": 'Video "a" with spaces', "second": 'Video "a" with spaces'}
+    assert resolver.run_count == 1
+    assert len(ytdlp.calls()) == 1
+
+def test_missing_executable(tmp_path):
+    resolver = TitleResolver(str(tmp_path / "no-such-yt-dlp"))
+
+    assert resolver.resolve_many(["https://x.com/a"]) == {}
+    assert resolver.in_flight == {}
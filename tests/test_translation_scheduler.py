@@ -0,0 +1,97 @@
+from models.naming import safe_filename, ytdlp_filename_template
+from models.translation_scheduler import TranslationScheduler
+import json
+import threading
+import time
+
+VOT_CLI = """
+import json, sys, time
+with open({log!r}, "a", encoding="utf-8") as f:
+    f.write(json.dumps({{"argv": sys.argv[1:], "start": time.time()}}) + "\\n")
+for line in {lines!r}:
+    print(line, flush=True)
+time.sleep({sleep!r})
+sys.exit({code!r})
+"""
+
+def make_vot_cli(fake_tool, tmp_path, lines=(), sleep=0.0, code=0):
+    log = tmp_path / "calls.jsonl"
+    path = fake_tool("vot-cli", VOT_CLI.format(log=str(log), lines=list(lines), sleep=sleep, code=code))
+    return path, lambda: [json.loads(line) for line in log.read_text(encoding="utf-8").splitlines()]
+
+def test_title_is_passed_as_one_argument(fake_tool, tmp_path):
+    path, calls = make_vot_cli(fake_tool, tmp_path)
+    output_dir = tmp_path / "out dir"
+    title = """It's a "test" & $HOME video; rm -rf"""
+    scheduler = TranslationScheduler(path)
+
+    assert scheduler.download(0, "https://x.com/a?b=1&c=2", str(output_dir), title)
+
+    assert calls()[0]["argv"] == [f"--output={output_dir}", f"--output-file={safe_filename(title)}.mp3", "https://x.com/a?b=1&c=2"]
+    assert safe_filename(title) == "It's a _test_ & $HOME video; rm -rf"
+
+def test_video_and_translation_share_a_safe_name():
+    title = '100% real: a/b? "c"'
+
+    assert ytdlp_filename_template(title) == "100%% real_ a_b_ _c_.%(ext)s"
+    assert ytdlp_filename_template(title).replace("%%", "%") == safe_filename(title) + ".%(ext)s"
+
+def test_progress_is_parsed_and_clamped(fake_tool, tmp_path):
+    lines = ["Начинаю перевод", "Перевод: 10%", "progress 55.5 %", "без процентов", "120%"]
+    path, _ = make_vot_cli(fake_tool, tmp_path, lines)
+    progress = []
+    scheduler = TranslationScheduler(path, on_progress=lambda index, percent: progress.append((index, percent)))
+
+    assert scheduler.download(3, "https://x.com/a", str(tmp_path), "a")
+
+    assert progress == [(3, 0.0), (3, 10.0), (3, 55.5), (3, 100.0), (3, 100.0)]
+
+def test_hung_process_is_killed_on_timeout(fake_tool, tmp_path):
+    path, _ = make_vot_cli(fake_tool, tmp_path, ["10%"], sleep=30)
+    errors = []
+    scheduler = TranslationScheduler(path, timeout=0.5, on_error=lambda index, message: errors.append(message))
+
+    start = time.monotonic()
+    ok = scheduler.download(0, "https://x.com/a", str(tmp_path), "a")
+
+    assert not ok
+    assert time.monotonic() - start < 10
+    assert "превышено время ожидания" in errors[0]
+
+def test_exit_code_is_reported(fake_tool, tmp_path):
+    path, _ = make_vot_cli(fake_tool, tmp_path, code=3)
+    errors = []
+    finished = []
+    scheduler = TranslationScheduler(path, on_error=lambda index, message: errors.append(message),
+                                     on_finished=lambda index, url, ok: finished.append((index, url, ok)))
+
+    assert not scheduler.download(1, "https://x.com/a", str(tmp_path), "a")
+
+    assert "код возврата 3" in errors[0]
+    assert finished == [(1, "https://x.com/a", False)]
+
+def test_run_downloads_in_parallel_and_skips_untitled(fake_tool, tmp_path):
+    path, calls = make_vot_cli(fake_tool, tmp_path, sleep=0.5)
+    urls = ["https://x.com/1", "https://x.com/2", "https://x.com/3", "https://x.com/no-title"]
+    titles = {url: url[-1] for url in urls[:3]}
+    scheduler = TranslationScheduler(path, max_jobs=3)
+
+    completed = scheduler.run(urls, str(tmp_path), titles)
+
+    assert sorted(completed) == urls[:3]
+    starts = sorted(call["start"] for call in calls())
+    assert len(starts) == 3
+    assert starts[-1] - starts[0] < 0.5  # Все три процесса запущены до того, как закончился первый
+
+def test_cancel_kills_running_and_skips_queued(fake_tool, tmp_path):
+    path, calls = make_vot_cli(fake_tool, tmp_path, sleep=30)
+    urls = ["https://x.com/1", "https://x.com/2", "https://x.com/3"]
+    scheduler = TranslationScheduler(path, max_jobs=1)
+    threading.Timer(0.5, scheduler.cancel).start()
+
+    start = time.monotonic()
+    completed = scheduler.run(urls, str(tmp_path), {url: url[-1] for url in urls})
+
+    assert completed == []
+    assert time.monotonic() - start < 10
+    assert len(calls()) == 1
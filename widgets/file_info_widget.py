@@ -1,16 +1,27 @@
 from datetime import datetime
-from PyQt5.QtCore import Qt
+from models.media_cache import audio_streams, media_cache, video_fps, video_streams
+from models.media_probe_thread import MediaProbeThread
+from models.naming import compile_template, is_url, normalize_input_path
+from models.telemetry import telemetry
+from models.title_resolve_thread import TitleResolveThread
+from models.title_resolver import title_resolver
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import QPlainTextEdit, QSplitter, QTextEdit, QVBoxLayout, QWidget
-from texttable import Texttable
 from widgets.numbered_text_edit import NumberedTextEdit
-import json
-import mimetypes
 import os
-import re
-import subprocess
 
 class FileInfoWidget(QWidget):
+    UPDATE_DELAY_MS = 250  # Пауза после последнего изменения текста перед пересчетом окон
+    REDRAW_DELAY_MS = 100  # Как часто перерисовывать таблицу, пока приходят результаты ffprobe
+    PENDING_ROW = ['...', '', '', '', '', '']  # Строка таблицы, для которой ещё идет ffprobe
+    # Ширина и выравнивание столбцов таблицы: длительность, размер, разрешение, аудио, FPS, дата.
+    # Ширина постоянная, поэтому строка форматируется сама по себе и не зависит от остальных строк
+    TABLE_COLUMNS = [(8, '<'), (10, '>'), (9, '<'), (4, '^'), (11, '<'), (19, '<')]
+    TABLE_SEPARATOR = '   '
+    PENDING_TITLE = '...'  # Имя для ссылки, заголовок которой ещё запрашивается
+    TITLE_ERROR = "Не удалось получить заголовок"
+
     def __init__(self, text_convert, text_edit_middle, text_edit_right, current_fileName, parent=None):
         super(FileInfoWidget, self).__init__(parent)
 
@@ -22,18 +33,49 @@ class FileInfoWidget(QWidget):
         self.text_edit_middle = text_edit_middle
         self.text_edit_right = text_edit_right
         self.parent_ui = parent  # Сохраняем ссылку на родительский объект
+        self.middle_cache = {}  # Вычисленные имена для строк входного окна
+        self.right_row_cache = {}  # Вычисленные строки таблицы для путей входного окна
+
+        # Пересчет окон откладывается, пока пользователь печатает или вставляет текст
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(self.UPDATE_DELAY_MS)
+        self.update_timer.timeout.connect(self.refresh_panes)
+
+        # Информация о файлах собирается в фоне, таблица дорисовывается по мере готовности строк
+        self.right_rows = []
+        self.changed_rows = set()  # Строки таблицы, пришедшие от ffprobe после последней перерисовки
+        self.probe_generation = 0
+        self.probe_thread = None
+        self.probe_threads = []  # Отмененные потоки живут, пока не доработают запущенные ffprobe
+        self.redraw_timer = QTimer(self)
+        self.redraw_timer.setSingleShot(True)
+        self.redraw_timer.setInterval(self.REDRAW_DELAY_MS)
+        self.redraw_timer.timeout.connect(self.draw_changed_rows)
+
+        # Заголовки для ссылок запрашиваются в фоне пачкой
+        self.title_requests = set()  # Ссылки, для которых уже запущен запрос
+        self.title_threads = []
+
+        # Метаданные для подстановок [DUR], [RES], [FPS] тоже собираются в фоне
+        self.media_requests = set()  # Файлы, для которых уже запущен ffprobe
+        self.media_probed = set()  # Файлы, для которых ffprobe отработал (даже если метаданных нет)
+        self.media_threads = []
+        self.middle_timer = QTimer(self)
+        self.middle_timer.setSingleShot(True)
+        self.middle_timer.setInterval(self.REDRAW_DELAY_MS)
+        self.middle_timer.timeout.connect(self.update_middle_editor)
 
         # Синхронизация скроллинга между окнами
         self.text_edit_left.verticalScrollBar().valueChanged.connect(self.sync_scrolls)
         self.text_edit_middle.verticalScrollBar().valueChanged.connect(self.sync_scrolls)
         self.text_edit_right.verticalScrollBar().valueChanged.connect(self.sync_scrolls)
 
-        # Обновляем среднее окно при изменении текста
-        self.text_edit_left.textChanged.connect(self.update_middle_editor)
-        self.text_edit_left.textChanged.connect(self.update_right_editor_if_enabled)
+        # Обновляем среднее и правое окно при изменении текста
+        self.text_edit_left.textChanged.connect(self.schedule_update)
 
         # Обновляем среднее окно при изменении текста в QComboBox
-        self.current_fileName.currentTextChanged.connect(self.update_middle_editor)
+        self.current_fileName.currentTextChanged.connect(self.schedule_update)
 
         # Подключаем сигнал изменения состояния action_textEdit3 и action_textEdit3_refresh
         if self.parent_ui:
@@ -45,12 +87,26 @@ class FileInfoWidget(QWidget):
 
     def on_action_textEdit3_toggled(self, checked):
         if checked and self.parent_ui.action_textEdit3_refresh.isChecked():
+            self.right_row_cache.clear()
             self.update_right_editor()
 
     def on_action_textEdit3_refresh_toggled(self, checked):
         if checked:
+            self.right_row_cache.clear()
             self.update_right_editor_if_enabled()
 
+    @telemetry.measure("gui")
+    def schedule_update(self):
+        # Каждое новое изменение перезапускает таймер, пересчет выполняется один раз
+        self.update_timer.start()
+
+    @telemetry.measure("gui")
+    def refresh_panes(self):
+        # Текст входного окна собирается из документа один раз на оба окна
+        input_files = self.text_edit_left.toPlainText().splitlines()
+        self.update_middle_editor(input_files)
+        self.update_right_editor_if_enabled(input_files)
+
     def sync_scrolls(self, value):
         sender = self.sender()
         if sender == self.text_edit_left.verticalScrollBar():
@@ -63,90 +119,226 @@ class FileInfoWidget(QWidget):
             self.text_edit_left.verticalScrollBar().setValue(value)
             self.text_edit_middle.verticalScrollBar().setValue(value)
 
-    def update_middle_editor(self):
+    @telemetry.measure("gui")
+    def update_middle_editor(self, input_files=None):
         template = self.current_fileName.currentText()
-        input_files = self.text_edit_left.toPlainText().splitlines()
+        name_template = compile_template(template)  # Шаблон разбирается один раз, а не для каждой строки
+        if input_files is None:
+            input_files = self.text_edit_left.toPlainText().splitlines()
         output_names = []
+        middle_cache = {}
 
+        unresolved_urls = []
+        unprobed_files = []
+
+        # Пересчитываются только новые или измененные строки, остальные берутся из кэша
         for index, file in enumerate(input_files):
-            if file.strip():
-                if file.startswith("http://") or file.startswith("https://"):
-                    video_title = self.get_video_title(file)
-                    output_names.append(video_title)
-                else:
-                    file_name = os.path.splitext(os.path.basename(file))[0]
-                    counter = index + 1
-                    output_name = template
-                    output_name = output_name.replace('[N]', file_name)
-
-                    def replace_placeholder(match):
-                        num_hashes = len(match.group(1))
-                        return str(counter).zfill(num_hashes)
-
-                    output_name = re.sub(r'\[(#+)\]', replace_placeholder, output_name)
-                    output_name = re.sub(r'\[\]', '[]', output_name)
-                    output_names.append(output_name)
+            if is_url(file):
+                key = file  # Заголовок видео не зависит от шаблона и номера строки
+                output_name = self.middle_cache.get(key) or title_resolver.get_cached(file)
+                if output_name is None:
+                    unresolved_urls.append(file)
+                    output_names.append(self.PENDING_TITLE)
+                    continue
             else:
-                output_names.append('')
+                key = (template, index, file)
+                output_name = self.middle_cache.get(key)
+                if output_name is None:
+                    if name_template.needs_media and self.media_pending(file):
+                        # В окне только кэш метаданных: ffprobe для сотен файлов не должен блокировать интерфейс
+                        unprobed_files.append((index, file))
+                        output_names.append(self.PENDING_TITLE)
+                        continue
+                    output_name = name_template.render(index, file, media_cache.get)
+            middle_cache[key] = output_name
+            output_names.append(output_name)
+
+        self.middle_cache = middle_cache
+        self.request_titles(unresolved_urls)
+        self.request_media(unprobed_files)
+
+        # Меняются только строки, которые действительно изменились
+        self.text_edit_middle.setLines(output_names)
+
+    def media_pending(self, file):
+        # Метаданных ещё нет в кэше, и ffprobe для файла ещё не отработал
+        if not file.strip():
+            return False
+        path = normalize_input_path(file)
+        return path not in self.media_probed and media_cache.get(path) is None and os.path.exists(path)
+
+    def request_media(self, files):
+        files = [(index, file) for index, file in files if normalize_input_path(file) not in self.media_requests]
+        if not files:
+            return
 
-        self.text_edit_middle.setPlainText('\n'.join(output_names))
+        self.media_requests.update(normalize_input_path(file) for _, file in files)
+        thread = MediaProbeThread(0, files, self.probe_media)
+        thread.row_ready.connect(self.on_media_ready)
+        thread.finished.connect(self.on_media_thread_finished)
+        self.media_threads.append(thread)
+        thread.start()
+
+    def probe_media(self, file_path):
+        # Выполняется в MediaProbeThread: только заполняет кэш, имя пересчитает окно
+        media_cache.probe(normalize_input_path(file_path))
+        return []
+
+    def on_media_ready(self, generation, index, file_path, row):
+        self.media_probed.add(normalize_input_path(file_path))
+        if not self.middle_timer.isActive():
+            self.middle_timer.start()
+
+    def on_media_thread_finished(self):
+        self.media_threads = [thread for thread in self.media_threads if thread.isRunning()]
+
+    def request_titles(self, urls):
+        urls = [url for url in dict.fromkeys(urls) if url not in self.title_requests]
+        if not urls:
+            return
 
-    def update_right_editor_if_enabled(self):
+        self.title_requests.update(urls)
+        thread = TitleResolveThread(urls, self.ytdlp_path())
+        thread.titles_ready.connect(lambda titles, urls=urls: self.on_titles_ready(urls, titles))
+        thread.finished.connect(self.on_title_thread_finished)
+        self.title_threads.append(thread)
+        thread.start()
+
+    @telemetry.measure("gui")
+    def on_titles_ready(self, urls, titles):
+        for url in urls:
+            self.title_requests.discard(url)
+            self.middle_cache[url] = titles.get(url, self.TITLE_ERROR)
+        self.update_middle_editor()
+
+    def on_title_thread_finished(self):
+        self.title_threads = [thread for thread in self.title_threads if thread.isRunning()]
+
+    def ytdlp_path(self):
+        if self.parent_ui and hasattr(self.parent_ui, 'path_ytdlp') and self.parent_ui.path_ytdlp.text():
+            return self.parent_ui.path_ytdlp.text()
+        return None
+
+    def update_right_editor_if_enabled(self, file_paths=None):
         if self.parent_ui.action_textEdit3.isChecked() and self.parent_ui.action_textEdit3_refresh.isChecked():
-            self.update_right_editor()
+            self.update_right_editor(file_paths)
+
+    @telemetry.measure("gui")
+    def update_right_editor(self, file_paths=None):
+        self.cancel_probing()
 
-    def update_right_editor(self):
         if not (self.parent_ui and hasattr(self.parent_ui, 'action_textEdit3') and self.parent_ui.action_textEdit3.isChecked()):
-            self.text_edit_right.setPlainText("")
+            self.right_rows = []
+            self.text_edit_right.setLines([])
             return
 
-        text = self.text_edit_left.toPlainText()
-        file_paths = text.splitlines()
-
-        table = Texttable()
-        table.set_deco(Texttable.HEADER)
-        table.set_cols_align(["l", "r", "l", "c", "l", "l"])
-        table.set_cols_valign(["m"] * 6)
+        if file_paths is None:
+            file_paths = self.text_edit_left.toPlainText().splitlines()
 
         if not file_paths or all(path.strip() == "" for path in file_paths):
-            self.text_edit_right.setPlainText("")
+            self.right_rows = []
+            self.text_edit_right.setLines([])
             return
 
-        for file_path in file_paths:
-            normalized_path = self.normalize_path(file_path)
-
-            if os.path.exists(normalized_path):
-                file_size = os.path.getsize(normalized_path)
-                file_date = datetime.fromtimestamp(os.path.getmtime(normalized_path)).strftime('%Y-%m-%d %H:%M:%S')
-                file_info = self.get_file_info(normalized_path)
-
-                if file_info['is_video']:
-                    table.add_row([
-                        file_info['duration'],
-                        self.format_size(file_size),
-                        file_info['resolution'],
-                        f"a:{file_info['audio_count']}",
-                        file_info['fps'],
-                        file_date
-                    ])
-                else:
-                    table.add_row([
-                        file_info['duration'],
-                        self.format_size(file_size),
-                        '',
-                        '',
-                        '',
-                        file_date
-                    ])
+        # Готовые строки берем из кэша, остальные отправляем на фоновую обработку
+        right_row_cache = {}
+        self.right_rows = []
+        pending = []
+        for index, file_path in enumerate(file_paths):
+            row = self.right_row_cache.get(file_path)
+            if row is not None:
+                right_row_cache[file_path] = row
+            elif file_path.strip():
+                row = self.PENDING_ROW
+                pending.append((index, file_path))
             else:
-                table.add_row(['', '', '', '', '', ''])
-
-        output = table.draw()
-
-        if output is None or output.strip() == "":
-            self.text_edit_right.setPlainText("")
+                row = ['', '', '', '', '', '']
+            self.right_rows.append(row)
+
+        self.right_row_cache = right_row_cache
+        self.draw_right_table()
+
+        if pending:
+            self.probe_thread = MediaProbeThread(self.probe_generation, pending, self.build_table_row)
+            self.probe_thread.row_ready.connect(self.on_row_ready)
+            self.probe_thread.finished.connect(self.on_probe_thread_finished)
+            self.probe_threads.append(self.probe_thread)
+            self.probe_thread.start()
+
+    def cancel_probing(self):
+        # Новое поколение: результаты уже запущенных задач не попадут в таблицу
+        self.probe_generation += 1
+        if self.probe_thread is not None:
+            self.probe_thread.cancel()
+            self.probe_thread = None
+
+    @telemetry.measure("gui")
+    def on_row_ready(self, generation, index, file_path, row):
+        if any(row):
+            self.right_row_cache[file_path] = row  # Несуществующие пути не кэшируем, файл может появиться позже
+        if generation != self.probe_generation or index >= len(self.right_rows):
             return
-        self.text_edit_right.setPlainText(output)
+        self.right_rows[index] = row
+        self.changed_rows.add(index)
+        if not self.redraw_timer.isActive():
+            self.redraw_timer.start()
+
+    def on_probe_thread_finished(self):
+        self.probe_threads = [thread for thread in self.probe_threads if thread.isRunning()]
+
+    def shutdown(self):
+        # Дожидаемся фоновых потоков, чтобы они не уничтожались во время работы
+        self.cancel_probing()
+        for thread in self.probe_threads + self.title_threads + self.media_threads:
+            thread.wait()
+
+    @telemetry.measure("gui")
+    def draw_right_table(self):
+        # Полная перерисовка - только когда меняется входной список
+        self.redraw_timer.stop()
+        self.changed_rows.clear()
+        self.text_edit_right.setLines([self.format_table_row(row) for row in self.right_rows])
+
+    @telemetry.measure("gui")
+    def draw_changed_rows(self):
+        # Пока идет ffprobe, заменяются только строки, для которых пришел результат
+        for index in sorted(self.changed_rows):
+            if index < len(self.right_rows):
+                self.text_edit_right.replaceLine(index, self.format_table_row(self.right_rows[index]))
+        self.changed_rows.clear()
+
+    def format_table_row(self, row):
+        cells = (f"{str(value):{align}{width}}" for value, (width, align) in zip(row, self.TABLE_COLUMNS))
+        return self.TABLE_SEPARATOR.join(cells).rstrip()
+
+    def build_table_row(self, file_path):
+        # Выполняется в MediaProbeThread, поэтому здесь и ниже нельзя обращаться к виджетам
+        normalized_path = self.normalize_path(file_path)
+
+        if not os.path.exists(normalized_path):
+            return ['', '', '', '', '', '']
+
+        file_size = os.path.getsize(normalized_path)
+        file_date = datetime.fromtimestamp(os.path.getmtime(normalized_path)).strftime('%Y-%m-%d %H:%M:%S')
+        file_info = self.get_file_info(normalized_path)
+
+        if file_info['is_video']:
+            return [
+                file_info['duration'],
+                self.format_size(file_size),
+                file_info['resolution'],
+                f"a:{file_info['audio_count']}",
+                file_info['fps'],
+                file_date
+            ]
+        return [
+            file_info['duration'],
+            self.format_size(file_size),
+            '',
+            '',
+            '',
+            file_date
+        ]
 
     def normalize_path(self, file_path):
         if file_path.startswith("file:///"):
@@ -157,8 +349,7 @@ class FileInfoWidget(QWidget):
         return file_path
 
     def get_file_info(self, file_path):
-        if not self.parent_ui.action_textEdit3.isChecked():
-            return {"duration": "", "resolution": "", "is_video": False}
+        import mimetypes  # При первом вызове mimetypes читает системные таблицы типов
 
         mime_type, _ = mimetypes.guess_type(file_path)
         if mime_type:
@@ -167,61 +358,33 @@ class FileInfoWidget(QWidget):
         return {"duration": "", "resolution": "", "is_video": False}
 
     def extract_media_info(self, file_path):
-        if not self.parent_ui.action_textEdit3.isChecked():
-            return {"duration": "", "resolution": "", "fps": "", "audio_count": 0, "is_video": False}
-
-        command = [
-            'ffprobe', '-v', 'error', '-show_entries',
-            'format=duration', '-show_streams', '-of', 'json', file_path
-        ]
-
-        startupinfo = subprocess.STARTUPINFO()
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-
-        try:
-            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                                    universal_newlines=True, startupinfo=startupinfo, creationflags=subprocess.CREATE_NO_WINDOW)
-            if result.returncode == 0:
-                metadata = json.loads(result.stdout)
-                duration = float(metadata['format']['duration'])
-                video_streams = [s for s in metadata['streams'] if s['codec_type'] == 'video']
-                audio_streams = [s for s in metadata['streams'] if s['codec_type'] == 'audio']
-
-                if video_streams:
-                    width = video_streams[0]['width']
-                    height = video_streams[0]['height']
-                    fps = eval(video_streams[0]['r_frame_rate'])
-                    audio_count = len(audio_streams)
-                    return {
-                        "duration": self.format_duration(duration),
-                        "resolution": f"{width}x{height}",
-                        "fps": f"{fps:.3f} fps",
-                        "audio_count": audio_count,
-                        "is_video": True
-                    }
-                else:
-                    return {
-                        "duration": self.format_duration(duration),
-                        "resolution": "",
-                        "audio_count": 0,
-                        "is_video": False
-                    }
-        except Exception as e:
-            print(f"Ошибка извлечения информации о файле: {e}")
+        # Метаданные берутся из общего кэша, ffprobe запускается только для новых или измененных файлов
+        info = media_cache.probe(file_path)
+        if info is not None and info["duration"] is not None:
+            video = video_streams(info)
+            if video:
+                return {
+                    "duration": self.format_duration(info["duration"]),
+                    "resolution": f"{video[0].get('width')}x{video[0].get('height')}",
+                    "fps": f"{video_fps(info) or 0:.3f} fps",
+                    "audio_count": len(audio_streams(info)),
+                    "is_video": True
+                }
+            else:
+                return {
+                    "duration": self.format_duration(info["duration"]),
+                    "resolution": "",
+                    "audio_count": 0,
+                    "is_video": False
+                }
         return {"duration": "", "resolution": "", "fps": "", "audio_count": 0, "is_video": False}
 
     def format_duration(self, seconds):
-        if not self.parent_ui.action_textEdit3.isChecked():
-            return ""
-
         hours, remainder = divmod(int(seconds), 3600)
         minutes, seconds = divmod(remainder, 60)
         return f"{hours:02}:{minutes:02}:{seconds:02}"
 
     def format_size(self, size_bytes):
-        if not self.parent_ui.action_textEdit3.isChecked():
-            return ""
-
         if size_bytes < 1024:
             return f"{size_bytes} B"
         elif size_bytes < 1024**2:
@@ -232,16 +395,5 @@ class FileInfoWidget(QWidget):
             return f"{size_bytes / 1024**3:.2f} GB"
 
     def get_video_title(self, url):
-        command = ['yt-dlp', '--get-title', url]
-
-        startupinfo = subprocess.STARTUPINFO()
-        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-
-        try:
-            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                                    universal_newlines=True, startupinfo=startupinfo, creationflags=subprocess.CREATE_NO_WINDOW)
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception as e:
-            print(f"Ошибка при получении заголовка видео: {e}")
-        return "Не удалось получить заголовок"
\ No newline at end of file
+        title = title_resolver.resolve(url, self.ytdlp_path())
+        return title if title is not None else self.TITLE_ERROR
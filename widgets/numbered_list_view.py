@@ -0,0 +1,172 @@
+from PyQt5.QtCore import QAbstractListModel, QEvent, QModelIndex, Qt, pyqtSignal
+from PyQt5.QtWidgets import QAbstractItemView, QListView
+from widgets.numbered_text_edit import LineNumberArea
+
+class LineListModel(QAbstractListModel):
+    # Список строк как модель: изменение одной строки не затрагивает остальные
+    def __init__(self, parent=None):
+        super(LineListModel, self).__init__(parent)
+        self._lines = []
+        self.editable = True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._lines)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.EditRole):
+            return self._lines[index.row()]
+        return None
+
+    def flags(self, index):
+        flags = super(LineListModel, self).flags(index)
+        return flags | Qt.ItemIsEditable if self.editable else flags
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        return self.setLine(index.row(), str(value))
+
+    def lines(self):
+        return list(self._lines)
+
+    def setLine(self, row, text):
+        if self._lines[row] == text:
+            return False
+        self._lines[row] = text
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def setLines(self, lines):
+        # Сравниваем с текущими строками: сигнал получают только измененные диапазоны,
+        # лишние строки удаляются с конца, новые добавляются в конец
+        lines = list(lines)
+        common = min(len(lines), len(self._lines))
+
+        row = 0
+        while row < common:
+            if self._lines[row] == lines[row]:
+                row += 1
+                continue
+            first = row
+            while row < common and self._lines[row] != lines[row]:
+                self._lines[row] = lines[row]
+                row += 1
+            self.dataChanged.emit(self.index(first), self.index(row - 1), [Qt.DisplayRole, Qt.EditRole])
+
+        if len(lines) > len(self._lines):
+            self.beginInsertRows(QModelIndex(), len(self._lines), len(lines) - 1)
+            self._lines.extend(lines[common:])
+            self.endInsertRows()
+        elif len(lines) < len(self._lines):
+            self.beginRemoveRows(QModelIndex(), len(lines), len(self._lines) - 1)
+            del self._lines[len(lines):]
+            self.endRemoveRows()
+
+class NumberedListView(QListView):
+    # Режим для больших списков: QListView рисует только видимые строки, а все строки одной высоты,
+    # поэтому геометрия не пересчитывается по всему списку. Повторяет нужную часть интерфейса
+    # NumberedTextEdit (toPlainText, setPlainText, lineNumberArea), так что может стоять на его месте.
+    # Используется только для таблицы в правом окне: ее строки приходят целиком от ffprobe. Входное окно
+    # и окно имен остаются NumberedTextEdit - правка курсором, вставка блоков, отмена и поиск с заменой
+    # работают через QTextDocument, которого у модели строк нет
+    textChanged = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super(NumberedListView, self).__init__(parent)
+        self.line_model = LineListModel(self)
+        self.setModel(self.line_model)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)  # В режиме SinglePass любое изменение строки заново раскладывает весь список
+        self.setBatchSize(5000)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerItem)  # Значение полосы прокрутки - номер строки, как в QPlainTextEdit
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setTextElideMode(Qt.ElideNone)
+        self.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed)
+        self.lineNumberArea = LineNumberArea(self)
+        self._line_height = None
+        self._line_number_digits = 0
+
+        self.line_model.dataChanged.connect(self.onLinesChanged)
+        self.line_model.rowsInserted.connect(self.onLinesChanged)
+        self.line_model.rowsRemoved.connect(self.onLinesChanged)
+        self.verticalScrollBar().valueChanged.connect(self.lineNumberArea.update)
+
+    def toPlainText(self):
+        return '\n'.join(self.line_model.lines())
+
+    def setPlainText(self, text):
+        self.line_model.setLines(text.split('\n') if text else [])
+
+    def lines(self):
+        return self.line_model.lines()
+
+    def setLines(self, lines):
+        self.line_model.setLines(lines)
+
+    def replaceLine(self, row, text):
+        self.line_model.setLine(row, text)
+
+    def setReadOnly(self, read_only):
+        self.line_model.editable = not read_only
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers if read_only
+                             else QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed)
+
+    def isReadOnly(self):
+        return not self.line_model.editable
+
+    def blockCount(self):
+        return self.line_model.rowCount()
+
+    def onLinesChanged(self, *args):
+        digits = len(str(max(1, self.blockCount())))
+        if digits != self._line_number_digits:
+            self._line_number_digits = digits
+            self.updateLineNumberAreaWidth()
+        self.lineNumberArea.update()
+        self.textChanged.emit()
+
+    def lineHeight(self):
+        # Все строки одной высоты, поэтому достаточно измерить первую
+        if self._line_height is None:
+            if not self.blockCount():
+                return self.fontMetrics().height()
+            self._line_height = max(1, self.sizeHintForRow(0))
+        return self._line_height
+
+    def visibleLineNumbers(self, rect):
+        # При прокрутке по строкам значение полосы прокрутки - номер первой видимой строки
+        first = self.line_model.index(self.verticalScrollBar().value())
+        if not first.isValid():
+            return []
+
+        line_height = self.lineHeight()
+        top = self.visualRect(first).top()
+        number = first.row()
+        block_count = self.blockCount()
+        numbers = []
+        while number < block_count and top <= rect.bottom():
+            if top + line_height >= rect.top():
+                numbers.append((number + 1, top))
+            top += line_height
+            number += 1
+        return numbers
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.FontChange:
+            self._line_height = None
+        super(NumberedListView, self).changeEvent(event)
+
+    def lineNumberAreaWidth(self):
+        digits = len(str(max(1, self.blockCount())))
+        space = 3 + self.fontMetrics().horizontalAdvance('9') * digits + 4
+        return space
+
+    def updateLineNumberAreaWidth(self):
+        self.setViewportMargins(self.lineNumberAreaWidth() + 4, 0, 0, 0)
+        cr = self.contentsRect()
+        self.lineNumberArea.setGeometry(cr.x(), cr.y(), self.lineNumberAreaWidth() + 4, cr.height())
+
+    def resizeEvent(self, event):
+        super(NumberedListView, self).resizeEvent(event)
+        self.updateLineNumberAreaWidth()
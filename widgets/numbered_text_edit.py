@@ -1,5 +1,5 @@
-from PyQt5.QtCore import Qt, QRect
-from PyQt5.QtGui import QColor, QFont, QPainter
+from PyQt5.QtCore import QEvent, Qt, QRect
+from PyQt5.QtGui import QColor, QFont, QPainter, QTextCursor
 from PyQt5.QtWidgets import QPlainTextEdit, QTextEdit, QWidget
 
 class LineNumberArea(QWidget):
@@ -38,21 +38,12 @@ class LineNumberArea(QWidget):
         painter.fillRect(event.rect(), background_color)
         painter.setPen(self.dark_font_color if self.is_dark_mode else self.light_font_color)
 
+        # Родитель отдает номера и позиции только видимых строк
         parent = self.parent()
-        block = parent.firstVisibleBlock()
-        blockNumber = block.blockNumber()
-        top = parent.blockBoundingGeometry(block).translated(parent.contentOffset()).top()
-        bottom = top + parent.blockBoundingRect(block).height()
-
-        while block.isValid() and top <= event.rect().bottom():
-            if block.isVisible() and bottom >= event.rect().top():
-                number = str(blockNumber + 1)
-                rect = QRect(0, int(top), self.width() - 6, int(parent.fontMetrics().height()))
-                painter.drawText(rect, Qt.AlignRight, number)
-            block = block.next()
-            top = bottom
-            bottom = top + parent.blockBoundingRect(block).height()
-            blockNumber += 1
+        line_height = parent.lineHeight()
+        for number, top in parent.visibleLineNumbers(event.rect()):
+            rect = QRect(0, top, self.width() - 6, line_height)
+            painter.drawText(rect, Qt.AlignRight, str(number))
 
 class NumberedTextEdit(QPlainTextEdit):
     def __init__(self, parent=None):
@@ -63,6 +54,109 @@ class NumberedTextEdit(QPlainTextEdit):
         self.cursorPositionChanged.connect(self.highlightCurrentLine)
 
         self.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self._line_height = None  # Высота строки, пересчитывается при смене шрифта
+        self._search_selections = []  # Подсветка вхождений после "Find All"
+
+    def lineHeight(self):
+        if self._line_height is None:
+            block = self.document().firstBlock()
+            self._line_height = max(1, int(self.blockBoundingRect(block).height())) if block.isValid() else self.fontMetrics().height()
+        return self._line_height
+
+    def visibleLineNumbers(self, rect):
+        # Без переноса строк все строки одной высоты: положение первой видимой строки берем у документа,
+        # остальные получаем сдвигом на высоту строки, не обходя блоки документа
+        block = self.firstVisibleBlock()
+        if not block.isValid():
+            return []
+
+        top = self.blockBoundingGeometry(block).translated(self.contentOffset()).top()
+        number = block.blockNumber()
+        numbers = []
+
+        if self.lineWrapMode() != QPlainTextEdit.NoWrap:
+            # С переносом высота строк разная, идем по блокам
+            while block.isValid() and top <= rect.bottom():
+                bottom = top + self.blockBoundingRect(block).height()
+                if block.isVisible() and bottom >= rect.top():
+                    numbers.append((block.blockNumber() + 1, int(top)))
+                block = block.next()
+                top = bottom
+            return numbers
+
+        line_height = self.lineHeight()
+        block_count = self.blockCount()
+        while number < block_count and top <= rect.bottom():
+            if top + line_height >= rect.top():
+                numbers.append((number + 1, int(top)))
+            top += line_height
+            number += 1
+        return numbers
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.FontChange:
+            self._line_height = None
+        super(NumberedTextEdit, self).changeEvent(event)
+
+    def lines(self):
+        return self.toPlainText().split('\n')
+
+    def setLines(self, lines):
+        # В отличие от setPlainText меняет только участок между общими началом и концом,
+        # поэтому сохраняются история отмены, прокрутка и раскладка остальных строк
+        old_lines = self.lines()
+        new_lines = list(lines) or ['']
+        if old_lines == new_lines:
+            return
+
+        limit = min(len(old_lines), len(new_lines))
+        prefix = 0
+        while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+            suffix += 1
+
+        self.replaceLines(prefix, len(old_lines) - suffix, new_lines[prefix:len(new_lines) - suffix])
+
+    def replaceLine(self, row, text):
+        self.replaceLines(row, row + 1, [text])
+
+    def replaceLines(self, first, last, lines):
+        # Заменяет строки first..last-1 на lines одной правкой (один шаг отмены).
+        # first == last - вставка перед строкой first, пустой lines - удаление строк
+        document = self.document()
+        block_count = document.blockCount()
+        cursor = QTextCursor(document)
+        cursor.beginEditBlock()
+
+        if first < last:
+            end_block = document.findBlockByNumber(last - 1)
+            end = end_block.position() + end_block.length() - 1
+            start = document.findBlockByNumber(first).position()
+            if lines:
+                cursor.setPosition(start)
+                cursor.setPosition(end, QTextCursor.KeepAnchor)
+                cursor.insertText('\n'.join(lines))
+            elif last < block_count:
+                # Удаляем строки вместе с переводом строки после них
+                cursor.setPosition(start)
+                cursor.setPosition(document.findBlockByNumber(last).position(), QTextCursor.KeepAnchor)
+                cursor.removeSelectedText()
+            else:
+                # Удаляются последние строки: убираем перевод строки перед ними
+                cursor.setPosition(max(0, start - 1))
+                cursor.setPosition(end, QTextCursor.KeepAnchor)
+                cursor.removeSelectedText()
+        elif lines:
+            if first < block_count:
+                cursor.setPosition(document.findBlockByNumber(first).position())
+                cursor.insertText('\n'.join(lines) + '\n')
+            else:
+                cursor.movePosition(QTextCursor.End)
+                cursor.insertText('\n' + '\n'.join(lines))
+
+        cursor.endEditBlock()
 
     def lineNumberAreaWidth(self):
         digits = len(str(self.blockCount()))
@@ -81,8 +175,24 @@ class NumberedTextEdit(QPlainTextEdit):
         if rect.contains(self.viewport().rect()):
             self.updateLineNumberAreaWidth()
 
+    def setSearchHighlights(self, ranges):
+        # Подсветка найденных вхождений: список пар (начало, конец) в позициях документа.
+        # Старые курсоры отвязываются от документа сразу, не дожидаясь сборщика мусора:
+        # каждый живой курсор документа пересчитывается при любой правке
+        for selection in self._search_selections:
+            selection.cursor = QTextCursor()
+        self._search_selections = []
+        for start, end in ranges:
+            selection = QTextEdit.ExtraSelection()
+            selection.format.setBackground(QColor(Qt.cyan).lighter(160))
+            selection.cursor = QTextCursor(self.document())
+            selection.cursor.setPosition(start)
+            selection.cursor.setPosition(end, QTextCursor.KeepAnchor)
+            self._search_selections.append(selection)
+        self.highlightCurrentLine()
+
     def highlightCurrentLine(self):
-        extraSelections = []
+        extraSelections = list(self._search_selections)
         if not self.isReadOnly():
             selection = QTextEdit.ExtraSelection()
             lineColor = QColor(Qt.yellow).lighter(160)